@@ -0,0 +1,51 @@
+from typing import Any, Dict, List
+import argparse
+
+from benchmarks import core, index, scaling, startup, tasks
+from benchmarks.utils import write_results
+
+SUITES = {
+    "core": core.run,
+    "tasks": tasks.run,
+    "startup": startup.run,
+    "scaling": scaling.run,
+    "index": index.run,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure overhead of core components and throughput of tasks.",
+    )
+    parser.add_argument(
+        "--suite", 
+        choices=list(SUITES), 
+        nargs="+", 
+        default=list(SUITES),
+        help="Suites to run. By default all suites are executed.",
+    )
+    parser.add_argument(
+        "--repeat", 
+        type=int, 
+        default=None, 
+        help="Number of measured calls per benchmark.",
+    )
+    parser.add_argument(
+        "--output", 
+        default=None, 
+        help="Path of JSON report. By default report is written to stdout.",
+    )
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for suite in args.suite:
+        if args.repeat:
+            results.extend(SUITES[suite](args.repeat))
+        else:
+            results.extend(SUITES[suite]())
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
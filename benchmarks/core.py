@@ -0,0 +1,205 @@
+from typing import Any, Callable, Dict, List, Optional, Type
+import tempfile
+
+from utca.core import (
+    IOModel,
+    Evaluator,
+    Executable,
+    ExecutionSchema,
+    ExecuteFunction,
+    SetValue,
+    Branch,
+    Switch,
+    Condition,
+    ForEach,
+    SetMemory,
+    GetMemory,
+    DeleteMemory,
+    MemoryManager,
+    MemoryBackend,
+    DirectoryBackend,
+    MemorySerializer,
+    SQLiteBackend,
+)
+from benchmarks.utils import measure
+
+STEPS = 50
+"""
+Number of steps in measured schemas. Results are reported per step
+"""
+
+class Counter(IOModel):
+    f: int
+
+
+class Increment(Executable[Counter, Counter]):
+    def __init__(
+        self, 
+        input_class: Type[Counter]=Counter,
+        output_class: Type[Counter]=Counter,
+    ) -> None:
+        super().__init__(input_class, output_class)
+
+
+    def invoke(self, input_data: Counter, evaluator: Evaluator) -> Dict[str, Any]:
+        return {"f": input_data.f + 1}
+
+
+def schema_of(components: List[Any]) -> ExecutionSchema:
+    schema = ExecutionSchema()
+    for component in components:
+        schema.add(component)
+    return schema
+
+
+def per_step(
+    name: str, 
+    schema: Any, 
+    input_data: Callable[[], Dict[str, Any]],
+    repeat: int,
+    steps: int=STEPS,
+    memory_manager: Optional[MemoryManager]=None,
+) -> Dict[str, Any]:
+    evaluator = Evaluator(schema, memory_manager=memory_manager)
+    result = measure(
+        name, lambda: evaluator.run(input_data()), repeat=repeat, items=steps
+    )
+    result["per_step_us"] = result["mean_ms"] * 1000 / steps
+    return result
+
+
+def run(repeat: int=100) -> List[Dict[str, Any]]:
+    """
+    Measure overhead of core components
+
+    Args:
+        repeat (int, optional): Number of measured calls. Defaults to 100.
+
+    Returns:
+        List[Dict[str, Any]]: Benchmark results.
+    """
+    results: List[Dict[str, Any]] = []
+
+    actions = schema_of([
+        ExecuteFunction(lambda x: {"f": x["f"] + 1}) for _ in range(STEPS)
+    ])
+    results.append(per_step("core.action", actions, lambda: {"f": 0}, repeat))
+    results.append(per_step(
+        "core.action.compiled", actions.compile(), lambda: {"f": 0}, repeat
+    ))
+
+    executables = schema_of([Increment() for _ in range(STEPS)])
+    results.append(per_step(
+        "core.executable", executables, lambda: {"f": 0}, repeat
+    ))
+    results.append(per_step(
+        "core.executable.compiled", executables.compile(), lambda: {"f": 0}, repeat
+    ))
+
+    executors = schema_of([
+        Increment().use(get_key="a", set_key="a") for _ in range(STEPS)
+    ])
+    results.append(per_step(
+        "core.executable_executor", executors, lambda: {"a": {"f": 0}}, repeat
+    ))
+
+    nested = ExecutionSchema()
+    for _ in range(STEPS):
+        nested = ExecutionSchema(nested)
+    results.append(per_step(
+        "core.execution_schema.nested", nested, lambda: {"f": 0}, repeat
+    ))
+
+    results.append(per_step(
+        "core.for_each", 
+        ForEach(Increment(), get_key="items"), 
+        lambda: {"items": [{"f": i} for i in range(STEPS)]},
+        repeat,
+    ))
+
+    switch = Switch(
+        *(
+            Branch(
+                Increment(), 
+                condition=lambda x, e, i=i: x["f"] == i, # type: ignore
+            )
+            for i in range(STEPS)
+        ),
+        Branch(Increment()),
+    )
+    results.append(per_step(
+        "core.switch.last_branch", switch, lambda: {"f": STEPS}, repeat
+    ))
+
+    wide_switch = Switch(
+        *(
+            Branch(
+                Increment(), 
+                condition=Condition(
+                    lambda x, e, i=i: x["f"] == i, # type: ignore
+                    ExecutionSchema(),
+                ),
+            )
+            for i in range(STEPS)
+        ),
+        Branch(Increment()),
+    )
+    results.append(per_step(
+        "core.condition.wide_state", 
+        wide_switch, 
+        lambda: {"f": STEPS, **{f"k{i}": i for i in range(1000)}}, 
+        repeat,
+    ))
+
+    memory = schema_of([
+        c 
+        for i in range(STEPS // 2) 
+        for c in (SetMemory(f"k{i}", "f"), GetMemory([(f"k{i}", "f")]))
+    ])
+    results.append(per_step("core.memory.set_get", memory, lambda: {"f": 0}, repeat))
+    results.append(per_step(
+        "core.memory.set_get_bounded", 
+        memory, 
+        lambda: {"f": 0}, 
+        repeat,
+        memory_manager=MemoryManager(max_entries=STEPS // 4, max_bytes=1 << 20),
+    ))
+    results.append(per_step(
+        "core.memory.set_delete",
+        schema_of([
+            c 
+            for i in range(STEPS // 2) 
+            for c in (SetMemory(f"k{i}", "f"), DeleteMemory([f"k{i}"]))
+        ]),
+        lambda: {"f": 0},
+        repeat,
+    ))
+
+    messages = [{"role": "user", "content": "Hello " * 50} for _ in range(20)]
+    with tempfile.TemporaryDirectory() as directory:
+        backends: Dict[str, MemoryBackend] = {
+            "json": DirectoryBackend(f"{directory}/json"),
+            "pickle": DirectoryBackend(f"{directory}/pickle", MemorySerializer.PICKLE),
+            "sqlite": SQLiteBackend(f"{directory}/memory.db"),
+        }
+        for backend_name, backend in backends.items():
+            for write_behind in (False, True):
+                memory_manager = MemoryManager(backend=backend, write_behind=write_behind)
+                results.append(per_step(
+                    f"core.memory.backend.{backend_name}"
+                    + (".write_behind" if write_behind else ""),
+                    memory,
+                    lambda: {"f": messages},
+                    max(repeat // 10, 1),
+                    memory_manager=memory_manager,
+                ))
+                memory_manager.close()
+            backend.close()
+
+    results.append(per_step(
+        "core.set_value", 
+        schema_of([SetValue(f"v{i}", i) for i in range(STEPS)]),
+        lambda: {},
+        repeat,
+    ))
+    return results
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List
+import time
+
+import numpy as np
+
+from utca.implementation.datasources.index import (
+    IndexConfig, IndexType, create_index
+)
+from benchmarks.utils import measure
+
+VECTORS = 1_000_000
+DIMENSIONS = 64
+QUERIES = 100
+K = 10
+
+CONFIGS = {
+    "flat": IndexConfig(),
+    "numpy": IndexConfig(use_faiss=False),
+    "ivf_flat": IndexConfig(index_type=IndexType.IVF_FLAT, nlist=1024, nprobe=16),
+    "ivf_pq": IndexConfig(index_type=IndexType.IVF_PQ, nlist=1024, nprobe=16, pq_m=16),
+    "hnsw": IndexConfig(index_type=IndexType.HNSW, hnsw_m=32, ef_search=64),
+}
+
+def synthetic_vectors(count: int, seed: int=0) -> Any:
+    """
+    Clustered vectors, similar to embeddings of texts on different topics
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((1000, DIMENSIONS)).astype(np.float32)
+    return (
+        centers[rng.integers(0, len(centers), count)]
+        + 0.5 * rng.standard_normal((count, DIMENSIONS)).astype(np.float32)
+    )
+
+
+def run(repeat: int=20) -> List[Dict[str, Any]]:
+    """
+    Measure build time, search latency and recall@10 of vector index types
+    on synthetic vectors
+
+    Args:
+        repeat (int, optional): Number of measured searches. Defaults to 20.
+
+    Returns:
+        List[Dict[str, Any]]: Benchmark results.
+    """
+    vectors = synthetic_vectors(VECTORS)
+    queries = synthetic_vectors(QUERIES, seed=1)
+    expected: Any = None
+    results: List[Dict[str, Any]] = []
+    for name, config in CONFIGS.items():
+        start = time.perf_counter()
+        index = create_index(DIMENSIONS, config)
+        index.add(vectors)
+        index.search(queries[:1], K)
+        build_s = time.perf_counter() - start
+
+        result = measure(
+            f"index.{name}", 
+            lambda: index.search(queries, K),
+            repeat=repeat,
+            warmup=1,
+            items=QUERIES,
+        )
+        _, indexes = index.search(queries, K)
+        if expected is None:
+            expected = indexes
+        result["build_s"] = build_s
+        result[f"recall@{K}"] = float(np.mean([
+            len(set(i) & set(e)) / K for i, e in zip(indexes, expected)
+        ]))
+        results.append(result)
+        del index
+    return results
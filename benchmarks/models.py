@@ -0,0 +1,127 @@
+from typing import Any, List
+import os
+import random
+
+VOCABULARY = [f"w{i}" for i in range(200)] + [".", ",", ":"]
+"""
+Words of generated texts. All words are known to tiny tokenizer
+"""
+
+HIDDEN_SIZE = 32
+
+
+def random_text(sentences: int=10, words: int=12, seed: int=0) -> str:
+    """
+    Generate text of random words
+
+    Args:
+        sentences (int, optional): Number of sentences. Defaults to 10.
+
+        words (int, optional): Number of words in sentence. Defaults to 12.
+
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        str: Generated text.
+    """
+    rng = random.Random(seed)
+    return " ".join(
+        " ".join(rng.choice(VOCABULARY[:200]) for _ in range(words)) + "."
+        for _ in range(sentences)
+    )
+
+
+def random_texts(count: int, sentences: int=2, seed: int=0) -> List[str]:
+    return [random_text(sentences, seed=seed + i) for i in range(count)]
+
+
+def tiny_tokenizer() -> Any:
+    """
+    Word level fast tokenizer built without downloads
+    """
+    from tokenizers import Tokenizer, models, pre_tokenizers # type: ignore
+    from transformers import PreTrainedTokenizerFast # type: ignore
+
+    special = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    tokenizer = Tokenizer(models.WordLevel(
+        {w: i for i, w in enumerate(special + VOCABULARY)}, unk_token="[UNK]"
+    ))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace() # type: ignore
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        model_max_length=512,
+        pad_token="[PAD]",
+        unk_token="[UNK]",
+        cls_token="[CLS]",
+        sep_token="[SEP]",
+        mask_token="[MASK]",
+    )
+
+
+def tiny_bert_config(vocab_size: int, **kwargs: Any) -> Any:
+    """
+    Configuration of small BERT model. Random seed is fixed, so that models
+    created after it produce the same outputs between runs.
+    """
+    import torch
+    from transformers import BertConfig # type: ignore
+    torch.manual_seed(0) # type: ignore
+    return BertConfig(
+        vocab_size=vocab_size,
+        hidden_size=HIDDEN_SIZE,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=512,
+        **kwargs,
+    )
+
+
+def tiny_token_classification_model(tokenizer: Any) -> Any:
+    """
+    Randomly initialized token classification model with UTC labels
+    """
+    from transformers import BertForTokenClassification # type: ignore
+    return BertForTokenClassification(tiny_bert_config(
+        len(tokenizer),
+        id2label={0: "O", 1: "B-ENT", 2: "I-ENT"},
+        label2id={"O": 0, "B-ENT": 1, "I-ENT": 2},
+    )).eval()
+
+
+def tiny_embedding_model(tokenizer: Any) -> Any:
+    """
+    Randomly initialized encoder
+    """
+    from transformers import BertModel # type: ignore
+    return BertModel(tiny_bert_config(len(tokenizer))).eval()
+
+
+def tiny_gliner(directory: str) -> str:
+    """
+    Save randomly initialized GLiNER model
+
+    Args:
+        directory (str): Destination directory.
+
+    Returns:
+        str: Path to saved model.
+    """
+    import gliner.model as gliner_model # type: ignore
+    from gliner import GLiNERConfig # type: ignore
+
+    tokenizer = tiny_tokenizer()
+    config = GLiNERConfig(
+        model_name="tiny",
+        encoder_config=tiny_bert_config(len(tokenizer)),
+        hidden_size=HIDDEN_SIZE,
+        max_width=4,
+        span_mode="markerV0",
+    )
+    model = gliner_model.UniEncoderSpanGLiNER(config, tokenizer=tokenizer)
+    gliner_model.BaseGLiNER._resize_token_embeddings( # type: ignore
+        model, config, tokenizer
+    )
+    path = os.path.join(directory, "gliner")
+    model.save_pretrained(path)
+    return path
@@ -0,0 +1,51 @@
+from typing import Any, Dict, List
+
+from utca.core import (
+    Branch,
+    Condition,
+    Switch,
+    ExecutionSchema,
+    ForEach,
+    Evaluator,
+)
+from benchmarks.core import Increment
+from benchmarks.utils import measure
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+"""
+Numbers of items. Per-item overhead should not depend on number of items
+"""
+
+def run(repeat: int=1) -> List[Dict[str, Any]]:
+    """
+    Measure per-item overhead of ForEach and Condition, that create child
+    evaluator for each item, over growing number of items
+
+    Args:
+        repeat (int, optional): Number of measured calls for each size. Defaults to 1.
+
+    Returns:
+        List[Dict[str, Any]]: Benchmark results.
+    """
+    results: List[Dict[str, Any]] = []
+    for_each = Evaluator(ForEach(Increment(), get_key="items"))
+    condition = Evaluator(ForEach(
+        Switch(Branch(
+            Increment(),
+            condition=Condition(lambda x, e: x["f"] >= 0, ExecutionSchema()), # type: ignore
+        )),
+        get_key="items",
+    ))
+    for name, evaluator in (("for_each", for_each), ("condition", condition)):
+        for size in SIZES:
+            items = [{"f": i} for i in range(size)]
+            result = measure(
+                f"scaling.{name}.{size}", 
+                lambda: evaluator.run({"items": items}),
+                repeat=repeat,
+                warmup=0,
+                items=size,
+            )
+            result["per_item_us"] = result["mean_ms"] * 1000 / size
+            results.append(result)
+    return results
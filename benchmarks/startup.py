@@ -0,0 +1,55 @@
+from typing import Any, Callable, Dict, List
+import os
+import subprocess
+import sys
+
+from benchmarks.utils import safe_measure
+
+STATEMENTS = {
+    "startup.python": "pass",
+    "startup.core": "import utca.core",
+    "startup.predictors": "import utca.implementation.predictors",
+    "startup.schemas": "import utca.implementation.schemas",
+    "startup.tasks": "import utca.implementation.tasks",
+    "startup.tasks.token_searcher_ner": "from utca.implementation.tasks import TokenSearcherNER",
+}
+"""
+Statements executed in new interpreter. startup.python is interpreter startup
+without utca, that should be subtracted for comparison
+"""
+
+
+def interpreter(statement: str) -> Callable[[], Any]:
+    """
+    Create function that executes statement in new interpreter. Statement is 
+    executed once during setup, so that failing imports are reported as skipped.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    command = [sys.executable, "-c", statement]
+
+    def run() -> None:
+        subprocess.run(
+            command, env=env, check=True, capture_output=True
+        )
+
+    run()
+    return run
+
+
+def run(repeat: int=5) -> List[Dict[str, Any]]:
+    """
+    Measure import time of utca packages in new interpreter (cold start of CLI
+    and serverless functions).
+
+    Args:
+        repeat (int, optional): Number of measured interpreter starts. Defaults to 5.
+
+    Returns:
+        List[Dict[str, Any]]: Benchmark results.
+    """
+    return [
+        safe_measure(
+            name, lambda: interpreter(statement), repeat=repeat, warmup=0
+        )
+        for name, statement in STATEMENTS.items()
+    ]
@@ -0,0 +1,188 @@
+from typing import Any, Callable, Dict, List, Optional
+import os
+import tempfile
+
+from benchmarks.models import (
+    random_text,
+    random_texts,
+    tiny_tokenizer,
+    tiny_token_classification_model,
+    tiny_embedding_model,
+    tiny_gliner,
+)
+from benchmarks.utils import safe_measure
+
+LABELS = ["person", "organization", "location"]
+
+
+def chunker() -> Any:
+    """
+    Chunker, that doesn't require NLTK data, so that benchmarks run offline
+    """
+    from utca.implementation.tasks.text_processing.utils import (
+        Chunker, RegexSentenceSplitter
+    )
+    return Chunker(sentence_splitter=RegexSentenceSplitter())
+
+
+def token_searcher_ner(
+    shared_prefix: bool=False, 
+    onnx_path: Optional[str]=None,
+    quantize: bool=False,
+) -> Callable[[], Any]:
+    from utca.implementation.predictors.token_searcher.predictor import (
+        TokenSearcherPredictor
+    )
+    from utca.implementation.predictors.token_searcher.schema import (
+        TokenSearcherPredictorConfig,
+        TokenSearcherONNXPredictorConfig,
+    )
+    from utca.implementation.tasks.text_processing.ner.token_searcher.token_searcher import (
+        TokenSearcherNER
+    )
+    from utca.implementation.tasks.text_processing.ner.token_searcher.actions import (
+        TokenSearcherNERPreprocessor
+    )
+
+    tokenizer = tiny_tokenizer()
+    model = tiny_token_classification_model(tokenizer)
+    task = TokenSearcherNER(
+        predictor=TokenSearcherPredictor(
+            TokenSearcherONNXPredictorConfig(
+                model=model,
+                tokenizer=tokenizer,
+                onnx_path=onnx_path,
+                quantize=quantize,
+            ) if onnx_path else TokenSearcherPredictorConfig(
+                model=model,
+                tokenizer=tokenizer,
+            )
+        ),
+        preprocess=TokenSearcherNERPreprocessor(
+            shared_prefix=shared_prefix, chunker=chunker()
+        ),
+    )
+    text = random_text(sentences=20)
+    return lambda: task.run({"text": text, "labels": LABELS})
+
+
+def gliner_ner(directory: str) -> Callable[[], Any]:
+    from utca.implementation.predictors.gliner_predictor.predictor import (
+        GLiNERPredictor
+    )
+    from utca.implementation.predictors.gliner_predictor.schema import (
+        GLiNERPredictorConfig
+    )
+    from utca.implementation.tasks.text_processing.ner.gliner_task.zero_shot_ner import (
+        GLiNER
+    )
+    from utca.implementation.tasks.text_processing.ner.gliner_task.actions import (
+        GLiNERPreprocessor
+    )
+
+    task = GLiNER(
+        predictor=GLiNERPredictor(GLiNERPredictorConfig(
+            model_name=tiny_gliner(directory),
+            local_files_only=True,
+            load_tokenizer=True,
+        )),
+        preprocess=GLiNERPreprocessor(chunker=chunker()),
+    )
+    text = random_text(sentences=20)
+    return lambda: task.run({"text": text, "labels": LABELS})
+
+
+def embedding_task() -> Any:
+    from utca.implementation.predictors.transformers_predictor.transformers_model import (
+        TransformersModel,
+        TransformersModelConfig,
+    )
+    from utca.implementation.predictors.transformers_predictor.schema import (
+        TransformersEmbeddingInput,
+        TransformersEmbeddingOutput,
+    )
+    from utca.implementation.tasks.text_processing.embedding.transformers_task.transformers_embedding import (
+        TransformersTextEmbedding
+    )
+    from utca.implementation.tasks.text_processing.embedding.transformers_task.actions import (
+        EmbeddingPreprocessor
+    )
+
+    tokenizer = tiny_tokenizer()
+    return TransformersTextEmbedding(
+        predictor=TransformersModel(
+            TransformersModelConfig(model=tiny_embedding_model(tokenizer)),
+            input_class=TransformersEmbeddingInput,
+            output_class=TransformersEmbeddingOutput,
+        ),
+        preprocess=EmbeddingPreprocessor(tokenizer=tokenizer),
+    )
+
+
+def text_embedding(batch: int) -> Callable[[], Any]:
+    task = embedding_task()
+    texts = random_texts(batch)
+    return lambda: task.run({"texts": texts})
+
+
+def semantic_search(dataset_size: int) -> Callable[[], Any]:
+    from utca.implementation.schemas.semantic_search.semantic_search_schema import (
+        SemanticSearchSchema
+    )
+
+    schema = SemanticSearchSchema(
+        dataset=random_texts(dataset_size), encoder=embedding_task()
+    )
+    query = random_texts(1, seed=dataset_size)
+    return lambda: schema.run({"query": query, "results_count": 5})
+
+
+def run(repeat: int=20) -> List[Dict[str, Any]]:
+    """
+    Measure end-to-end throughput of tasks with tiny randomly initialized models.
+    Benchmarks with missing optional dependencies are reported as skipped.
+
+    Args:
+        repeat (int, optional): Number of measured calls. Defaults to 20.
+
+    Returns:
+        List[Dict[str, Any]]: Benchmark results.
+    """
+    results: List[Dict[str, Any]] = []
+    results.append(safe_measure(
+        "tasks.token_searcher_ner", token_searcher_ner, repeat=repeat, warmup=2
+    ))
+    results.append(safe_measure(
+        "tasks.token_searcher_ner.shared_prefix", 
+        lambda: token_searcher_ner(shared_prefix=True), 
+        repeat=repeat, 
+        warmup=2,
+    ))
+    with tempfile.TemporaryDirectory() as directory:
+        for quantize in (False, True):
+            results.append(safe_measure(
+                "tasks.token_searcher_ner.onnx" + (".int8" if quantize else ""), 
+                lambda: token_searcher_ner(
+                    onnx_path=os.path.join(directory, "model.onnx"), quantize=quantize
+                ), 
+                repeat=repeat, 
+                warmup=2,
+            ))
+        results.append(safe_measure(
+            "tasks.gliner_ner", lambda: gliner_ner(directory), repeat=repeat, warmup=2
+        ))
+    for batch in (1, 32):
+        results.append(safe_measure(
+            f"tasks.text_embedding.batch_{batch}", 
+            lambda: text_embedding(batch),
+            repeat=repeat,
+            warmup=2,
+            items=batch,
+        ))
+    results.append(safe_measure(
+        "tasks.semantic_search", 
+        lambda: semantic_search(1000), 
+        repeat=repeat, 
+        warmup=2,
+    ))
+    return results
@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, List, Optional
+import json
+import platform
+import sys
+import time
+
+from utca.core.executable_level_1.instrumentation import percentile
+
+def measure(
+    name: str,
+    function: Callable[[], Any],
+    repeat: int=100,
+    warmup: int=5,
+    items: int=1,
+) -> Dict[str, Any]:
+    """
+    Measure execution time of function
+
+    Args:
+        name (str): Benchmark name.
+
+        function (Callable[[], Any]): Function to measure.
+
+        repeat (int, optional): Number of measured calls. Defaults to 100.
+
+        warmup (int, optional): Number of calls before measurement. Defaults to 5.
+
+        items (int, optional): Number of items processed by one call. Used for
+            throughput calculation. Defaults to 1.
+
+    Returns:
+        Dict[str, Any]: Benchmark result. Times are in milliseconds.
+    """
+    for _ in range(warmup):
+        function()
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    mean = sum(timings) / len(timings)
+    return {
+        "name": name,
+        "repeat": repeat,
+        "items": items,
+        "mean_ms": mean,
+        "min_ms": timings[0],
+        "p50_ms": percentile(timings, 50),
+        "p95_ms": percentile(timings, 95),
+        "items_per_s": items * 1000 / mean if mean else None,
+    }
+
+
+def safe_measure(
+    name: str,
+    setup: Callable[[], Callable[[], Any]],
+    repeat: int=100,
+    warmup: int=5,
+    items: int=1,
+) -> Dict[str, Any]:
+    """
+    Measure function created by setup. If setup or measured function fails (e.g. optional
+    dependency is not installed or model data can't be downloaded), benchmark is reported
+    as skipped.
+
+    Args:
+        name (str): Benchmark name.
+
+        setup (Callable[[], Callable[[], Any]]): Creates function to measure.
+
+        repeat (int, optional): Number of measured calls. Defaults to 100.
+
+        warmup (int, optional): Number of calls before measurement. Defaults to 5.
+
+        items (int, optional): Number of items processed by one call. Defaults to 1.
+
+    Returns:
+        Dict[str, Any]: Benchmark result.
+    """
+    try:
+        return measure(name, setup(), repeat, warmup, items)
+    except Exception as e:
+        return {"name": name, "skipped": f"{type(e).__name__}: {e}"}
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Description of environment for comparison of results
+    """
+    info: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    for package in ("utca", "torch", "transformers", "pydantic", "gliner"):
+        try:
+            from importlib.metadata import version
+            info[package] = version(package)
+        except Exception:
+            info[package] = None
+    return info
+
+
+def write_results(
+    results: List[Dict[str, Any]], path: Optional[str]=None
+) -> Dict[str, Any]:
+    """
+    Write results in JSON format
+
+    Args:
+        results (List[Dict[str, Any]]): Benchmark results.
+
+        path (Optional[str], optional): Destination file. If equals to None, results
+            are written to stdout. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: Written report.
+    """
+    report = {
+        "environment": environment(),
+        "results": results,
+    }
+    if path is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
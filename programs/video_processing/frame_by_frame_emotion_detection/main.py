@@ -105,7 +105,7 @@ if __name__ == "__main__":
         | ExecuteFunction(
             prepare_batch_image_classification_input
         ).use(set_key="frames")
-        | task.use(get_key="frames", set_key="classifications")
+        | task.use(get_key="frames", set_key="classifications", batch_size=16)
         | ExecuteFunction(group_labels).use(
             get_key="classifications",
             set_key="labels"
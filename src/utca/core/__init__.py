@@ -8,11 +8,21 @@ from utca.core.executable_level_1.eval import (
     ConditionProtocol,
     Filter,
     ForEach,
+    ForEachMode,
+    ItemErrorPolicy,
     Switch,
     While,
     Log,
     BREAK,
 )
+from utca.core.executable_level_1.compiler import (
+    CompiledSchema,
+)
+from utca.core.executable_level_1.instrumentation import (
+    Instrument,
+    StageEvent,
+    Profiler,
+)
 from utca.core.executable_level_1.memory import (
     SetMemory, 
     MemorySetInstruction,
@@ -21,6 +31,13 @@ from utca.core.executable_level_1.memory import (
     DeleteMemory,
     MemoryManager
 )
+from utca.core.executable_level_1.memory_backends import (
+    MemoryBackend,
+    DictBackend,
+    DirectoryBackend,
+    MemorySerializer,
+    SQLiteBackend,
+)
 from utca.core.executable_level_1.actions import (
     Action,
     Flush,
@@ -37,7 +54,9 @@ from utca.core.executable_level_1.schema import (
     Output, 
     Config, 
     ReplacingScope,
+    ValidationMode,
     Transformable,
+    TransformableFork,
     IOModel,
 )
 from utca.core.executable_level_1.executor import (
@@ -50,9 +69,24 @@ from utca.core.executable_level_1.executable import (
     ValidationClass,
     Executable,
 )
+from utca.core.executable_level_1.cache import (
+    CacheStore,
+    MemoryCacheStore,
+    SQLiteCacheStore,
+    Cached,
+)
 from utca.core.predictor_level_2.predictor import (
     Predictor
 )
+from utca.core.predictor_level_2.batching import (
+    BatchPredictor
+)
+from utca.core.predictor_level_2.registry import (
+    LazyPredictor,
+    PredictorRegistry,
+    default_registry,
+    model_size,
+)
 from utca.core.task_level_3.task import (
     Task, NERTask
 )
@@ -72,10 +106,17 @@ __all__ = [
     "ConditionProtocol",
     "Filter",
     "ForEach", 
+    "ForEachMode",
+    "ItemErrorPolicy",
     "Switch",
     "While",
     "Log",
     "BREAK",
+    "CompiledSchema",
+
+    "Instrument",
+    "StageEvent",
+    "Profiler",
 
     "SetMemory", 
     "MemorySetInstruction",
@@ -83,6 +124,11 @@ __all__ = [
     "MemoryGetInstruction",
     "DeleteMemory",
     "MemoryManager",
+    "MemoryBackend",
+    "DictBackend",
+    "DirectoryBackend",
+    "MemorySerializer",
+    "SQLiteBackend",
     
     "Action",
     "Flush",
@@ -98,7 +144,9 @@ __all__ = [
     "Output", 
     "Config",
     "ReplacingScope",
+    "ValidationMode",
     "Transformable",
+    "TransformableFork",
     "IOModel",
 
     "ExecutorComponent",
@@ -109,7 +157,17 @@ __all__ = [
     "ValidationClass",
     "Executable",
 
+    "CacheStore",
+    "MemoryCacheStore",
+    "SQLiteCacheStore",
+    "Cached",
+
     "Predictor",
+    "BatchPredictor",
+    "LazyPredictor",
+    "PredictorRegistry",
+    "default_registry",
+    "model_size",
 
     "Task",
     "NERTask",
@@ -5,7 +5,6 @@ from typing import (
     TYPE_CHECKING, cast
 )
 import logging
-import copy
 
 from utca.core.exceptions import InvalidQuery, InputDataKeyError, IvalidInputData
 from utca.core.executable_level_1.schema import Transformable, ReplacingScope
@@ -78,13 +77,29 @@ class Action(Generic[ActionInput, ActionOutput], Component):
         if not evaluator:
             evaluator = self.set_up_default_evaluator()
 
-        data = input_data.__dict__
+        input_data = self.apply(input_data)
+        evaluator.log(logging.DEBUG, f"Action: {self.name}: Executed")
+        return input_data
+
+
+    def apply(self, input_data: Transformable) -> Transformable:
+        """
+        Execute action and apply result according to replacing strategy
+
+        Args:
+            input_data (Transformable): Data that is used in action.
+
+        Raises:
+            ActionError: Raised if action was executed unsuccessfully
+
+        Returns:
+            Transformable: Result of executed action.
+        """
+        data = dict(input_data.view())
         try:
-            result = self.execute(copy.copy(cast(ActionInput, data)))
+            result = self.execute(cast(ActionInput, data))
         except Exception as e:
             raise ActionError(self.name, e)
-        
-        evaluator.log(logging.DEBUG, f"Action: {self.name}: Executed")
 
         if result is None:
             return input_data
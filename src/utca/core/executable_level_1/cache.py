@@ -0,0 +1,411 @@
+from __future__ import annotations
+from typing import (
+    Any, Dict, List, Optional, Tuple
+)
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+
+from utca.core.executable_level_1.interpreter import Evaluator
+from utca.core.executable_level_1.executable import Executable
+from utca.core.executable_level_1.schema import Input, Output, IOModel
+from utca.core.executable_level_1.utils import copy_containers
+
+MISSING = object()
+"""
+Returned by cache stores if key not found
+"""
+
+class CacheStore(ABC):
+    """
+    Base class for cache stores
+    """
+    evictions: int = 0
+    """
+    Number of entries removed because of size limit or expiration
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """
+        Get stored value
+
+        Args:
+            key (str): Key.
+
+        Returns:
+            Any: Stored value or MISSING.
+        """
+        ...
+
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store value
+
+        Args:
+            key (str): Key.
+
+            value (Any): Value to store.
+        """
+        ...
+
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries
+        """
+        ...
+
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+
+class MemoryCacheStore(CacheStore):
+    """
+    In-memory store with LRU eviction and optional expiration.
+    Containers of values (dicts, lists, tuples and sets) are copied on set and get,
+    so cached results can't be modified by callers. Other objects (e.g. tensors) 
+    are stored as is and shouldn't be modified in place.
+    """
+    def __init__(
+        self,
+        max_size: Optional[int]=1024,
+        ttl: Optional[float]=None,
+    ) -> None:
+        """
+        Args:
+            max_size (Optional[int], optional): Maximum number of entries. Least recently
+                used entries are evicted. If equals to None, size is not limited.
+                Defaults to 1024.
+
+            ttl (Optional[float], optional): Time to live of entries in seconds. If equals
+                to None, entries don't expire. Defaults to None.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            created, value = entry
+            if self.ttl is not None and time.monotonic() - created > self.ttl:
+                del self._entries[key]
+                self.evictions += 1
+                return MISSING
+            self._entries.move_to_end(key)
+        return copy_containers(value)
+
+
+    def set(self, key: str, value: Any) -> None:
+        value = copy_containers(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    On-disk store based on SQLite. Values are pickled. Least recently used
+    entries are evicted if size limit is reached.
+    """
+    def __init__(
+        self,
+        path: str,
+        max_size: Optional[int]=None,
+        ttl: Optional[float]=None,
+        table: str="utca_cache",
+    ) -> None:
+        """
+        Args:
+            path (str): Path to database file. ":memory:" can be used for temporary store.
+
+            max_size (Optional[int], optional): Maximum number of entries. If equals to None,
+                size is not limited. Defaults to None.
+
+            ttl (Optional[float], optional): Time to live of entries in seconds. If equals
+                to None, entries don't expire. Defaults to None.
+
+            table (str, optional): Table name. Defaults to "utca_cache".
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.table = table
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value BLOB, created REAL, accessed REAL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed)"
+            )
+
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                f"SELECT value, created FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return MISSING
+            if self.ttl is not None and now - row[1] > self.ttl:
+                self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE key = ?", (key,)
+                )
+                self.evictions += 1
+                return MISSING
+            self._connection.execute(
+                f"UPDATE {self.table} SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return pickle.loads(row[0])
+
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+                (key, data, now, now)
+            )
+            if self.max_size is None:
+                return
+            excess = self._count() - self.max_size
+            if excess > 0:
+                self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY accessed LIMIT ?)",
+                    (excess,)
+                )
+                self.evictions += excess
+
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
+
+
+    def close(self) -> None:
+        """
+        Close database connection
+        """
+        self._connection.close()
+
+
+    def _count(self) -> int:
+        return self._connection.execute(
+            f"SELECT COUNT(*) FROM {self.table}"
+        ).fetchone()[0]
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+
+def _fingerprint(value: Any, digest: Any) -> None:
+    """
+    Update digest with stable representation of value
+    """
+    if isinstance(value, IOModel):
+        value = value.__dict__
+    if isinstance(value, dict):
+        digest.update(b"{")
+        for k in sorted(value, key=repr): # type: ignore
+            _fingerprint(k, digest)
+            _fingerprint(value[k], digest)
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[" if isinstance(value, list) else b"(")
+        for v in value: # type: ignore
+            _fingerprint(v, digest)
+        digest.update(b"]")
+    elif value is None or isinstance(value, (str, int, float, bool, bytes)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif hasattr(value, "detach") and hasattr(value, "cpu"):
+        _fingerprint(value.detach().cpu().numpy(), digest)
+    elif hasattr(value, "tobytes") and hasattr(value, "dtype"):
+        digest.update(f"array:{value.dtype}:{getattr(value, 'shape', None)};".encode())
+        digest.update(value.tobytes())
+    else:
+        try:
+            digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            digest.update(repr(value).encode())
+
+
+class Cached(Executable[Input, Output]):
+    """
+    Caches results of wrapped executable. Results are stored by hash of
+    validated input, so that repeated inputs are returned without execution.
+    """
+    def __init__(
+        self,
+        executable: Executable[Input, Output],
+        store: Optional[CacheStore]=None,
+        namespace: Optional[str]=None,
+        name: Optional[str]=None,
+    ) -> None:
+        """
+        Args:
+            executable (Executable[Input, Output]): Wrapped executable.
+
+            store (Optional[CacheStore], optional): Store for results. If equals to None,
+                MemoryCacheStore with default parameters will be used. Defaults to None.
+
+            namespace (Optional[str], optional): Prefix of keys, that allows to share one
+                store between executables. If equals to None, name of wrapped executable
+                will be used. Defaults to None.
+
+            name (Optional[str], optional): Name for identification.
+                If equals to None, class name will be used. Defaults to None.
+        """
+        super().__init__(
+            input_class=executable.input_class,
+            output_class=executable.output_class,
+            name=name,
+            replace=executable.replace,
+        )
+        self.executable = executable
+        self.store = store if store is not None else MemoryCacheStore()
+        self.namespace = namespace or executable.name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+
+    def key(self, input_data: Input) -> str:
+        """
+        Create cache key
+
+        Args:
+            input_data (Input): Validated input.
+
+        Returns:
+            str: Key.
+        """
+        digest = hashlib.sha256(self.namespace.encode())
+        _fingerprint(input_data, digest)
+        return digest.hexdigest()
+
+
+    def lookup(self, key: str) -> Any:
+        """
+        Get stored result and update statistics
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Stored result or MISSING.
+        """
+        result = self.store.get(key)
+        with self._lock:
+            if result is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+
+    def invoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        key = self.key(input_data)
+        result = self.lookup(key)
+        if result is MISSING:
+            result = self.executable.invoke(input_data, evaluator)
+            self.store.set(key, result)
+        return result
+
+
+    async def ainvoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        key = self.key(input_data)
+        result = self.lookup(key)
+        if result is MISSING:
+            result = await self.executable.ainvoke(input_data, evaluator)
+            self.store.set(key, result)
+        return result
+
+
+    def invoke_batch(
+        self, input_data: List[Input], evaluator: Evaluator
+    ) -> List[Dict[str, Any]]:
+        """
+        Only inputs without stored results are passed to wrapped executable
+        """
+        keys = [self.key(i) for i in input_data]
+        results = [self.lookup(k) for k in keys]
+        missing = [i for i, r in enumerate(results) if r is MISSING]
+        if missing:
+            computed = self.executable.invoke_batch(
+                [input_data[i] for i in missing], evaluator
+            )
+            for i, result in zip(missing, computed):
+                self.store.set(keys[i], result)
+                results[i] = result
+        return results
+
+
+    @property
+    def config(self) -> Any:
+        """
+        Configuration of wrapped executable, if it has one
+        """
+        return getattr(self.executable, "config", None)
+
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics: hits, misses, hit_rate, evictions and size
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.,
+            "evictions": self.store.evictions,
+            "size": len(self.store),
+        }
+
+
+    def clear(self) -> None:
+        """
+        Remove stored results and reset statistics
+        """
+        self.store.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
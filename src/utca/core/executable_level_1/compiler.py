@@ -0,0 +1,445 @@
+from __future__ import annotations
+from typing import (
+    Any, List, Optional, Tuple
+)
+import logging
+
+from utca.core.executable_level_1.component import Component
+from utca.core.executable_level_1.schema import IOModel, Transformable, ValidationMode
+from utca.core.executable_level_1.interpreter import Evaluator
+from utca.core.executable_level_1.actions import Action
+from utca.core.executable_level_1.executable import Executable
+from utca.core.executable_level_1.eval import ExecutionSchema
+from utca.core.exceptions import ExecutableError, ExecutionSchemaFailed, ExitLoop
+
+class FusedActions(Component):
+    """
+    Adjacent actions executed as one step of compiled schema
+    """
+    def __init__(
+        self,
+        actions: List[Action[Any, Any]],
+        name: Optional[str]=None,
+    ) -> None:
+        """
+        Args:
+            actions (List[Action[Any, Any]]): Actions to execute.
+
+            name (Optional[str], optional): Name for identification.
+                If equals to None, names of actions will be used. Defaults to None.
+        """
+        super().__init__(name or "+".join(a.name for a in actions))
+        self.actions = actions
+
+
+    def __call__(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data that is used in actions.
+
+            evaluator (Optional[Evaluator], optional): Not used. Defaults to None.
+
+        Raises:
+            ActionError: Raised if any action was executed unsuccessfully.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        for action in self.actions:
+            input_data = action.apply(input_data)
+        return input_data
+
+
+class ExecutableStep(Component):
+    """
+    Executable step of compiled schema. If trust_input is True, validated
+    output of previous step is passed to the executable without validation.
+    """
+    def __init__(
+        self,
+        executable: Executable[Any, Any],
+        trust_input: bool=False,
+    ) -> None:
+        """
+        Args:
+            executable (Executable[Any, Any]): Executable to execute.
+
+            trust_input (bool, optional): Reuse validated output of previous step
+                as input. Defaults to False.
+        """
+        super().__init__(executable.name)
+        self.executable = executable
+        self.trust_input = trust_input
+
+
+    def execute_step(
+        self,
+        input_data: Transformable,
+        evaluator: Evaluator,
+        previous: Optional[IOModel],
+    ) -> Tuple[Transformable, Optional[IOModel]]:
+        """
+        Execute step
+
+        Args:
+            input_data (Transformable): Current data.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+            previous (Optional[IOModel]): Validated output of previous step.
+
+        Raises:
+            ExecutableError: If any error occur.
+
+        Returns:
+            Tuple[Transformable, Optional[IOModel]]: Current data and validated output.
+                Validated output is None if output was not validated.
+        """
+        executable = self.executable
+        mode = executable.get_validation_mode(evaluator)
+        try:
+            if self.trust_input and previous is not None:
+                inputs = previous
+            else:
+                inputs = executable.build_input(input_data.view(), mode) # type: ignore
+            result = executable.invoke(inputs, evaluator)
+            output = (
+                executable.validate_output(result) 
+                if mode == ValidationMode.FULL else None
+            )
+        except Exception as e:
+            raise ExecutableError(executable.name, e)
+        if output is None:
+            return executable.set_result(
+                input_data, executable.build_output(result, mode)
+            ), None
+        return executable.set_result(input_data, output.extract()), output
+
+
+    async def aexecute_step(
+        self,
+        input_data: Transformable,
+        evaluator: Evaluator,
+        previous: Optional[IOModel],
+    ) -> Tuple[Transformable, Optional[IOModel]]:
+        """
+        Execute step asynchronously
+
+        Args:
+            input_data (Transformable): Current data.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+            previous (Optional[IOModel]): Validated output of previous step.
+
+        Raises:
+            ExecutableError: If any error occur.
+
+        Returns:
+            Tuple[Transformable, Optional[IOModel]]: Current data and validated output.
+                Validated output is None if output was not validated.
+        """
+        executable = self.executable
+        mode = executable.get_validation_mode(evaluator)
+        try:
+            if self.trust_input and previous is not None:
+                inputs = previous
+            else:
+                inputs = executable.build_input(input_data.view(), mode) # type: ignore
+            result = await executable.ainvoke(inputs, evaluator)
+            output = (
+                executable.validate_output(result) 
+                if mode == ValidationMode.FULL else None
+            )
+        except Exception as e:
+            raise ExecutableError(executable.name, e)
+        if output is None:
+            return executable.set_result(
+                input_data, executable.build_output(result, mode)
+            ), None
+        return executable.set_result(input_data, output.extract()), output
+
+
+    def __call__(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+        return self.run_step(input_data, evaluator, None)[0]
+
+
+    def run_step(
+        self,
+        input_data: Transformable,
+        evaluator: Evaluator,
+        previous: Optional[IOModel],
+    ) -> Tuple[Transformable, Optional[IOModel]]:
+        """
+        Execute step as instrumented stage of evaluator
+        """
+        event = evaluator.start_stage(self.name, input_data)
+        try:
+            result = self.execute_step(input_data, evaluator, previous)
+        except BaseException as e:
+            evaluator.end_stage(event, error=e)
+            raise e
+        evaluator.end_stage(event, result[0])
+        return result
+
+
+    async def arun_step(
+        self,
+        input_data: Transformable,
+        evaluator: Evaluator,
+        previous: Optional[IOModel],
+    ) -> Tuple[Transformable, Optional[IOModel]]:
+        """
+        Execute step asynchronously as instrumented stage of evaluator
+        """
+        event = evaluator.start_stage(self.name, input_data)
+        try:
+            result = await self.aexecute_step(input_data, evaluator, previous)
+        except BaseException as e:
+            evaluator.end_stage(event, error=e)
+            raise e
+        evaluator.end_stage(event, result[0])
+        return result
+
+
+def flatten(schema: ExecutionSchema) -> List[Component]:
+    """
+    Inline nested ExecutionSchema
+
+    Args:
+        schema (ExecutionSchema): Schema to flatten.
+
+    Returns:
+        List[Component]: Components in execution order.
+    """
+    program: List[Component] = []
+    for component in schema.program:
+        if isinstance(component, ExecutionSchema):
+            program.extend(flatten(component))
+        else:
+            program.append(component)
+    return program
+
+
+def can_trust_input(
+    previous: Executable[Any, Any], executable: Executable[Any, Any]
+) -> bool:
+    """
+    Check if validated output of previous executable can be used as input of
+    executable without validation. Output class should be subclass of input
+    class with the same fields, so that extracted data stays the same.
+
+    Args:
+        previous (Executable[Any, Any]): Previous executable.
+
+        executable (Executable[Any, Any]): Next executable.
+
+    Returns:
+        bool: True if validation can be skipped.
+    """
+    return (
+        issubclass(previous.output_class, executable.input_class)
+        and previous.output_class.model_fields.keys()
+        == executable.input_class.model_fields.keys()
+    )
+
+
+def build_plan(schema: ExecutionSchema) -> List[Component]:
+    """
+    Create flat execution plan from schema
+
+    Args:
+        schema (ExecutionSchema): Schema to compile.
+
+    Returns:
+        List[Component]: Steps of plan.
+    """
+    plan: List[Component] = []
+    actions: List[Action[Any, Any]] = []
+    previous: Optional[Executable[Any, Any]] = None
+
+    def flush_actions() -> None:
+        if len(actions) > 1:
+            plan.append(FusedActions(actions.copy()))
+        elif actions:
+            plan.append(actions[0])
+        actions.clear()
+
+    for component in flatten(schema):
+        if isinstance(component, Action):
+            actions.append(component)
+            previous = None
+            continue
+        flush_actions()
+        if (
+            isinstance(component, Executable)
+            and type(component).__call__ is Executable.__call__
+        ):
+            plan.append(ExecutableStep(
+                component,
+                trust_input=(
+                    previous is not None and can_trust_input(previous, component)
+                ),
+            ))
+            previous = component
+        else:
+            plan.append(component)
+            previous = None
+    flush_actions()
+    return plan
+
+
+class CompiledSchema(Component):
+    """
+    Flat execution plan of ExecutionSchema. Nested schemas are inlined,
+    adjacent actions are fused and input validation is skipped for executables
+    that receive validated output of previous executable.
+
+    Created by ExecutionSchema.compile. Changes of schema made after compilation
+    are not reflected.
+    """
+    plan: List[Component]
+
+    def __init__(
+        self,
+        schema: ExecutionSchema,
+        name: Optional[str]=None,
+    ) -> None:
+        """
+        Args:
+            schema (ExecutionSchema): Schema to compile.
+
+            name (Optional[str], optional): Name for identification.
+                If equals to None, name of schema will be used. Defaults to None.
+        """
+        super().__init__(name or schema.name)
+        self.plan = build_plan(schema)
+
+
+    def __call__(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data that is used in plan.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which plan
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+        Raises:
+            ExecutionSchemaFailed: If any error occurs.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+        log_steps = evaluator.logger.isEnabledFor(logging.INFO)
+
+        previous: Optional[IOModel] = None
+        for i, step in enumerate(self.plan):
+            try:
+                if isinstance(step, ExecutableStep):
+                    input_data, previous = step.run_step(input_data, evaluator, previous)
+                else:
+                    previous = None
+                    input_data = evaluator.call_component(step, input_data)
+                if log_steps:
+                    evaluator.log(
+                        logging.INFO,
+                        f"{self.name}: Step {i}({step.name}) executed successfully."
+                    )
+            except ExitLoop as e:
+                raise e
+            except Exception as e:
+                previous = None
+                self.handle_error(i, e, evaluator)
+        return input_data
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data that is used in plan.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which plan
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+        Raises:
+            ExecutionSchemaFailed: If any error occurs.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+        log_steps = evaluator.logger.isEnabledFor(logging.INFO)
+
+        previous: Optional[IOModel] = None
+        for i, step in enumerate(self.plan):
+            try:
+                if isinstance(step, ExecutableStep):
+                    input_data, previous = await step.arun_step(
+                        input_data, evaluator, previous
+                    )
+                elif isinstance(step, FusedActions):
+                    previous = None
+                    input_data = evaluator.call_component(step, input_data)
+                else:
+                    previous = None
+                    input_data = await evaluator.acall_component(step, input_data)
+                if log_steps:
+                    evaluator.log(
+                        logging.INFO,
+                        f"{self.name}: Step {i}({step.name}) executed successfully."
+                    )
+            except ExitLoop as e:
+                raise e
+            except Exception as e:
+                previous = None
+                self.handle_error(i, e, evaluator)
+        return input_data
+
+
+    def handle_error(self, step: int, error: Exception, evaluator: Evaluator) -> None:
+        """
+        Log error and raise it if evaluator.fast_exit is set
+
+        Args:
+            step (int): Index of failed step.
+
+            error (Exception): Raised error.
+
+            evaluator (Evaluator): Evaluator in context of which plan executed.
+
+        Raises:
+            ExecutionSchemaFailed: If evaluator.fast_exit is set.
+        """
+        evaluator.log(
+            logging.ERROR,
+            f"{self.name}: Error at step {step}"
+        )
+        evaluator.log(logging.ERROR, error, exc_info=True)
+        if evaluator.fast_exit:
+            raise ExecutionSchemaFailed(self.name, error)
+
+
+    def describe(self) -> List[str]:
+        """
+        Names of plan steps
+
+        Returns:
+            List[str]: Step descriptions.
+        """
+        return [
+            f"{step.name}(trusted input)"
+            if isinstance(step, ExecutableStep) and step.trust_input
+            else step.name
+            for step in self.plan
+        ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, TYPE_CHECKING
+import asyncio
 
 from utca.core.executable_level_1.schema import Transformable
 if TYPE_CHECKING:
@@ -67,6 +68,25 @@ class Component(ABC):
         ...
 
 
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Asynchronous component call. By default, synchronous call
+        is executed in thread pool.
+
+        Args:
+            input_data (Transformable): Data for processing
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which component executed.
+                If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Transformable: Result of executed component.
+        """
+        return await asyncio.to_thread(self, input_data, evaluator)
+
+
     def prepare_input(
         self, input_data: Optional[Dict[str, Any]]=None
     ) -> Transformable:
@@ -103,6 +123,25 @@ class Component(ABC):
         """
         return self(self.prepare_input(input_data), evaluator).extract()
 
+
+    async def arun(
+        self, input_data: Optional[Dict[str, Any]]=None, evaluator: Optional[Evaluator]=None
+    ) -> Dict[str, Any]:
+        """
+        Run Component asynchronously
+
+        Args:
+            input_data (Optional[Dict[str, Any]], optional): Data for processing. 
+                If equals to None, empty dict will be used for input_data. Defaults to None.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which component executed.
+                If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Result of execution.
+        """
+        return (await self.acall(self.prepare_input(input_data), evaluator)).extract()
+
     
     @property
     def name(self) -> str:
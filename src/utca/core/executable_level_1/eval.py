@@ -1,8 +1,13 @@
 from __future__ import annotations
 from typing import (
-    Any, List, Callable, Optional, Tuple, Union
+    Any, Dict, List, Callable, Optional, Tuple, Union, TYPE_CHECKING, cast
 )
-import copy
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+)
+from enum import Enum
+import asyncio
+import inspect
 import logging
 
 from utca.core.executable_level_1.component import Component
@@ -10,6 +15,8 @@ from utca.core.executable_level_1.schema import Transformable
 from utca.core.executable_level_1.interpreter import Evaluator
 from utca.core.executable_level_1.memory import GetMemory, MemoryGetInstruction
 from utca.core.exceptions import ExecutionSchemaFailed, ExitLoop
+if TYPE_CHECKING:
+    from utca.core.executable_level_1.compiler import CompiledSchema
 
 
 class ExecutionSchema(Component):
@@ -63,6 +70,19 @@ class ExecutionSchema(Component):
         return self.add(component)
     
 
+    def compile(self) -> CompiledSchema:
+        """
+        Create flat execution plan. Nested schemas are inlined, adjacent actions
+        are fused and input validation is skipped where executable receives
+        validated output of previous executable with the same fields.
+
+        Returns:
+            CompiledSchema: Compiled schema.
+        """
+        from utca.core.executable_level_1.compiler import CompiledSchema
+        return CompiledSchema(self)
+
+
     def __call__(
         self, input_data: Transformable, evaluator: Optional[Evaluator]=None
     ) -> Transformable:
@@ -83,7 +103,45 @@ class ExecutionSchema(Component):
 
         for i, component in enumerate(self.program):
             try:
-                input_data = component(input_data, evaluator)
+                input_data = evaluator.call_component(component, input_data)
+                evaluator.log(
+                    logging.INFO,
+                    f"{self.name}: Step {i}({component.name}) executed successfully."
+                )
+            except ExitLoop as e:
+                raise e
+            except Exception as e:
+                evaluator.log(
+                    logging.ERROR,
+                    f"{self.name}: Error at step {i}"
+                )
+                evaluator.log(logging.ERROR, e, exc_info=True)
+                if evaluator.fast_exit:
+                    raise ExecutionSchemaFailed(self.name, e)
+        return input_data
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data that is used in action.
+            
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which ExecutionSchema
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+        Raises:
+            ExecutionSchemaFailed: If any error occurs.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+
+        for i, component in enumerate(self.program):
+            try:
+                input_data = await evaluator.acall_component(component, input_data)
                 evaluator.log(
                     logging.INFO,
                     f"{self.name}: Step {i}({component.name}) executed successfully."
@@ -106,6 +164,31 @@ ConditionProtocol = Callable[[Transformable, Evaluator], bool]
 Type that describes objects that can be used as conditions and validators in Condition
 """
 
+async def aevaluate_condition(
+    condition: ConditionProtocol, input_data: Transformable, evaluator: Evaluator
+) -> bool:
+    """
+    Evaluate condition in asynchronous context
+
+    Args:
+        condition (ConditionProtocol): Condition to evaluate. Can be Condition,
+            synchronous or asynchronous callable.
+
+        input_data (Transformable): Data for processing.
+
+        evaluator (Evaluator): Evaluator in context of which condition evaluated.
+
+    Returns:
+        bool: Result of evaluation.
+    """
+    if isinstance(condition, Condition):
+        return await condition.acall(input_data, evaluator)
+    result = condition(input_data, evaluator)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
 class Condition:
     """
     Condition class used for evaluation of intermediate data
@@ -160,9 +243,37 @@ class Condition:
             )
         return self.validator(
             evaluator
-            .create_child(self.schema, self.name)(copy.copy(input_data), evaluator),
+            .create_child(self.schema, self.name)(input_data.fork(), evaluator),
+            evaluator
+        )
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Evaluator
+    ) -> bool:
+        """
+        Args:
+            input_data (Transformable): Data for processing
+            
+            evaluator (Evaluator): Evaluator in context of which Condition executed.
+
+        Returns:
+            bool: Result of evaluation. Define that condition is fulfilled or not.
+        """
+        if self.state != None:
+            input_data = GetMemory(
+                self.state, memory_instruction=MemoryGetInstruction.GET
+            )(
+                input_data, evaluator
+            )
+        result = self.validator(
+            await evaluator
+            .create_child(self.schema, self.name).acall(input_data.fork(), evaluator),
             evaluator
         )
+        if inspect.isawaitable(result):
+            return await result
+        return result
     
 
     def __repr__(self) -> str:
@@ -221,6 +332,26 @@ class Branch:
             input_data, evaluator
         ):
             return self.schema(input_data, evaluator)
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Evaluator
+    ) -> Optional[Transformable]:
+        """
+        Evaluates condition and, if fulfilled, executes schema asynchronously
+
+        Args:
+            input_data (Transformable): Data for processing.
+
+            evaluator (Evaluator): Evaluator in context of which Branch executed.
+
+        Returns:
+            Optional[Transformable]: Result of executed schema, if executed; otherwise, None.
+        """
+        if self.condition is None or await aevaluate_condition(
+            self.condition, input_data, evaluator
+        ):
+            return await self.schema.acall(input_data, evaluator)
         
 
     def __repr__(self) -> str:
@@ -273,6 +404,97 @@ class Switch(Component):
         return input_data
 
 
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data for processing.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which Switch
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+        
+        for branch in self.branches:
+            if res := await branch.acall(input_data, evaluator):
+                input_data = res
+                if branch.exit_branch:
+                    break
+        return input_data
+
+
+class ForEachMode(Enum):
+    """
+    Execution strategy of ForEach items
+    """
+    SEQUENTIAL = 0
+    """
+    Execute items one by one
+    """
+    THREAD = 1
+    """
+    Execute items in thread pool
+    """
+    PROCESS = 2
+    """
+    Execute items in process pool. Schema and items should be picklable.
+    Items are executed with default evaluator of worker process, so memory 
+    of current evaluator is not accessible.
+    """
+    ASYNCIO = 3
+    """
+    Execute items as asyncio tasks. If ForEach is called synchronously inside
+    running event loop (e.g. run is called from async code), items are executed
+    in thread pool, since asyncio.run can't be used there
+    """
+
+
+class ItemErrorPolicy(Enum):
+    """
+    Strategy for items that failed in ForEach
+    """
+    RAISE = 0
+    """
+    Reraise exception
+    """
+    SKIP = 1
+    """
+    Exclude item from results
+    """
+    KEEP_INPUT = 2
+    """
+    Use unprocessed item as result
+    """
+
+
+_SKIPPED = object()
+"""Marker of skipped item"""
+
+_process_schema: Optional[Component] = None
+"""Schema of process pool worker"""
+
+def _has_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _init_process_worker(schema: Component) -> None:
+    global _process_schema
+    _process_schema = schema
+
+
+def _run_in_process(item: Dict[str, Any]) -> Dict[str, Any]:
+    return cast(Component, _process_schema).run(item)
+
+
 class ForEach(Component):
     """
     Execution for each item in data series
@@ -284,6 +506,10 @@ class ForEach(Component):
         schema: Component,
         get_key: str,
         set_key: Optional[str]=None,
+        mode: ForEachMode=ForEachMode.SEQUENTIAL,
+        max_workers: Optional[int]=None,
+        ordered: bool=True,
+        on_error: ItemErrorPolicy=ItemErrorPolicy.RAISE,
         name: Optional[str]=None
     ) -> None:
         """
@@ -294,6 +520,18 @@ class ForEach(Component):
             
             set_key (Optional[str], optional): Data destination. 
                 If equals to None, get_key will be used. Defaults to None.
+
+            mode (ForEachMode, optional): Execution strategy. Defaults to ForEachMode.SEQUENTIAL.
+
+            max_workers (Optional[int], optional): Maximum number of concurrently executed items.
+                If equals to None, default of executor is used (for ForEachMode.ASYNCIO,
+                concurrency is not bounded). Defaults to None.
+
+            ordered (bool, optional): If equals to True, results order matches items order;
+                otherwise, results are collected as completed. Defaults to True.
+
+            on_error (ItemErrorPolicy, optional): Strategy for failed items.
+                Defaults to ItemErrorPolicy.RAISE.
             
             name (Optional[str], optional): Name for identification.
                 If equals to None, class name will be used. Defaults to None.
@@ -302,6 +540,10 @@ class ForEach(Component):
         self.get_key = get_key
         self.set_key = set_key or get_key
         self.schema = schema
+        self.mode = mode
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.on_error = on_error
 
 
     def __call__(
@@ -322,15 +564,186 @@ class ForEach(Component):
         
         data = getattr(input_data, self.get_key)
 
+        mode = self.mode
+        if mode == ForEachMode.ASYNCIO and _has_running_loop():
+            mode = ForEachMode.THREAD
+
+        if mode == ForEachMode.SEQUENTIAL:
+            results = [self.run_item(t, evaluator) for t in data]
+        elif mode == ForEachMode.THREAD:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                results = self.collect(data, [
+                    executor.submit(self.run_item, t, evaluator) for t in data
+                ], evaluator)
+        elif mode == ForEachMode.PROCESS:
+            with ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_init_process_worker,
+                initargs=(self.schema,),
+            ) as executor:
+                results = self.collect(data, [
+                    executor.submit(_run_in_process, t) for t in data
+                ], evaluator)
+        else:
+            results = asyncio.run(self.arun_items(data, evaluator))
+
         setattr(
             input_data,
             self.set_key,
-            [
-                evaluator.create_child(self.schema, self.name).run(copy.copy(t), evaluator)
-                for t in data
-            ]
+            [r for r in results if r is not _SKIPPED]
         )
         return input_data
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Items are processed as asyncio tasks, except for ForEachMode.THREAD and
+        ForEachMode.PROCESS modes, which are offloaded to thread.
+
+        Args:
+            input_data (Transformable): Data for processing.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which ForEach
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if self.mode in (ForEachMode.THREAD, ForEachMode.PROCESS):
+            return await super().acall(input_data, evaluator)
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+        
+        data = getattr(input_data, self.get_key)
+        results = await self.arun_items(data, evaluator)
+        setattr(
+            input_data,
+            self.set_key,
+            [r for r in results if r is not _SKIPPED]
+        )
+        return input_data
+
+
+    def run_item(self, item: Dict[str, Any], evaluator: Evaluator) -> Any:
+        """
+        Execute schema for item
+
+        Args:
+            item (Dict[str, Any]): Item for processing.
+
+            evaluator (Evaluator): Evaluator in context of which ForEach executed.
+
+        Returns:
+            Any: Result of execution.
+        """
+        try:
+            return evaluator.create_child(self.schema, self.name)(
+                Transformable.overlay(item), evaluator
+            ).extract()
+        except Exception as e:
+            return self.handle_error(item, e, evaluator)
+
+
+    async def arun_item(self, item: Dict[str, Any], evaluator: Evaluator) -> Any:
+        """
+        Execute schema for item asynchronously
+
+        Args:
+            item (Dict[str, Any]): Item for processing.
+
+            evaluator (Evaluator): Evaluator in context of which ForEach executed.
+
+        Returns:
+            Any: Result of execution.
+        """
+        try:
+            return (await evaluator.create_child(self.schema, self.name).acall(
+                Transformable.overlay(item), evaluator
+            )).extract()
+        except Exception as e:
+            return self.handle_error(item, e, evaluator)
+
+
+    async def arun_items(self, data: List[Dict[str, Any]], evaluator: Evaluator) -> List[Any]:
+        """
+        Execute schema for items as asyncio tasks
+
+        Args:
+            data (List[Dict[str, Any]]): Items for processing.
+
+            evaluator (Evaluator): Evaluator in context of which ForEach executed.
+
+        Returns:
+            List[Any]: Results of execution.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers) if self.max_workers else None
+
+        async def run(item: Dict[str, Any]) -> Any:
+            if semaphore is None:
+                return await self.arun_item(item, evaluator)
+            async with semaphore:
+                return await self.arun_item(item, evaluator)
+
+        if self.ordered:
+            return await asyncio.gather(*(run(t) for t in data))
+        return [
+            await r for r in asyncio.as_completed([run(t) for t in data])
+        ]
+
+
+    def collect(
+        self, 
+        data: List[Dict[str, Any]], 
+        futures: List[Future[Any]], 
+        evaluator: Evaluator
+    ) -> List[Any]:
+        """
+        Collect results of submitted items
+
+        Args:
+            data (List[Dict[str, Any]]): Items for processing.
+
+            futures (List[Future[Any]]): Futures of corresponding items.
+
+            evaluator (Evaluator): Evaluator in context of which ForEach executed.
+
+        Returns:
+            List[Any]: Results of execution.
+        """
+        items = {id(f): t for f, t in zip(futures, data)}
+        results: List[Any] = []
+        for future in (futures if self.ordered else as_completed(futures)):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(self.handle_error(items[id(future)], e, evaluator))
+        return results
+
+
+    def handle_error(
+        self, item: Dict[str, Any], e: Exception, evaluator: Evaluator
+    ) -> Any:
+        """
+        Apply error policy to failed item
+
+        Args:
+            item (Dict[str, Any]): Failed item.
+
+            e (Exception): Raised exception.
+
+            evaluator (Evaluator): Evaluator in context of which ForEach executed.
+
+        Returns:
+            Any: Result for item.
+        """
+        if self.on_error == ItemErrorPolicy.RAISE:
+            raise e
+        evaluator.log(logging.WARNING, f"{self.name}: Item failed: {e}")
+        if self.on_error == ItemErrorPolicy.SKIP:
+            return _SKIPPED
+        return item
     
 
 class Filter(Component):
@@ -394,6 +807,34 @@ class Filter(Component):
         return input_data
 
 
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data for processing.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which Filter
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+
+        data = getattr(input_data, self.get_key)
+        setattr(
+            input_data,
+            self.set_key,
+            [
+                s for s in data
+                if await aevaluate_condition(self.condition, Transformable(s), evaluator)
+            ]
+        )
+        return input_data
+
+
 class While(Component):
     """
     Loop execution based on condition and/or iterations
@@ -457,6 +898,36 @@ class While(Component):
                 break
             i -= 1
         return input_data
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data for processing.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which While
+                executed. If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+            
+        i = self.max_iterations
+        while i != 0 and (not self.condition or await aevaluate_condition(
+            self.condition,
+            input_data,
+            evaluator
+        )):
+            try:
+                input_data = await self.schema.acall(input_data, evaluator)
+            except ExitLoop:
+                break
+            i -= 1
+        return input_data
     
 
 class Break(Component):
@@ -467,6 +938,12 @@ class Break(Component):
         self, _: Transformable, __: Optional[Evaluator]=None
     ) -> Transformable:
         raise ExitLoop
+
+
+    async def acall(
+        self, _: Transformable, __: Optional[Evaluator]=None
+    ) -> Transformable:
+        raise ExitLoop
     
 BREAK = Break()
 """Exit loop singleton"""
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from typing import (
-    Any, Dict, Type, Generic, Optional, TypeVar, TYPE_CHECKING
+    Any, Dict, List, Type, Generic, Optional, TypeVar, TYPE_CHECKING
 )
 from abc import abstractmethod
+import asyncio
+import itertools
 
 from pydantic import ValidationError
 
@@ -14,6 +16,7 @@ from utca.core.executable_level_1.schema import (
     IOModel,
     Transformable, 
     ReplacingScope,
+    ValidationMode,
 )
 from utca.core.exceptions import ExecutableError, IvalidInputData
 if TYPE_CHECKING:
@@ -40,6 +43,8 @@ class Executable(
         output_class: Type[Output], 
         name: Optional[str]=None,
         replace: ReplacingScope=ReplacingScope.INPLACE,
+        validation_mode: Optional[ValidationMode]=None,
+        validation_sample_rate: int=10,
     ):
         """
         Args:
@@ -51,11 +56,62 @@ class Executable(
                 If equals to None, class name will be used. Defaults to None.
             
             replace (ReplacingScope, optional): Replacing strategy. Defaults to ReplacingScope.INPLACE.
+
+            validation_mode (Optional[ValidationMode], optional): Validation mode. If equals to None,
+                validation mode of evaluator will be used. Defaults to None.
+
+            validation_sample_rate (int, optional): In ValidationMode.SAMPLED, one in
+                validation_sample_rate executions is validated. Defaults to 10.
         """
         super().__init__(name)
         self.input_class = input_class
         self.output_class = output_class
         self.replace = replace
+        self.set_validation_mode(validation_mode, validation_sample_rate)
+
+
+    def set_validation_mode(
+        self, 
+        validation_mode: Optional[ValidationMode], 
+        validation_sample_rate: int=10,
+    ) -> Executable[Input, Output]:
+        """
+        Set validation mode
+
+        Args:
+            validation_mode (Optional[ValidationMode]): Validation mode. If equals to None,
+                validation mode of evaluator will be used.
+
+            validation_sample_rate (int, optional): In ValidationMode.SAMPLED, one in
+                validation_sample_rate executions is validated. Defaults to 10.
+
+        Returns:
+            Executable[Input, Output]: self.
+        """
+        if validation_sample_rate < 1:
+            raise ValueError("validation_sample_rate should be positive.")
+        self.validation_mode = validation_mode
+        self.validation_sample_rate = validation_sample_rate
+        self._executions = itertools.count()
+        return self
+
+
+    def get_validation_mode(self, evaluator: Evaluator) -> ValidationMode:
+        """
+        Resolve validation mode of current execution
+
+        Args:
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            ValidationMode: ValidationMode.FULL, ValidationMode.INPUT_ONLY or ValidationMode.TRUST.
+        """
+        mode = self.validation_mode or evaluator.validation_mode
+        if mode == ValidationMode.SAMPLED:
+            if next(self._executions) % self.validation_sample_rate:
+                return ValidationMode.TRUST
+            return ValidationMode.FULL
+        return mode
 
 
     @abstractmethod
@@ -74,6 +130,40 @@ class Executable(
         ...
 
 
+    def invoke_batch(
+        self, input_data: List[Input], evaluator: Evaluator
+    ) -> List[Dict[str, Any]]:
+        """
+        Main logic for batch of inputs. By default, invoke is executed for each input.
+        Override for executables that can process batch in one call.
+
+        Args:
+            input_data (List[Input]): Validated inputs.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            List[Dict[str, Any]]: Results of execution for each input.
+        """
+        return [self.invoke(i, evaluator) for i in input_data]
+
+
+    async def ainvoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        """
+        Asynchronous main logic. By default, invoke is executed in thread pool.
+        Override for native asynchronous implementation.
+
+        Args:
+            input_data (Input): Validated input.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            Dict[str, Any]: Result of execution.
+        """
+        return await asyncio.to_thread(self.invoke, input_data, evaluator)
+
+
     def validate(
         self, 
         data: Dict[str, Any],
@@ -133,6 +223,43 @@ class Executable(
         )
 
 
+    def build_input(self, data: Dict[str, Any], mode: ValidationMode) -> Input:
+        """
+        Create input according to validation mode
+
+        Args:
+            data (Dict[str, Any]): Input data.
+
+            mode (ValidationMode): Resolved validation mode.
+
+        Returns:
+            Input: Input for invoke.
+        """
+        if mode == ValidationMode.TRUST:
+            return self.input_class.model_construct(**data)
+        return self.validate_input(data)
+
+
+    def build_output(self, data: Dict[str, Any], mode: ValidationMode) -> Dict[str, Any]:
+        """
+        Create output according to validation mode. Without validation, output class
+        is constructed without validation (pydantic model_construct) and dumped, so that
+        keys, defaults and nested models are converted the same way as in validated 
+        output, but values are not coerced.
+
+        Args:
+            data (Dict[str, Any]): Output data.
+
+            mode (ValidationMode): Resolved validation mode.
+
+        Returns:
+            Dict[str, Any]: Result of execution.
+        """
+        if mode == ValidationMode.FULL:
+            return self.validate_output(data).extract()
+        return self.output_class.model_construct(**data).model_dump(warnings=False)
+
+
     def execute(
         self, 
         input_data: Dict[str, Any],
@@ -152,13 +279,86 @@ class Executable(
         Returns:
             Dict[str, Any]: Result of execution.
         """
+        mode = self.get_validation_mode(evaluator)
         try:
-            return self.validate_output(
+            return self.build_output(
                 self.invoke(
-                    self.validate_input(input_data),
+                    self.build_input(input_data, mode),
                     evaluator
+                ),
+                mode
+            )
+        except Exception as e:
+            raise ExecutableError(self.name, e)
+
+
+    def execute_batch(
+        self, 
+        input_data: List[Dict[str, Any]],
+        evaluator: Evaluator,
+        batch_size: Optional[int]=None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate inputs, invoke batches and validate outputs
+
+        Args:
+            input_data (List[Dict[str, Any]]): Items for processing.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+            batch_size (Optional[int], optional): Maximum number of items passed to one
+                invoke_batch call. If equals to None, all items are passed at once. 
+                Defaults to None.
+
+        Raises:
+            ExecutableError: If any error occur.
+
+        Returns:
+            List[Dict[str, Any]]: Results of execution for each item.
+        """
+        batch_size = batch_size or len(input_data) or 1
+        mode = self.get_validation_mode(evaluator)
+        try:
+            inputs = [self.build_input(i, mode) for i in input_data]
+            results: List[Dict[str, Any]] = []
+            for i in range(0, len(inputs), batch_size):
+                results.extend(
+                    self.build_output(r, mode)
+                    for r in self.invoke_batch(inputs[i:i + batch_size], evaluator)
                 )
-            ).extract()
+            return results
+        except Exception as e:
+            raise ExecutableError(self.name, e)
+
+
+    async def aexecute(
+        self, 
+        input_data: Dict[str, Any],
+        evaluator: Evaluator
+    ) -> Dict[str, Any]:
+        """
+        Validate input, invoke asynchronously and validate output
+
+        Args:
+            input_data (Dict[str, Any]): Data for processing.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Raises:
+            ExecutableError: If any error occur.
+
+        Returns:
+            Dict[str, Any]: Result of execution.
+        """
+        mode = self.get_validation_mode(evaluator)
+        try:
+            return self.build_output(
+                await self.ainvoke(
+                    self.build_input(input_data, mode),
+                    evaluator
+                ),
+                mode
+            )
         except Exception as e:
             raise ExecutableError(self.name, e)
     
@@ -180,7 +380,45 @@ class Executable(
         """
         if not evaluator:
             evaluator = self.set_up_default_evaluator()
-        result = self.execute(input_data.__dict__, evaluator)
+        result = self.execute(input_data.view(), evaluator) # type: ignore
+        return self.set_result(input_data, result)
+
+
+    async def acall(
+        self, 
+        input_data: Transformable,
+        evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data that is used in executable.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which executable executed.
+                If equals to None, default evaluator will be created. Defaults to None.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+        result = await self.aexecute(input_data.view(), evaluator) # type: ignore
+        return self.set_result(input_data, result)
+
+
+    def set_result(
+        self, input_data: Transformable, result: Dict[str, Any]
+    ) -> Transformable:
+        """
+        Apply result according to replacing strategy
+
+        Args:
+            input_data (Transformable): Current data.
+
+            result (Dict[str, Any]): Result of execution.
+
+        Returns:
+            Transformable: Updated data.
+        """
         if self.replace in (ReplacingScope.GLOBAL, ReplacingScope.LOCAL):
             return Transformable(result)
         input_data.update(result)
@@ -193,6 +431,7 @@ class Executable(
         set_key: Optional[str]=None,
         default_key: str="output",
         replace: Optional[ReplacingScope]=None,
+        batch_size: Optional[int]=None,
     ) -> ExecutableExecutor:
         """
         Creates ExecutableExecutor which manages context
@@ -213,6 +452,10 @@ class Executable(
             replace (Optional[ReplacingScope], optional): Replacing strategy for executor.
                 If equals to None, this executable strategy will be used. Defaults to None.
 
+            batch_size (Optional[int], optional): If specified, list data is processed 
+                with execute_batch in batches of this size. If equals to None, each item
+                is executed separately. Defaults to None.
+
         Returns:
             ExecutableExecutor: Wrapper of Executable
         """
@@ -223,4 +466,5 @@ class Executable(
             set_key=set_key,
             default_key=default_key,
             replace=replace or self.replace,
+            batch_size=batch_size,
         )
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import (
-    Any, Dict, List, Generic, Optional, TypeVar, cast
+    Any, Dict, List, Generic, Mapping, Optional, TypeVar, Union, cast
 )
+import asyncio
 import copy
 
 from utca.core.executable_level_1.executable import Executable
@@ -66,7 +67,59 @@ class BaseExecutor(Component, Generic[ExecutorComponent]):
         )
 
 
+    def get_value(self, input_data: Transformable) -> Any:
+        """
+        Get value associated with get_key. Root data is read with Transformable.view,
+        so that forks aren't merged.
+
+        Args:
+            input_data (Transformable): Current data.
+
+        Returns:
+            Any: Value.
+        """
+        if self.get_key == "__dict__":
+            return input_data.view()
+        return getattr(input_data, self.get_key)
+
+
 class ExecutableExecutor(BaseExecutor[Executable[Any, Any]]):
+    def __init__(
+        self, 
+        component: Executable[Any, Any], 
+        get_key: Optional[str]=None,
+        set_key: Optional[str]=None,
+        default_key: str="output",
+        replace: ReplacingScope=ReplacingScope.INPLACE,
+        batch_size: Optional[int]=None,
+    ) -> None:
+        """
+        Args:
+            component (Executable[Any, Any]): Wrapped executable.
+
+            get_key (Optional[str], optional): Which key value of input_data will be used. 
+                If value equal to None, root dict will be used. Defaults to None.
+
+            set_key (Optional[str], optional): Which key will be used to set result value. 
+                If set_key value equal to None:
+                    - if result of type Dict[str, Any], update root dict;
+                    - else, set result to default_key.
+                Defaults to None.
+
+            default_key (str, optional): Default key used for results that is not of type Dict.
+                Defaults to "output".
+
+            replace (ReplacingScope, optional): Replacing strategy for executor.
+                Defaults to ReplacingScope.INPLACE.
+
+            batch_size (Optional[int], optional): If specified, list data is processed 
+                with execute_batch in batches of this size. If equals to None, each item
+                is executed separately. Defaults to None.
+        """
+        super().__init__(component, get_key, set_key, default_key, replace)
+        self.batch_size = batch_size
+
+
     def __call__(
         self, 
         input_data: Transformable,
@@ -88,22 +141,21 @@ class ExecutableExecutor(BaseExecutor[Executable[Any, Any]]):
         if not evaluator:
             evaluator = self.set_up_default_evaluator()
 
-        try:
-            data = getattr(input_data, self.get_key)
-        except:
-            raise ExecutableError(
-                self.name, InputDataKeyError(self.get_key)
-            )
-        if isinstance(data, Dict):
+        data = self.get_data(input_data)
+        if isinstance(data, Mapping):
             result = self.component.execute(
-                copy.copy(cast(Dict[str, Any], data)), evaluator
+                cast(Dict[str, Any], data), evaluator
             )
-            if not self.set_key:
-                if self.replace in (ReplacingScope.GLOBAL, ReplacingScope.LOCAL):
-                    return Transformable(result)
-                input_data.update(result)
-                return input_data
-        elif isinstance(data, List):
+        elif self.batch_size:
+            items = cast(List[Dict[str, Any]], data)
+            result = [
+                {**i, **r} 
+                for i, r in zip(
+                    items, 
+                    self.component.execute_batch(items, evaluator, self.batch_size)
+                )
+            ]
+        else:
             result = [
                 {
                     **i,
@@ -113,10 +165,99 @@ class ExecutableExecutor(BaseExecutor[Executable[Any, Any]]):
                 }
                 for i in cast(List[Dict[str, Any]], data)
             ]
+        return self.set_result(input_data, result)
+
+
+    async def acall(
+        self, 
+        input_data: Transformable,
+        evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Args:
+            input_data (Transformable): Data that is used in executable.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which executable executed.
+                If equals to None, default evaluator will be created. Defaults to None.
+
+        Raises:
+            ExecutableError: If any error occures.
+
+        Returns:
+            Transformable: Result of execution.
+
+        Notes:
+            If batch_size is not specified, items of list data are executed concurrently.
+        """
+        if not evaluator:
+            evaluator = self.set_up_default_evaluator()
+
+        data = self.get_data(input_data)
+        if isinstance(data, Mapping):
+            result = await self.component.aexecute(
+                cast(Dict[str, Any], data), evaluator
+            )
         else:
+            items = cast(List[Dict[str, Any]], data)
+            if self.batch_size:
+                results = await asyncio.to_thread(
+                    self.component.execute_batch, items, evaluator, self.batch_size
+                )
+            else:
+                results = await asyncio.gather(*(
+                    self.component.aexecute(i, evaluator) for i in items
+                ))
+            result = [{**i, **r} for i, r in zip(items, results)]
+        return self.set_result(input_data, result)
+
+
+    def get_data(self, input_data: Transformable) -> Any:
+        """
+        Get data for processing
+
+        Args:
+            input_data (Transformable): Current data.
+
+        Raises:
+            ExecutableError: If key not found or data has unexpected type.
+
+        Returns:
+            Any: Data associated with get_key.
+        """
+        try:
+            data = self.get_value(input_data)
+        except:
+            raise ExecutableError(
+                self.name, InputDataKeyError(self.get_key)
+            )
+        if not isinstance(data, (Mapping, List)):
             raise ExecutableError(self.name, IvalidInputData(
                 "Unexpected data type for processing."
             ))
+        return data
+
+
+    def set_result(
+        self, 
+        input_data: Transformable, 
+        result: Union[Dict[str, Any], List[Dict[str, Any]]]
+    ) -> Transformable:
+        """
+        Set result according to set_key and replacing strategy
+
+        Args:
+            input_data (Transformable): Current data.
+
+            result (Union[Dict[str, Any], List[Dict[str, Any]]]): Result of execution.
+
+        Returns:
+            Transformable: Updated data.
+        """
+        if isinstance(result, Dict) and not self.set_key:
+            if self.replace in (ReplacingScope.GLOBAL, ReplacingScope.LOCAL):
+                return Transformable(result)
+            input_data.update(result)
+            return input_data
 
         if self.replace == ReplacingScope.GLOBAL:
             return Transformable({
@@ -153,14 +294,16 @@ class ActionExecutor(BaseExecutor[Action[Any, Any]]):
             evaluator = self.set_up_default_evaluator()
         
         try:
-            data = getattr(input_data, self.get_key)
+            data = self.get_value(input_data)
         except:
             raise ActionError(
                 self.name, InputDataKeyError(self.get_key)
             )
 
         try:
-            result = self.component.execute(copy.copy(data))
+            result = self.component.execute(
+                dict(data) if self.get_key == "__dict__" else copy.copy(data)
+            )
         except Exception as e:
             raise ActionError(self.name, e)
         
@@ -0,0 +1,290 @@
+from __future__ import annotations
+from typing import (
+    Any, Dict, List, Optional
+)
+import json
+import os
+import threading
+import time
+
+class StageEvent:
+    """
+    Execution of one component in context of evaluator
+    """
+    __slots__ = (
+        "name",
+        "path",
+        "thread_id",
+        "start_time",
+        "end_time",
+        "start_cpu_time",
+        "end_cpu_time",
+        "input_size",
+        "output_size",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        input_size: Optional[int]=None,
+    ) -> None:
+        """
+        Args:
+            name (str): Name of executed component.
+
+            path (str): Name of evaluator in context of which component executed.
+                Names of child evaluators include names of parents
+                (see Evaluator.create_child).
+
+            input_size (Optional[int], optional): Approximate size of input in bytes.
+                Defaults to None.
+        """
+        self.name = name
+        self.path = path
+        self.thread_id = threading.get_ident()
+        self.input_size = input_size
+        self.output_size: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.end_time: Optional[float] = None
+        self.end_cpu_time: Optional[float] = None
+        self.start_cpu_time = time.thread_time()
+        self.start_time = time.perf_counter()
+
+
+    def finish(
+        self,
+        output_size: Optional[int]=None,
+        error: Optional[BaseException]=None,
+    ) -> None:
+        """
+        Set end of execution
+
+        Args:
+            output_size (Optional[int], optional): Approximate size of output in bytes.
+                Defaults to None.
+
+            error (Optional[BaseException], optional): Raised error. Defaults to None.
+        """
+        self.end_time = time.perf_counter()
+        self.end_cpu_time = time.thread_time()
+        self.output_size = output_size
+        self.error = error
+
+
+    @property
+    def qualified_name(self) -> str:
+        """
+        Name of component with evaluator path
+        """
+        return f"{self.path}.{self.name}"
+
+
+    @property
+    def wall_time(self) -> float:
+        """
+        Wall time in seconds
+        """
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+
+    @property
+    def cpu_time(self) -> float:
+        """
+        CPU time of executing thread in seconds
+        """
+        return (self.end_cpu_time or time.thread_time()) - self.start_cpu_time
+
+
+class Instrument:
+    """
+    Base class for instrumentation of evaluators. Instruments are notified
+    on start and end of each stage executed in context of evaluator and its children.
+    """
+    measure_size: bool = False
+    """
+    If set to True, evaluator calculates approximate sizes of stage inputs and outputs
+    """
+
+    def on_start(self, event: StageEvent) -> None:
+        """
+        Called before stage execution
+
+        Args:
+            event (StageEvent): Started stage.
+        """
+        ...
+
+
+    def on_end(self, event: StageEvent) -> None:
+        """
+        Called after stage execution
+
+        Args:
+            event (StageEvent): Finished stage.
+        """
+        ...
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Percentile with linear interpolation
+
+    Args:
+        values (List[float]): Sorted values.
+
+        q (float): Percentile in range [0, 100].
+
+    Returns:
+        float: Percentile value.
+    """
+    if not values:
+        return 0.
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class Profiler(Instrument):
+    """
+    In-memory aggregator of stage events. Reports latency percentiles per component
+    and exports Chrome trace-event JSON (chrome://tracing, https://ui.perfetto.dev).
+    """
+    def __init__(
+        self,
+        measure_size: bool=False,
+        max_events: Optional[int]=None,
+    ) -> None:
+        """
+        Args:
+            measure_size (bool, optional): Calculate approximate sizes of
+                stage inputs and outputs. Defaults to False.
+
+            max_events (Optional[int], optional): Maximum number of stored events.
+                Oldest events are dropped. If equals to None, number of events
+                is not limited. Defaults to None.
+        """
+        self.measure_size = measure_size
+        self.max_events = max_events
+        self.events: List[StageEvent] = []
+        self._lock = threading.Lock()
+
+
+    def on_end(self, event: StageEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+            if self.max_events and len(self.events) > self.max_events:
+                del self.events[:len(self.events) - self.max_events]
+
+
+    def clear(self) -> None:
+        """
+        Remove collected events
+        """
+        with self._lock:
+            self.events = []
+
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statistics per component. Times are in milliseconds.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Statistics (count, errors, total, mean,
+                p50, p95, p99, max of wall time and mean of CPU time)
+                by qualified component name.
+        """
+        with self._lock:
+            events = list(self.events)
+
+        grouped: Dict[str, List[StageEvent]] = {}
+        for event in events:
+            grouped.setdefault(event.qualified_name, []).append(event)
+
+        report: Dict[str, Dict[str, float]] = {}
+        for name, group in grouped.items():
+            wall = sorted(e.wall_time * 1000 for e in group)
+            report[name] = {
+                "count": len(group),
+                "errors": sum(1 for e in group if e.error is not None),
+                "total_ms": sum(wall),
+                "mean_ms": sum(wall) / len(wall),
+                "p50_ms": percentile(wall, 50),
+                "p95_ms": percentile(wall, 95),
+                "p99_ms": percentile(wall, 99),
+                "max_ms": wall[-1],
+                "mean_cpu_ms": sum(e.cpu_time for e in group) * 1000 / len(group),
+            }
+        return report
+
+
+    def format_summary(self) -> str:
+        """
+        Summary as text table
+
+        Returns:
+            str: Formatted summary.
+        """
+        lines = [
+            f"{'component':<60} {'count':>7} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}"
+        ]
+        for name, stats in sorted(
+            self.summary().items(), key=lambda i: -i[1]["total_ms"]
+        ):
+            lines.append(
+                f"{name:<60} {int(stats['count']):>7} {stats['p50_ms']:>10.3f} "
+                f"{stats['p95_ms']:>10.3f} {stats['p99_ms']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Collected events in Chrome trace-event format
+
+        Returns:
+            Dict[str, Any]: Trace.
+        """
+        with self._lock:
+            events = list(self.events)
+
+        pid = os.getpid()
+        trace_events: List[Dict[str, Any]] = []
+        for event in events:
+            args: Dict[str, Any] = {
+                "path": event.path,
+                "cpu_ms": event.cpu_time * 1000,
+            }
+            if event.input_size is not None:
+                args["input_size"] = event.input_size
+            if event.output_size is not None:
+                args["output_size"] = event.output_size
+            if event.error is not None:
+                args["error"] = repr(event.error)
+            trace_events.append({
+                "name": event.name,
+                "cat": event.path,
+                "ph": "X",
+                "ts": event.start_time * 1e6,
+                "dur": event.wall_time * 1e6,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": args,
+            })
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+        }
+
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Write collected events in Chrome trace-event format
+
+        Args:
+            path (str): Destination file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
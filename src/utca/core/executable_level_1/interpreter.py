@@ -3,19 +3,27 @@ from typing import (
     Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 )
 import logging
+import copy
 
 from utca.core.executable_level_1.component import Component
-from utca.core.executable_level_1.schema import Transformable
+from utca.core.executable_level_1.schema import Transformable, ValidationMode
+from utca.core.executable_level_1.instrumentation import Instrument, StageEvent
+from utca.core.executable_level_1.utils import approximate_size
 from utca.core.exceptions import EvaluatorExecutionFailed
 if TYPE_CHECKING:
     from utca.core.executable_level_1.memory import MemoryManager
 
 
+_default_handler = logging.StreamHandler()
+"""
+Handler used by evaluators that don't specify one. Shared, so that handlers
+don't accumulate on loggers of evaluators with the same name
+"""
+
 class Evaluator(Component):
     """
     Manages context of execution
     """
-    memory_manager: MemoryManager
     schema: Component
 
     def __init__(
@@ -25,6 +33,9 @@ class Evaluator(Component):
         logging_handler: Optional[logging.Handler]=None,
         fast_exit: bool=True,
         memory_manager: Optional[MemoryManager]=None,
+        validation_mode: ValidationMode=ValidationMode.FULL,
+        instruments: Optional[List[Instrument]]=None,
+        inherit_memory: bool=False,
         name: Optional[str]=None,
     ) -> None:
         """
@@ -45,21 +56,57 @@ class Evaluator(Component):
                 in evaluator scope. If equals to None, default memory manager will be created.
                 Defaults to None.
 
+            validation_mode (ValidationMode, optional): Validation mode of executables
+                that do not specify their own. Defaults to ValidationMode.FULL.
+
+            instruments (Optional[List[Instrument]], optional): Instruments notified on start
+                and end of executed stages (e.g. Profiler). Child evaluators share
+                instruments of parent. Defaults to None.
+
+            inherit_memory (bool, optional): If set to True, child evaluators use memory
+                manager of this evaluator; otherwise, each child has its own memory.
+                Defaults to False.
+
             name (Optional[str], optional): Name for identification.
                 If equals to None, class name will be used. Defaults to None.
         """
-        from utca.core.executable_level_1.memory import MemoryManager
         super().__init__(name)
         self.logging_level = logging_level
-        self.logging_handler = logging_handler or logging.StreamHandler()
+        self.logging_handler = logging_handler or _default_handler
         self.logger = logging.getLogger(self.name)
-        self.logger.setLevel(self.logging_level)
-        self.logger.addHandler(self.logging_handler)
+        if self.logger.level != self.logging_level:
+            self.logger.setLevel(self.logging_level)
+        if self.logging_handler not in self.logger.handlers:
+            self.logger.addHandler(self.logging_handler)
         self.fast_exit = fast_exit
-        self.memory_manager = memory_manager or MemoryManager()
+        self.inherit_memory = inherit_memory
+        self._memory_manager = memory_manager
+        if inherit_memory:
+            # created eagerly, so that children created concurrently share one manager
+            self.memory_manager
+        self.validation_mode = validation_mode
+        self.instruments = instruments or []
+        self.measure_size = any(i.measure_size for i in self.instruments)
         self.schema = schema
 
 
+    @property
+    def memory_manager(self) -> MemoryManager:
+        """
+        Manages data, that can be accesed in evaluator scope. Default memory
+        manager is created on first access
+        """
+        if self._memory_manager is None:
+            from utca.core.executable_level_1.memory import MemoryManager
+            self._memory_manager = MemoryManager()
+        return self._memory_manager
+
+
+    @memory_manager.setter
+    def memory_manager(self, memory_manager: MemoryManager) -> None:
+        self._memory_manager = memory_manager
+
+
     def __call__(
         self, input_data: Transformable, evaluator: Optional[Evaluator]=None
     ) -> Transformable:
@@ -82,6 +129,30 @@ class Evaluator(Component):
             return self.schema(input_data, self)
         except Exception as e:
             raise EvaluatorExecutionFailed(self.name, e)
+
+
+    async def acall(
+        self, input_data: Transformable, evaluator: Optional[Evaluator]=None
+    ) -> Transformable:
+        """
+        Executes component asynchronously with prepared data
+
+        Args:
+            input_data (Transformable): Data for processing
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which component executed.
+                Defaults to None.
+
+        Raises: 
+            EvaluatorExecutionFailed: Reraised exception after logging to parent evaluator.        
+        
+        Returns:
+            Transformable: Result of executed component.
+        """
+        try:
+            return await self.schema.acall(input_data, self)
+        except Exception as e:
+            raise EvaluatorExecutionFailed(self.name, e)
         
 
     def run(
@@ -184,12 +255,123 @@ class Evaluator(Component):
         """
         self.logger.log(level, f"{self.name}: {msg}", exc_info=exc_info)
 
+
+    def start_stage(self, name: str, input_data: Any=None) -> Optional[StageEvent]:
+        """
+        Notify instruments about start of stage
+
+        Args:
+            name (str): Name of stage.
+
+            input_data (Any, optional): Input of stage. Defaults to None.
+
+        Returns:
+            Optional[StageEvent]: Started stage. None if evaluator has no instruments.
+        """
+        if not self.instruments:
+            return None
+        event = StageEvent(
+            name, 
+            self.name, 
+            approximate_size(input_data) if self.measure_size else None,
+        )
+        for instrument in self.instruments:
+            instrument.on_start(event)
+        return event
+
+
+    def end_stage(
+        self, 
+        event: Optional[StageEvent], 
+        output_data: Any=None, 
+        error: Optional[BaseException]=None,
+    ) -> None:
+        """
+        Notify instruments about end of stage
+
+        Args:
+            event (Optional[StageEvent]): Stage started with start_stage.
+
+            output_data (Any, optional): Output of stage. Defaults to None.
+
+            error (Optional[BaseException], optional): Raised error. Defaults to None.
+        """
+        if event is None:
+            return
+        event.finish(
+            approximate_size(output_data) 
+            if self.measure_size and error is None else None,
+            error,
+        )
+        for instrument in self.instruments:
+            instrument.on_end(event)
+
+
+    def call_component(
+        self, component: Component, input_data: Transformable
+    ) -> Transformable:
+        """
+        Execute component in context of evaluator as instrumented stage
+
+        Args:
+            component (Component): Component to execute.
+
+            input_data (Transformable): Data for processing.
+
+        Returns:
+            Transformable: Result of executed component.
+        """
+        if not self.instruments:
+            return component(input_data, self)
+        event = self.start_stage(component.name, input_data)
+        try:
+            result = component(input_data, self)
+        except BaseException as e:
+            self.end_stage(event, error=e)
+            raise e
+        self.end_stage(event, result)
+        return result
+
+
+    async def acall_component(
+        self, component: Component, input_data: Transformable
+    ) -> Transformable:
+        """
+        Execute component asynchronously in context of evaluator as instrumented stage
+
+        Args:
+            component (Component): Component to execute.
+
+            input_data (Transformable): Data for processing.
+
+        Returns:
+            Transformable: Result of executed component.
+        """
+        if not self.instruments:
+            return await component.acall(input_data, self)
+        event = self.start_stage(component.name, input_data)
+        try:
+            result = await component.acall(input_data, self)
+        except BaseException as e:
+            self.end_stage(event, error=e)
+            raise e
+        self.end_stage(event, result)
+        return result
+
     
     def create_child(
         self, schema: Component, child_name: str
     ) -> Evaluator:
         """
-        Create evaluator in context of current evaluator
+        Create evaluator in context of current evaluator. Child is a copy of current
+        evaluator, that shares its handler, instruments and settings, so that creation 
+        of child doesn't configure logging and its cost doesn't depend on number of 
+        created children. Memory of child is created on first access, unless memory 
+        is inherited.
+
+        Child logs through "parent.child" logger. Level and handlers of this logger
+        aren't set, so records are propagated to logger of current evaluator, unless
+        "parent.child" logger is configured.
 
         Args:
             schema (Component): Component to wrapp.
@@ -199,14 +381,23 @@ class Evaluator(Component):
         Returns:
             Evaluator: New evaluator.
         """
-        return Evaluator(
-            schema,
-            name=f"{self.name}.{child_name}",
-            logging_level=self.logging_level,
-            logging_handler=self.logging_handler,
-            fast_exit=self.fast_exit
-        )
+        child = copy.copy(self)
+        child._name = f"{self.name}.{child_name}"
+        child.schema = schema
+        child.logger = logging.getLogger(child._name)
+        child._memory_manager = self._memory_manager if self.inherit_memory else None
+        return child
     
 
+    def __copy__(self) -> Evaluator:
+        """
+        Shallow copy of evaluator, used for creation of children. Subclasses with
+        state that shouldn't be shared by children should override it
+        """
+        evaluator = self.__class__.__new__(self.__class__)
+        evaluator.__dict__.update(self.__dict__)
+        return evaluator
+
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self.name} ({self.__dict__})"
\ No newline at end of file
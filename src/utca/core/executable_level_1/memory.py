@@ -1,56 +1,180 @@
 from __future__ import annotations
-import os
-import json
+from collections import OrderedDict
 from enum import Enum
+import atexit
+import copy
+import logging
+import threading
+import time
+import weakref
 from typing import (
     Any, Dict, List, Optional, Tuple, Union
 )
 
 from utca.core.executable_level_1.component import Component
 from utca.core.executable_level_1.interpreter import Evaluator
+from utca.core.executable_level_1.memory_backends import (
+    MemoryBackend, DirectoryBackend
+)
 from utca.core.executable_level_1.schema import Transformable
+from utca.core.executable_level_1.utils import approximate_size
 from utca.core.exceptions import InavalidMemoryInstruction
 
+_MISSING = object()
+_DELETED = object()
+"""
+Pending deletion in write-behind mode
+"""
+_write_behind_memories: "weakref.WeakSet[Memory]" = weakref.WeakSet()
+
+@atexit.register
+def _sync_at_exit() -> None:
+    for memory in list(_write_behind_memories):
+        memory.close()
+
 class Memory:
     """
-    Manage data
+    Manage data. States are kept in process and, if backend is set, written
+    through to it. States missing in process are loaded from backend on access.
+
+    Size of memory can be limited by number of entries and approximate size
+    in bytes. Least recently used entries are evicted and, if spill is set,
+    moved to it.
+
+    In write-behind mode changes are written to backend by background thread.
+    Repeated writes of the same identifier are coalesced, so that only the last
+    state is written. States are copied when they are set, so that later in-place
+    changes aren't written.
     """
     memory: Dict[str, Any]
 
     def __init__(
         self, 
         directory: Optional[str]=None, 
-        initial_data: Optional[Dict[str, Any]]=None
+        initial_data: Optional[Dict[str, Any]]=None,
+        backend: Optional[MemoryBackend]=None,
+        max_entries: Optional[int]=None,
+        max_bytes: Optional[int]=None,
+        ttl: Optional[float]=None,
+        spill: Optional[MemoryBackend]=None,
+        write_behind: bool=False,
+        sync_interval: float=1.,
     ) -> None:
         """
         Args:
-            directory (Optional[str], optional): Path to directory. Defaults to None.
+            directory (Optional[str], optional): Path to directory. If provided and backend
+                isn't, DirectoryBackend with JSON files will be used. Defaults to None.
             
             initial_data (Optional[Dict[str, Any]], optional): Data for initialization 
                 of memory. Defaults to None.
+
+            backend (Optional[MemoryBackend], optional): Persistent storage of states
+                (e.g. SQLiteBackend or DirectoryBackend with MemorySerializer.PICKLE).
+                Defaults to None.
+
+            max_entries (Optional[int], optional): Maximum number of entries kept in process.
+                If equals to None, number of entries is not limited. Defaults to None.
+
+            max_bytes (Optional[int], optional): Maximum approximate size of entries kept
+                in process. If equals to None, size is not limited. Defaults to None.
+
+            ttl (Optional[float], optional): Entries that weren't accessed during ttl
+                seconds are evicted. If equals to None, entries don't expire. Defaults to None.
+
+            spill (Optional[MemoryBackend], optional): Storage for evicted entries (e.g.
+                DirectoryBackend). Spilled entries are moved back on access. Not required
+                if backend is set, since backend already stores all entries. If equals
+                to None, evicted entries are lost. Defaults to None.
+
+            write_behind (bool, optional): If set to True, changes are written to backend
+                asynchronously. Pending changes are written every sync_interval seconds,
+                on sync, flush, close and interpreter exit. Defaults to False.
+
+            sync_interval (float, optional): Interval between writes in write-behind mode
+                in seconds. Defaults to 1.
         """
-        self.memory = initial_data or {}
         self.directory = directory
-        if directory:
-            os.makedirs(directory, exist_ok=True)
-            
+        if backend is None and directory:
+            backend = DirectoryBackend(directory)
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.spill = spill
+        self.evictions = 0
+        self.expirations = 0
+        self.spilled = 0
+        self.write_behind = write_behind and backend is not None
+        self.sync_interval = sync_interval
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Any] = {}
+        self._writing: Dict[str, Any] = {}
+        self._sync_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._set_memory(initial_data or {})
+
+
+    def _set_memory(self, data: Dict[str, Any]) -> None:
+        self.memory = OrderedDict(data)
+        self._accessed: Dict[str, float] = dict.fromkeys(self.memory, time.monotonic())
+        self._sizes: Dict[str, int] = (
+            {k: approximate_size(v) for k, v in self.memory.items()}
+            if self.max_bytes is not None else {}
+        )
+        self.bytes = sum(self._sizes.values())
+        self._evict()
 
-    def _get_file_path(self, identifier: str) -> str:
-        """
-        Construct a file path for a given identifier
 
-        Args:
-            identifier (str): Indetifier that will be used.
+    def _put(self, identifier: str, state: Any) -> None:
+        self._remove(identifier)
+        self.memory[identifier] = state
+        self._accessed[identifier] = time.monotonic()
+        if self.max_bytes is not None:
+            size = approximate_size(state)
+            self._sizes[identifier] = size
+            self.bytes += size
+        self._evict()
 
-        Raises:
-            ValueError: If directory was not specified.
 
-        Returns:
-            str: Path to file for identifier.
+    def _remove(self, identifier: str) -> Any:
+        state = self.memory.pop(identifier, _MISSING)
+        self._accessed.pop(identifier, None)
+        self.bytes -= self._sizes.pop(identifier, 0)
+        return state
+
+
+    def _touch(self, identifier: str) -> None:
+        self.memory.move_to_end(identifier)
+        self._accessed[identifier] = time.monotonic()
+
+
+    def _evict(self) -> None:
         """
-        if not self.directory:
-            raise ValueError("No directory set for file-based storage.")
-        return os.path.join(self.directory, f"{identifier}.json")
+        Remove expired entries and least recently used entries over limits
+        """
+        if self.ttl is not None:
+            deadline = time.monotonic() - self.ttl
+            while self.memory:
+                identifier = next(iter(self.memory))
+                if self._accessed[identifier] > deadline:
+                    break
+                self._spill(identifier)
+                self.expirations += 1
+        while self.memory and (
+            (self.max_entries is not None and len(self.memory) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            self._spill(next(iter(self.memory)))
+            self.evictions += 1
+
+
+    def _spill(self, identifier: str) -> None:
+        state = self._remove(identifier)
+        if self.spill is not None and self.backend is None:
+            self.spill.set(identifier, state)
+            self.spilled += 1
 
 
     def add_store(self, identifier: str, state: Any) -> None:
@@ -62,16 +186,18 @@ class Memory:
 
             state (Any): State that will be associated with provided identifier.
         """
-        self.memory[identifier] = state
-        if self.directory:
-            file_path = self._get_file_path(identifier)
-            with open(file_path, 'w') as f:
-                json.dump(state, f)
+        with self._lock:
+            self._put(identifier, state)
+            if self.write_behind:
+                self._schedule(identifier, state)
+                return
+        if self.backend is not None:
+            self.backend.set(identifier, state)
 
 
     def retrieve_store(self, identifier: str) -> Any:
         """
-        Retrieve state by its identifier, either from memory or disk
+        Retrieve state by its identifier, either from memory or backend
 
         Args:
             identifier (str): Identifier that will be used.
@@ -82,45 +208,189 @@ class Memory:
         Returns:
             Any: Data associated with identifier.
         """
-        if identifier in self.memory:
-            return self.memory[identifier]
-        if self.directory:
-            file_path = self._get_file_path(identifier)
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    return json.load(f)
-        raise KeyError(f"No specified identifier found: {identifier}")
+        with self._lock:
+            if identifier in self.memory:
+                self._touch(identifier)
+                state = self.memory[identifier]
+                if self.ttl is not None:
+                    self._evict()
+                return state
+            if self.backend is not None:
+                state = self._pending.get(identifier, self._writing.get(identifier, _MISSING))
+                if state is _DELETED:
+                    raise KeyError(f"No specified identifier found: {identifier}")
+                if state is _MISSING:
+                    state = self.backend.get(identifier)
+            elif self.spill is not None:
+                state = self.spill.get(identifier)
+                self.spill.delete(identifier)
+            else:
+                raise KeyError(f"No specified identifier found: {identifier}")
+            self._put(identifier, state)
+            return state
 
 
     def delete_store(self, identifier: str) -> None:
         """
-        Delete a state by its identifier from both memory and disk
+        Delete a state by its identifier from both memory and backend
 
         Args:
             identifier (str): Identifier to delete.
         """
         # Remove from memory
-        if identifier in self.memory:
-            del self.memory[identifier]
+        with self._lock:
+            self._remove(identifier)
+            if self.write_behind:
+                self._schedule(identifier, _DELETED)
+                return
+        if self.spill is not None:
+            self.spill.delete(identifier)
         
-        # Remove from disk if applicable
-        if self.directory:
-            file_path = self._get_file_path(identifier)
-            if os.path.exists(file_path):
-                os.remove(file_path)
+        # Remove from backend if applicable
+        if self.backend is not None:
+            self.backend.delete(identifier)
     
 
     def flush(self) -> None:
         """
-        Clean memory
+        Clean memory and spilled entries. States stored in backend are kept.
+        Pending changes are written to backend
+        """
+        self.sync()
+        with self._lock:
+            self._set_memory({})
+        if self.spill is not None:
+            self.spill.clear()
+
+
+    def _schedule(self, identifier: str, state: Any) -> None:
+        """
+        Add change to pending writes and start background thread, if needed.
+        Copy of state is written, so that changes made after it was set
+        aren't persisted, like in synchronous mode
+        """
+        if state is not _DELETED:
+            try:
+                state = copy.deepcopy(state)
+            except Exception:
+                # objects that can't be copied are written as they are at sync time
+                pass
+        self._pending[identifier] = state
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(
+                target=_write_behind_loop,
+                args=(weakref.ref(self), self._wake, self.sync_interval),
+                name=f"{self.__class__.__name__}-write-behind",
+                daemon=True,
+            )
+            self._thread.start()
+            _write_behind_memories.add(self)
+
+
+    def sync(self) -> None:
         """
-        self.memory = {}
+        Write pending changes to backend. Is called by background thread in
+        write-behind mode, can be called manually to make changes durable
+        """
+        if self.backend is None:
+            return
+        with self._sync_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._writing, self._pending = self._pending, {}
+            try:
+                states = {k: v for k, v in self._writing.items() if v is not _DELETED}
+                if states:
+                    self.backend.set_many(states)
+                for identifier, state in self._writing.items():
+                    if state is _DELETED:
+                        self.backend.delete(identifier)
+            except BaseException:
+                # changes are kept unless they were replaced with newer ones
+                with self._lock:
+                    self._pending = {**self._writing, **self._pending}
+                raise
+            finally:
+                with self._lock:
+                    self._writing = {}
+
+
+    def close(self) -> None:
+        """
+        Stop background thread and write pending changes to backend
+        """
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._wake.clear()
+        self.sync()
+        _write_behind_memories.discard(self)
+
+
+    def __del__(self) -> None:
+        if getattr(self, "_pending", None):
+            try:
+                self.sync()
+            except Exception:
+                logging.getLogger(__name__).exception("Memory: write-behind sync failed")
+
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of changes waiting to be written to backend
+        """
+        return len(self._pending) + len(self._writing)
+
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Memory statistics: entries, bytes (approximate size of entries),
+        evictions, expirations, spilled and pending (changes not written to backend)
+        """
+        with self._lock:
+            size = (
+                self.bytes if self.max_bytes is not None
+                else sum(approximate_size(v) for v in self.memory.values())
+            )
+        return {
+            "entries": len(self.memory),
+            "bytes": size,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "spilled": self.spilled,
+            "pending": self.pending,
+        }
 
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.__dict__})"
 
 
+def _write_behind_loop(
+    memory_ref: "weakref.ref[Memory]", wake: threading.Event, interval: float
+) -> None:
+    """
+    Background writes of Memory. Memory is referenced weakly, so that
+    the thread stops when memory is garbage collected
+    """
+    while True:
+        wake.wait(interval)
+        memory = memory_ref()
+        if memory is None or memory._closed: # type: ignore
+            return
+        try:
+            memory.sync()
+        except Exception:
+            logging.getLogger(__name__).exception("Memory: write-behind sync failed")
+        del memory
+
+
 class MemorySetInstruction(Enum):
     """
     Set memory instruction
@@ -280,6 +550,7 @@ class DeleteMemory(Component):
             identifiers (Optional[List[str]], optional): Keys associated with data.
                 If equals to None, flushes memory. Defaults to None.
         """
+        super().__init__()
         self.identifiers = identifiers
 
 
@@ -316,7 +587,14 @@ class MemoryManager:
     def __init__(
         self, 
         path: Optional[str]=None, 
-        initial_data: Optional[Dict[str, Any]]=None
+        initial_data: Optional[Dict[str, Any]]=None,
+        backend: Optional[MemoryBackend]=None,
+        max_entries: Optional[int]=None,
+        max_bytes: Optional[int]=None,
+        ttl: Optional[float]=None,
+        spill: Optional[MemoryBackend]=None,
+        write_behind: bool=False,
+        sync_interval: float=1.,
     ) -> None:
         """
         Args:
@@ -324,8 +602,32 @@ class MemoryManager:
             
             initial_data (Optional[Dict[str, Any]], optional): Data for initialization 
                 of memory. Defaults to None.
+
+            backend (Optional[MemoryBackend], optional): Persistent storage of states.
+                Defaults to None.
+
+            max_entries (Optional[int], optional): Maximum number of entries kept in process.
+                Defaults to None.
+
+            max_bytes (Optional[int], optional): Maximum approximate size of entries kept
+                in process. Defaults to None.
+
+            ttl (Optional[float], optional): Time in seconds after which not accessed
+                entries are evicted. Defaults to None.
+
+            spill (Optional[MemoryBackend], optional): Storage for evicted entries.
+                Defaults to None.
+
+            write_behind (bool, optional): If set to True, changes are written to backend
+                by background thread. Defaults to False.
+
+            sync_interval (float, optional): Interval between background writes in seconds.
+                Defaults to 1.
         """
-        self.memory = Memory(path, initial_data)
+        self.memory = Memory(
+            path, initial_data, backend, max_entries, max_bytes, ttl, spill,
+            write_behind, sync_interval,
+        )
 
         
     def get(
@@ -395,7 +697,8 @@ class MemoryManager:
             set_key (str): Destination in memory.
         """
         self.memory.add_store(
-            set_key, getattr(register, get_key)
+            set_key, 
+            register.extract() if get_key == "__dict__" else getattr(register, get_key)
         )
 
 
@@ -418,5 +721,27 @@ class MemoryManager:
         self.memory.flush()
 
 
+    def sync(self) -> None:
+        """
+        Write pending changes to backend
+        """
+        self.memory.sync()
+
+
+    def close(self) -> None:
+        """
+        Stop background writes and write pending changes to backend
+        """
+        self.memory.close()
+
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Memory statistics. See Memory.stats
+        """
+        return self.memory.stats
+
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.__dict__})"
\ No newline at end of file
@@ -0,0 +1,481 @@
+from __future__ import annotations
+from typing import (
+    Any, Callable, Dict, IO, List, Optional, Set
+)
+from abc import ABC, abstractmethod
+from enum import Enum
+import io
+import json
+import os
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import threading
+import uuid
+
+class MemoryBackend(ABC):
+    """
+    Base class for storages of Memory data
+    """
+    @abstractmethod
+    def get(self, identifier: str) -> Any:
+        """
+        Get stored state
+
+        Args:
+            identifier (str): Identifier of state.
+
+        Raises:
+            KeyError: If identifier not found.
+
+        Returns:
+            Any: Stored state.
+        """
+        ...
+
+
+    @abstractmethod
+    def set(self, identifier: str, state: Any) -> None:
+        """
+        Store state
+
+        Args:
+            identifier (str): Identifier of state.
+
+            state (Any): State to store.
+        """
+        ...
+
+
+    def set_many(self, states: Dict[str, Any]) -> None:
+        """
+        Store several states
+
+        Args:
+            states (Dict[str, Any]): States by identifiers.
+        """
+        for identifier, state in states.items():
+            self.set(identifier, state)
+
+
+    @abstractmethod
+    def delete(self, identifier: str) -> None:
+        """
+        Delete state, if it exists
+
+        Args:
+            identifier (str): Identifier of state.
+        """
+        ...
+
+
+    @abstractmethod
+    def keys(self) -> List[str]:
+        """
+        Identifiers of stored states
+        """
+        ...
+
+
+    def clear(self) -> None:
+        """
+        Delete all states
+        """
+        for identifier in self.keys():
+            self.delete(identifier)
+
+
+    def close(self) -> None:
+        """
+        Release resources
+        """
+        pass
+
+
+    def __contains__(self, identifier: str) -> bool:
+        try:
+            self.get(identifier)
+        except KeyError:
+            return False
+        return True
+
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__dict__})"
+
+
+class DictBackend(MemoryBackend):
+    """
+    In-process storage. Can be shared between memories
+    """
+    def __init__(self, data: Optional[Dict[str, Any]]=None) -> None:
+        """
+        Args:
+            data (Optional[Dict[str, Any]], optional): Initial data. Defaults to None.
+        """
+        self.data: Dict[str, Any] = data if data is not None else {}
+
+
+    def get(self, identifier: str) -> Any:
+        try:
+            return self.data[identifier]
+        except KeyError:
+            raise KeyError(f"No specified identifier found: {identifier}")
+
+
+    def set(self, identifier: str, state: Any) -> None:
+        self.data[identifier] = state
+
+
+    def delete(self, identifier: str) -> None:
+        self.data.pop(identifier, None)
+
+
+    def keys(self) -> List[str]:
+        return list(self.data)
+
+
+    def clear(self) -> None:
+        self.data.clear()
+
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.data
+
+
+class MemorySerializer(Enum):
+    """
+    Format of states stored by DirectoryBackend
+    """
+    JSON = "json"
+    """
+    JSON file per identifier. Only JSON compatible states are supported
+    """
+    PICKLE = "pkl"
+    """
+    Pickle file per identifier. NumPy arrays are saved to .npy side-car files,
+    so that they are written without copies and can be memory mapped on load
+    """
+
+
+class _ArrayPickler(pickle.Pickler):
+    """
+    Replaces NumPy arrays with references to side-car files
+    """
+    def __init__(self, file: io.BytesIO, arrays: List[Any]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.arrays = arrays
+
+
+    def persistent_id(self, obj: Any) -> Any:
+        if (
+            type(obj).__module__ == "numpy"
+            and type(obj).__name__ == "ndarray"
+            and not obj.dtype.hasobject
+        ):
+            self.arrays.append(obj)
+            return ("ndarray", len(self.arrays) - 1)
+        return None
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """
+    Loads NumPy arrays referenced by _ArrayPickler
+    """
+    def __init__(
+        self, file: io.BytesIO, arrays_directory: str, mmap_mode: Optional[str]
+    ) -> None:
+        super().__init__(file)
+        self.arrays_directory = arrays_directory
+        self.mmap_mode = mmap_mode
+
+
+    def persistent_load(self, pid: Any) -> Any:
+        import numpy as np
+
+        kind, index = pid
+        if kind != "ndarray":
+            raise pickle.UnpicklingError(f"Unsupported persistent id: {kind}")
+        return np.load( # type: ignore
+            os.path.join(self.arrays_directory, f"{index}.npy"),
+            mmap_mode=self.mmap_mode, # type: ignore
+        )
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """
+    Write file, so that readers see either old or new content.
+    Data is written to temporary file in the same directory, that replaces
+    destination with os.replace.
+
+    Args:
+        path (str): Destination file.
+
+        data (bytes): Content.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class DirectoryBackend(MemoryBackend):
+    """
+    Stores each state in separate file in directory. Files are replaced atomically.
+    Each version of NumPy arrays is written to new directory. Replaced versions are 
+    removed after readers of this backend finish loading them.
+    """
+    def __init__(
+        self,
+        directory: str,
+        serializer: MemorySerializer=MemorySerializer.JSON,
+        mmap_mode: Optional[str]=None,
+    ) -> None:
+        """
+        Args:
+            directory (str): Path to directory.
+
+            serializer (MemorySerializer, optional): Files format.
+                Defaults to MemorySerializer.JSON.
+
+            mmap_mode (Optional[str], optional): Mode used to memory map NumPy arrays
+                stored with MemorySerializer.PICKLE (e.g. "r"). If equals to None, arrays
+                are read into memory. Defaults to None.
+        """
+        self.directory = directory
+        self.serializer = serializer
+        self.mmap_mode = mmap_mode
+        self._lock = threading.Lock()
+        self._readers: Dict[str, int] = {}
+        self._stale: Set[str] = set()
+        self._readers_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+
+    def _get_file_path(self, identifier: str) -> str:
+        return os.path.join(self.directory, f"{identifier}.{self.serializer.value}")
+
+
+    def _arrays_directory(self, identifier: str) -> str:
+        return os.path.join(self.directory, f"{identifier}.arrays")
+
+
+    def _arrays_versions(self, identifier: str) -> List[str]:
+        directory = self._arrays_directory(identifier)
+        if not os.path.isdir(directory):
+            return []
+        return [os.path.join(directory, name) for name in os.listdir(directory)]
+
+
+    def _dumps(self, identifier: str, state: Any) -> bytes:
+        if self.serializer == MemorySerializer.JSON:
+            return json.dumps(state).encode()
+
+        buffer = io.BytesIO()
+        arrays: List[Any] = []
+        _ArrayPickler(buffer, arrays).dump(state)
+        if not arrays:
+            return pickle.dumps((None, buffer.getvalue()), protocol=pickle.HIGHEST_PROTOCOL)
+
+        import numpy as np
+
+        # each version of arrays is written to new directory, so that
+        # the previous state stays readable until its file is replaced
+        arrays_directory = os.path.join(f"{identifier}.arrays", uuid.uuid4().hex)
+        os.makedirs(os.path.join(self.directory, arrays_directory))
+        for i, array in enumerate(arrays):
+            np.save(os.path.join(self.directory, arrays_directory, f"{i}.npy"), array) # type: ignore
+        return pickle.dumps(
+            (arrays_directory, buffer.getvalue()), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+
+    def _acquire_arrays(self, directory: str) -> bool:
+        with self._readers_lock:
+            if directory in self._stale or not os.path.isdir(directory):
+                return False
+            self._readers[directory] = self._readers.get(directory, 0) + 1
+            return True
+
+
+    def _release_arrays(self, directory: str) -> None:
+        with self._readers_lock:
+            self._readers[directory] -= 1
+            if self._readers[directory]:
+                return
+            del self._readers[directory]
+            if directory in self._stale:
+                self._stale.remove(directory)
+                shutil.rmtree(directory, ignore_errors=True)
+
+
+    def _remove_arrays(self, directories: List[str]) -> None:
+        with self._readers_lock:
+            for directory in directories:
+                if directory in self._readers:
+                    self._stale.add(directory)
+                else:
+                    shutil.rmtree(directory, ignore_errors=True)
+
+
+    def _read(self, identifier: str, load: Callable[[IO[bytes]], Any]) -> Any:
+        try:
+            with open(self._get_file_path(identifier), "rb") as f:
+                return load(f)
+        except FileNotFoundError:
+            raise KeyError(f"No specified identifier found: {identifier}")
+
+
+    def get(self, identifier: str) -> Any:
+        if self.serializer == MemorySerializer.JSON:
+            return self._read(identifier, json.load)
+        previous = None
+        while True:
+            arrays_directory, data = self._read(identifier, pickle.load)
+            if arrays_directory is None:
+                return pickle.loads(data)
+            directory = os.path.join(self.directory, arrays_directory)
+            if self._acquire_arrays(directory):
+                break
+            if arrays_directory == previous:
+                raise KeyError(f"Arrays of identifier not found: {identifier}")
+            # state was replaced after file was read, read new version
+            previous = arrays_directory
+        try:
+            return _ArrayUnpickler(io.BytesIO(data), directory, self.mmap_mode).load()
+        finally:
+            self._release_arrays(directory)
+
+
+    def set(self, identifier: str, state: Any) -> None:
+        with self._lock:
+            previous = self._arrays_versions(identifier)
+            atomic_write(self._get_file_path(identifier), self._dumps(identifier, state))
+            self._remove_arrays(previous)
+
+
+    def delete(self, identifier: str) -> None:
+        with self._lock:
+            file_path = self._get_file_path(identifier)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            self._remove_arrays(self._arrays_versions(identifier))
+            try:
+                os.rmdir(self._arrays_directory(identifier))
+            except OSError:
+                pass
+
+
+    def keys(self) -> List[str]:
+        suffix = f".{self.serializer.value}"
+        return [
+            name[:-len(suffix)]
+            for name in os.listdir(self.directory)
+            if name.endswith(suffix) and not name.startswith(".tmp-")
+        ]
+
+
+    def __contains__(self, identifier: str) -> bool:
+        return os.path.exists(self._get_file_path(identifier))
+
+
+class SQLiteBackend(MemoryBackend):
+    """
+    Stores pickled states in single SQLite database file
+    """
+    def __init__(
+        self,
+        path: str,
+        table: str="utca_memory",
+    ) -> None:
+        """
+        Args:
+            path (str): Path to database file. ":memory:" can be used for temporary storage.
+
+            table (str, optional): Table name. Defaults to "utca_memory".
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value BLOB)"
+            )
+
+
+    def get(self, identifier: str) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (identifier,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No specified identifier found: {identifier}")
+        return pickle.loads(row[0])
+
+
+    def set(self, identifier: str, state: Any) -> None:
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?)", (identifier, data)
+            )
+
+
+    def set_many(self, states: Dict[str, Any]) -> None:
+        """
+        Store several states in one transaction
+        """
+        rows = [
+            (k, pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL))
+            for k, v in states.items()
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?)", rows
+            )
+
+
+    def delete(self, identifier: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"DELETE FROM {self.table} WHERE key = ?", (identifier,)
+            )
+
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [
+                row[0] for row in
+                self._connection.execute(f"SELECT key FROM {self.table}")
+            ]
+
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
+
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+    def __contains__(self, identifier: str) -> bool:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT 1 FROM {self.table} WHERE key = ?", (identifier,)
+            ).fetchone() is not None
+
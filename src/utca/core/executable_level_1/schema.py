@@ -1,9 +1,11 @@
 from __future__ import annotations
 from abc import ABC
 from typing import (
-    Optional, TypeVar, Any, Dict
+    Optional, TypeVar, Any, Dict, Mapping
 )
+from collections import ChainMap
 from enum import Enum
+from weakref import WeakKeyDictionary, WeakSet
 
 from pydantic import BaseModel
 
@@ -53,6 +55,17 @@ class Transformable:
             Dict[str, Any]: Data packed in the class
         """
         return self.__dict__
+
+
+    def view(self) -> Mapping[str, Any]:
+        """
+        Complete data without copying. Unlike extract, forks aren't merged. 
+        Returned mapping shouldn't be modified.
+
+        Returns:
+            Mapping[str, Any]: Data packed in the class.
+        """
+        return self.__dict__
     
 
     def update(self, data: Dict[str, Any]) -> None:
@@ -60,8 +73,9 @@ class Transformable:
         Add data
 
         Args:
-            data (Dict[str, Any]): Data to add
+            data (Dict[str, Any]): Add data
         """
+        self.detach()
         self.__dict__.update(data)
 
     
@@ -84,6 +98,58 @@ class Transformable:
         return self.__dict__.get(key, default)
 
 
+    def fork(self) -> Transformable:
+        """
+        Create copy that reads data of this instance instead of copying it.
+        Changes of the copy are stored separately and don't affect this instance.
+        While copy exists, changes of this instance are made on a copy of its data 
+        (see detach), so they don't affect the fork.
+
+        Returns:
+            Transformable: Copy.
+        """
+        fork = TransformableFork(self.view())
+        forks = _forks.get(self)
+        if forks is None:
+            forks = _forks[self] = WeakSet()
+        forks.add(fork)
+        return fork
+
+
+    def detach(self) -> None:
+        """
+        Replace data with its copy if forks read it, so that changes of this
+        instance don't affect forks. Called before modifications.
+        """
+        if _forks and _forks.pop(self, None):
+            self.__dict__ = dict(self.__dict__)
+
+
+    @staticmethod
+    def overlay(state: Dict[str, Any]) -> Transformable:
+        """
+        Create Transformable that reads state without modifying it. 
+        State shouldn't be modified while Transformable is used.
+
+        Args:
+            state (Dict[str, Any]): Data to wrapp.
+
+        Returns:
+            Transformable: Wrapped data.
+        """
+        return TransformableFork(state)
+
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.detach()
+        object.__setattr__(self, name, value)
+
+
+    def __delattr__(self, name: str) -> None:
+        self.detach()
+        object.__delattr__(self, name)
+
+
     def __getitem__(self, key: str) -> Any:
         return self.__dict__[key]
 
@@ -92,6 +158,98 @@ class Transformable:
         return f"{self.__class__.__name__}({self.__dict__})"
 
 
+_forks: WeakKeyDictionary[Transformable, WeakSet[Transformable]] = WeakKeyDictionary()
+"""
+Live forks of Transformables
+"""
+
+
+class TransformableFork(Transformable):
+    """
+    Transformable layered over data it was created from. Own data is stored 
+    in instance dict, missing keys are read from base, so that forks 
+    are created without copying. Base data is merged on first request of 
+    complete data (see extract), after which fork behaves as regular Transformable.
+    Instance dict (__dict__) contains only own data, use extract, view, get or 
+    attributes to read data.
+    """
+    __slots__ = ("__base",)
+
+    def __init__(self, base: Mapping[str, Any]) -> None:
+        """
+        Args:
+            base (Mapping[str, Any]): Data to read from. Is not modified.
+        """
+        super().__init__()
+        self.__base: Optional[Mapping[str, Any]] = base
+
+
+    def extract(self) -> Dict[str, Any]:
+        own = self.__dict__
+        if self.__base is None:
+            return own
+        data = dict(self.__base)
+        data.update(own)
+        self.__dict__ = data
+        self.__base = None
+        return data
+
+
+    def view(self) -> Mapping[str, Any]:
+        own = self.__dict__
+        if self.__base is None:
+            return own
+        if not own:
+            return self.__base
+        return ChainMap(own, self.__base) # type: ignore
+    
+
+    def flush(self) -> None:
+        super().flush()
+        self.__base = None
+
+
+    def get(self, key: str, default: Any=None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+    def __getitem__(self, key: str) -> Any:
+        own = self.__dict__
+        if key in own or self.__base is None:
+            return own[key]
+        return self.__base[key]
+
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name == "_TransformableFork__base":
+            raise AttributeError(name)
+        base = self.__base
+        if base is None or name not in base:
+            raise AttributeError(name)
+        return base[name]
+
+
+    def __delattr__(self, name: str) -> None:
+        if self.__base is not None and name in self.__base:
+            self.extract()
+        super().__delattr__(name)
+
+
+    def __copy__(self) -> Transformable:
+        return self.fork()
+
+
+    def __reduce__(self) -> Any:
+        return Transformable, (self.extract(),)
+
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.view())})"
+
+
 class Config(BaseModel, ABC):
     """
     Base config class
@@ -133,4 +291,26 @@ class ReplacingScope(Enum):
     """
     Rewrite data completely
     """
+
+
+class ValidationMode(Enum):
+    FULL = 0
+    """
+    Validate input and output
+    """
+    INPUT_ONLY = 1
+    """
+    Validate input, output is dumped without validation 
+    (see Executable.build_output)
+    """
+    TRUST = 2
+    """
+    Input is constructed without validation (pydantic model_construct), 
+    output is dumped without validation (see Executable.build_output)
+    """
+    SAMPLED = 3
+    """
+    Validate input and output of one in validation_sample_rate executions, 
+    other executions use TRUST mode
+    """
     
\ No newline at end of file
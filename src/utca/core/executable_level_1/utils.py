@@ -1,4 +1,71 @@
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, cast
+import sys
 import uuid
 
+from utca.core.executable_level_1.schema import Transformable
+
 def generate_unique_state():
-    return str(uuid.uuid4())
\ No newline at end of file
+    return str(uuid.uuid4())
+
+
+def approximate_size(data: Any, _seen: Optional[Set[int]]=None) -> int:
+    """
+    Approximate size of data in bytes. Arrays and tensors are measured by their
+    buffers, containers are measured recursively.
+
+    Args:
+        data (Any): Data to measure.
+
+    Returns:
+        int: Size in bytes.
+    """
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if hasattr(data, "element_size") and hasattr(data, "nelement"):
+        return data.element_size() * data.nelement()
+
+    seen = _seen if _seen is not None else set()
+    if id(data) in seen:
+        return 0
+    if isinstance(data, Mapping):
+        seen.add(id(data))
+        return sys.getsizeof(data) + sum(
+            approximate_size(k, seen) + approximate_size(v, seen) 
+            for k, v in cast(Dict[Any, Any], data).items()
+        )
+    if isinstance(data, (list, tuple, set)):
+        seen.add(id(data))
+        return sys.getsizeof(data) + sum(
+            approximate_size(i, seen) for i in cast(Iterable[Any], data)
+        )
+    if isinstance(data, Transformable):
+        seen.add(id(data))
+        return approximate_size(data.view(), seen)
+    if hasattr(data, "__dict__") and not isinstance(data, type):
+        seen.add(id(data))
+        return approximate_size(vars(data), seen)
+    return sys.getsizeof(data)
+
+
+def copy_containers(data: Any) -> Any:
+    """
+    Copy dicts, lists, tuples and sets recursively. Other objects 
+    (e.g. tensors, arrays, strings) are shared with original data.
+
+    Args:
+        data (Any): Data to copy.
+
+    Returns:
+        Any: Copy of data.
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return {k: copy_containers(v) for k, v in data.items()}
+    if data_type is list:
+        return [copy_containers(i) for i in data]
+    if data_type is tuple:
+        return tuple(copy_containers(i) for i in data)
+    if data_type is set:
+        return set(data)
+    return data
@@ -0,0 +1,211 @@
+from __future__ import annotations
+from typing import (
+    Any, Dict, List, Optional, Tuple, cast
+)
+from concurrent.futures import Future
+import threading
+import time
+
+from utca.core.executable_level_1.interpreter import Evaluator
+from utca.core.executable_level_1.schema import Input, Output
+from utca.core.predictor_level_2.predictor import Predictor
+
+class _BatchRequest:
+    """
+    Pending request of BatchPredictor
+    """
+    def __init__(
+        self, inputs: Dict[str, Any], batch_key: str, evaluator: Evaluator
+    ) -> None:
+        value = inputs[batch_key]
+        self.inputs = inputs
+        self.evaluator = evaluator
+        self.is_scalar = not isinstance(value, list)
+        self.values: List[Any] = [value] if self.is_scalar else cast(List[Any], value)
+        self.signature = _signature(inputs, batch_key)
+        self.future: Future[Dict[str, Any]] = Future()
+
+
+    @property
+    def size(self) -> int:
+        return len(self.values)
+
+
+def _signature(inputs: Dict[str, Any], batch_key: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Requests can be batched together only if all parameters except batch_key are equal
+    """
+    return tuple(sorted(
+        (k, repr(v)) for k, v in inputs.items() if k != batch_key
+    ))
+
+
+class BatchPredictor(Predictor[Input, Output]):
+    """
+    Dynamic batching wrapper for predictors. Inputs from concurrent callers are
+    collected for up to max_wait_ms or max_batch_size items and passed to the
+    wrapped predictor as one call. Results are scattered back to each caller.
+
+    Wrapped predictor should accept list of items under batch_key and return
+    list of results with the same length under output_key
+    (e.g. TransformersPipeline, TokenSearcherPredictor, GLiNERPredictor).
+    """
+    def __init__(
+        self,
+        predictor: Predictor[Input, Output],
+        batch_key: str="inputs",
+        output_key: str="output",
+        max_batch_size: int=32,
+        max_wait_ms: float=5.,
+        name: Optional[str]=None,
+    ) -> None:
+        """
+        Args:
+            predictor (Predictor[Input, Output]): Wrapped predictor.
+
+            batch_key (str, optional): Input key that holds batched items. Defaults to "inputs".
+
+            output_key (str, optional): Output key that holds results of batched items.
+                Defaults to "output".
+
+            max_batch_size (int, optional): Maximum number of items in one call.
+                Defaults to 32.
+
+            max_wait_ms (float, optional): Maximum time in milliseconds to wait for
+                other callers before call. Defaults to 5.
+
+            name (Optional[str], optional): Name for identification.
+                If equals to None, class name will be used. Defaults to None.
+        """
+        super().__init__(
+            input_class=predictor.input_class,
+            output_class=predictor.output_class,
+            name=name,
+        )
+        self.predictor = predictor
+        self.batch_key = batch_key
+        self.output_key = output_key
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: List[_BatchRequest] = []
+        self._queued_items = 0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+
+    def invoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        """
+        Add input to the next batch and wait for result
+
+        Args:
+            input_data (Input): Validated input.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            Dict[str, Any]: Result of execution.
+        """
+        request = _BatchRequest(input_data.extract(), self.batch_key, evaluator)
+        with self._condition:
+            self._ensure_worker()
+            self._queue.append(request)
+            self._queued_items += request.size
+            self._condition.notify_all()
+        return request.future.result()
+
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._loop, name=f"{self.name}.worker", daemon=True
+            )
+            self._worker.start()
+
+
+    def _loop(self) -> None:
+        while True:
+            self.process_batch(self._collect())
+
+
+    def _collect(self) -> List[_BatchRequest]:
+        """
+        Wait for requests and take the next batch from queue
+        """
+        with self._condition:
+            while not self._queue:
+                self._condition.wait()
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            while self._queued_items < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch: List[_BatchRequest] = []
+            items = 0
+            for request in self._queue:
+                if batch and items + request.size > self.max_batch_size:
+                    break
+                batch.append(request)
+                items += request.size
+            del self._queue[:len(batch)]
+            self._queued_items -= items
+            return batch
+
+
+    def process_batch(self, batch: List[_BatchRequest]) -> None:
+        """
+        Group compatible requests, call wrapped predictor and set results
+
+        Args:
+            batch (List[_BatchRequest]): Requests to process.
+        """
+        groups: Dict[Tuple[Tuple[str, str], ...], List[_BatchRequest]] = {}
+        for request in batch:
+            groups.setdefault(request.signature, []).append(request)
+
+        for requests in groups.values():
+            try:
+                results = self._call(requests)
+            except Exception as e:
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+            for request, result in zip(requests, results):
+                request.future.set_result(result)
+
+
+    def _call(self, requests: List[_BatchRequest]) -> List[Dict[str, Any]]:
+        values = [v for request in requests for v in request.values]
+        merged = {
+            **requests[0].inputs,
+            self.batch_key: values,
+        }
+        result = self.predictor.invoke(
+            self.predictor.validate_input(merged), requests[0].evaluator
+        )
+        outputs = result[self.output_key]
+        if not isinstance(outputs, list) or len(cast(List[Any], outputs)) != len(values):
+            raise ValueError(
+                f"{self.name}: Expected list of {len(values)} results "
+                f"under '{self.output_key}' key."
+            )
+
+        results: List[Dict[str, Any]] = []
+        offset = 0
+        for request in requests:
+            chunk = cast(List[Any], outputs)[offset:offset + request.size]
+            offset += request.size
+            results.append({
+                **result,
+                self.output_key: chunk[0] if request.is_scalar else chunk,
+            })
+        return results
+
+
+    @property
+    def config(self) -> Any:
+        """
+        Wrapped predictor configuration
+        """
+        return self.predictor.config
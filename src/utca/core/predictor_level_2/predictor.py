@@ -1,8 +1,11 @@
-from typing import Any
+from __future__ import annotations
+from typing import Any, Dict, Optional, TYPE_CHECKING
 from abc import abstractmethod
 
 from utca.core.executable_level_1.executable import Executable
 from utca.core.executable_level_1.schema import Input, Output
+if TYPE_CHECKING:
+    from utca.core.predictor_level_2.registry import PredictorRegistry
 
 class Predictor(Executable[Input, Output]):
     """
@@ -14,4 +17,49 @@ class Predictor(Executable[Input, Output]):
         """
         Predictor configuration
         """
-        ...
\ No newline at end of file
+        ...
+
+
+    @classmethod
+    def default_arguments(cls) -> Dict[str, Any]:
+        """
+        Values that predictor uses instead of arguments equal to None (e.g. default
+        configuration). Used by PredictorRegistry to compare arguments of shared predictors
+
+        Returns:
+            Dict[str, Any]: Values by argument names.
+        """
+        return {}
+
+
+    @classmethod
+    def shared(
+        cls,
+        *args: Any,
+        lazy: bool=False,
+        registry: Optional[PredictorRegistry]=None,
+        **kwargs: Any,
+    ) -> Predictor[Any, Any]:
+        """
+        Get predictor shared between tasks. Predictor is created once for 
+        each combination of arguments. Predictor state changed through one task
+        (e.g. set_validation_mode) affects all tasks that share it.
+
+        Args:
+            *args (Any): Positional arguments of predictor.
+
+            lazy (bool, optional): If set to True, predictor is created on first use.
+                Defaults to False.
+
+            registry (Optional[PredictorRegistry], optional): Registry that stores predictors.
+                If equals to None, process-wide registry is used. Defaults to None.
+
+            **kwargs (Any): Keyword arguments of predictor.
+
+        Returns:
+            Predictor[Any, Any]: Shared predictor.
+        """
+        from utca.core.predictor_level_2.registry import default_registry
+        if registry is None:
+            registry = default_registry
+        return registry.get(cls, *args, lazy=lazy, **kwargs)
@@ -0,0 +1,303 @@
+from __future__ import annotations
+from typing import (
+    Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Type, cast
+)
+from enum import Enum
+import inspect
+import threading
+
+from pydantic import BaseModel
+
+from utca.core.executable_level_1.interpreter import Evaluator
+from utca.core.executable_level_1.schema import Input, Output
+from utca.core.predictor_level_2.predictor import Predictor
+
+class LazyPredictor(Predictor[Input, Output]):
+    """
+    Creates wrapped predictor on first use, so that model is loaded only
+    if it is executed
+    """
+    def __init__(
+        self,
+        factory: Callable[[], Predictor[Input, Output]],
+        input_class: Type[Input],
+        output_class: Type[Output],
+        name: Optional[str]=None,
+    ) -> None:
+        """
+        Args:
+            factory (Callable[[], Predictor[Input, Output]]): Creates wrapped predictor.
+
+            input_class (Type[Input]): Class for input validation.
+
+            output_class (Type[Output]): Class for output validation.
+
+            name (Optional[str], optional): Name for identification.
+                If equals to None, class name will be used. Defaults to None.
+        """
+        super().__init__(
+            input_class=input_class,
+            output_class=output_class,
+            name=name,
+        )
+        self.factory = factory
+        self._predictor: Optional[Predictor[Input, Output]] = None
+        self._lock = threading.Lock()
+
+
+    @property
+    def predictor(self) -> Predictor[Input, Output]:
+        """
+        Wrapped predictor. Created on first access
+        """
+        if self._predictor is None:
+            with self._lock:
+                if self._predictor is None:
+                    self._predictor = self.factory()
+        return self._predictor
+
+
+    @property
+    def loaded(self) -> bool:
+        """
+        If set to True, wrapped predictor is created
+        """
+        return self._predictor is not None
+
+
+    def invoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        return self.predictor.invoke(input_data, evaluator)
+
+
+    def invoke_batch(
+        self, input_data: List[Input], evaluator: Evaluator
+    ) -> List[Dict[str, Any]]:
+        return self.predictor.invoke_batch(input_data, evaluator)
+
+
+    async def ainvoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        return await self.predictor.ainvoke(input_data, evaluator)
+
+
+    @property
+    def config(self) -> Any:
+        """
+        Wrapped predictor configuration
+        """
+        return self.predictor.config
+
+
+class _Identity:
+    """
+    Compares wrapped object by identity
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Hashable representation of predictor argument. Configurations are compared
+    by values, other objects (e.g. models) by identity
+    """
+    if value is None or isinstance(value, (str, int, float, bool, bytes, Enum, type)):
+        return value
+    if isinstance(value, BaseModel):
+        return (type(value), tuple(
+            (k, _freeze(getattr(value, k))) for k in type(value).model_fields
+        ))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted(
+            ((repr(k), _freeze(v)) for k, v in cast(Dict[Any, Any], value).items()),
+            key=lambda i: i[0]
+        )))
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(_freeze(v) for v in cast(List[Any], value)))
+    return _Identity(value)
+
+
+def _resolve_arguments(
+    predictor_class: Type[Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Arguments of predictor by names with defaults applied. Arguments equal to None
+    are replaced by values that predictor uses instead (see Predictor.default_arguments),
+    so that equivalent calls get the same key
+    """
+    bound = inspect.signature(predictor_class).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    for argument, value in predictor_class.default_arguments().items():
+        if arguments.get(argument) is None:
+            arguments[argument] = value
+    return arguments
+
+
+def _argument_default(predictor_class: Type[Any], argument: str) -> Any:
+    parameter = inspect.signature(predictor_class.__init__).parameters.get(argument)
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        raise ValueError(
+            f"{predictor_class.__name__}: {argument} should be provided for lazy loading."
+        )
+    return parameter.default
+
+
+def model_size(predictor: Any, max_depth: int=4) -> int:
+    """
+    Size of parameters and buffers of torch modules used by predictor in bytes.
+    Modules are searched in attributes of predictor (e.g. model, pipeline.model, cfg.model).
+
+    Args:
+        predictor (Any): Predictor.
+
+        max_depth (int, optional): Maximum depth of attributes search. Defaults to 4.
+
+    Returns:
+        int: Size in bytes.
+    """
+    seen: Set[int] = set()
+    tensors: Set[Tuple[Any, ...]] = set()
+    size = 0
+    level = [predictor]
+    for _ in range(max_depth + 1):
+        next_level: List[Any] = []
+        for obj in level:
+            if id(obj) in seen or isinstance(obj, (str, bytes, int, float, type)):
+                continue
+            seen.add(id(obj))
+            if callable(getattr(obj, "parameters", None)) and callable(getattr(obj, "buffers", None)):
+                for tensor in (*obj.parameters(), *obj.buffers()):
+                    key = (tensor.device.type, tensor.data_ptr())
+                    if key not in tensors:
+                        tensors.add(key)
+                        size += tensor.element_size() * tensor.nelement()
+                continue
+            if isinstance(obj, LazyPredictor):
+                if obj.loaded:
+                    next_level.append(obj.predictor)
+                continue
+            if isinstance(obj, dict):
+                next_level.extend(cast(Dict[Any, Any], obj).values())
+            elif isinstance(obj, (list, tuple)):
+                next_level.extend(cast(List[Any], obj))
+            elif hasattr(obj, "__dict__"):
+                next_level.extend(vars(obj).values())
+        level = next_level
+    return size
+
+
+class PredictorRegistry:
+    """
+    Stores predictors created for each combination of predictor class and arguments,
+    so that model weights are loaded once and predictors are shared between tasks
+    """
+    def __init__(self) -> None:
+        self._predictors: Dict[Hashable, Predictor[Any, Any]] = {}
+        self._lock = threading.RLock()
+
+
+    def get(
+        self,
+        predictor_class: Type[Predictor[Any, Any]],
+        *args: Any,
+        lazy: bool=False,
+        **kwargs: Any,
+    ) -> Predictor[Any, Any]:
+        """
+        Get stored predictor or create new one. Arguments are normalized before
+        comparison: positional and keyword arguments are matched by names, defaults
+        are applied and arguments equal to None are replaced by default configurations.
+
+        Args:
+            predictor_class (Type[Predictor[Any, Any]]): Class of predictor.
+
+            *args (Any): Positional arguments of predictor.
+
+            lazy (bool, optional): If set to True, new predictor is wrapped in LazyPredictor
+                and created on first use. Defaults to False.
+
+            **kwargs (Any): Keyword arguments of predictor.
+
+        Returns:
+            Predictor[Any, Any]: Shared predictor.
+        """
+        key = (predictor_class, _freeze(_resolve_arguments(predictor_class, args, kwargs)))
+        with self._lock:
+            predictor = self._predictors.get(key)
+            if predictor is None:
+                if lazy:
+                    predictor = LazyPredictor(
+                        lambda: predictor_class(*args, **kwargs),
+                        input_class=kwargs.get("input_class")
+                            or _argument_default(predictor_class, "input_class"),
+                        output_class=kwargs.get("output_class")
+                            or _argument_default(predictor_class, "output_class"),
+                        name=kwargs.get("name") or predictor_class.__name__,
+                    )
+                else:
+                    predictor = predictor_class(*args, **kwargs)
+                self._predictors[key] = predictor
+            return predictor
+
+
+    def release(self, predictor: Predictor[Any, Any]) -> None:
+        """
+        Remove predictor from registry. Model is unloaded when predictor
+        is not used by any task.
+
+        Args:
+            predictor (Predictor[Any, Any]): Predictor to remove.
+        """
+        with self._lock:
+            for key, stored in list(self._predictors.items()):
+                if stored is predictor:
+                    del self._predictors[key]
+
+
+    def clear(self) -> None:
+        """
+        Remove all predictors from registry
+        """
+        with self._lock:
+            self._predictors.clear()
+
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Memory usage of stored predictors
+
+        Returns:
+            List[Dict[str, Any]]: For each predictor: "name", "class", "loaded" and
+                "model_bytes" (size of parameters and buffers of torch modules).
+        """
+        with self._lock:
+            items = list(self._predictors.items())
+        return [
+            {
+                "name": predictor.name,
+                "class": cast(Type[Any], key[0]).__name__, # type: ignore
+                "loaded": not isinstance(predictor, LazyPredictor) or predictor.loaded,
+                "model_bytes": model_size(predictor),
+            }
+            for key, predictor in items
+        ]
+
+
+    def __len__(self) -> int:
+        return len(self._predictors)
+
+
+default_registry = PredictorRegistry()
+"""
+Process-wide registry used by Predictor.shared
+"""
@@ -1,5 +1,5 @@
 from typing import (
-    Any, Dict, Type, Optional
+    Any, Dict, List, Type, Optional
 )
 
 from utca.core.executable_level_1.component import Component
@@ -73,7 +73,7 @@ class Task(
         Returns:
             Transformable: Result of execution.
         """
-        return component(state, evaluator) if component else state
+        return evaluator.call_component(component, state) if component else state
 
 
     def invoke(
@@ -95,7 +95,7 @@ class Task(
             self._preprocess,
             evaluator
         )
-        predicts = self.predictor(processed_input, evaluator)
+        predicts = evaluator.call_component(self.predictor, processed_input)
         return self.process(
             predicts,
             self._postprocess,
@@ -103,6 +103,87 @@ class Task(
         ).extract()
 
 
+    def invoke_batch(
+        self, input_data: List[Input], evaluator: Evaluator
+    ) -> List[Dict[str, Any]]:
+        """
+        Task main logic for batch of inputs. Preprocessing and postprocessing are
+        executed for each input, predictor is executed with batch of all inputs.
+
+        Args:
+            input_data (List[Input]): Validated inputs.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            List[Dict[str, Any]]: Results of execution for each input.
+        """
+        processed_inputs = [
+            self.process(i.generate_transformable(), self._preprocess, evaluator)
+            for i in input_data
+        ]
+        predicts = self.predictor.execute_batch(
+            [p.extract() for p in processed_inputs], evaluator
+        )
+        return [
+            self.process(
+                self.predictor.set_result(state, result),
+                self._postprocess,
+                evaluator
+            ).extract()
+            for state, result in zip(processed_inputs, predicts)
+        ]
+
+
+    async def aprocess(
+        self, 
+        state: Transformable, 
+        component: Optional[Component],
+        evaluator: Evaluator
+    ) -> Transformable:
+        """
+        Execute Component asynchronously
+
+        Args:
+            state (Transformable): Current data.
+
+            component (Optional[Component]): Component.
+            
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            Transformable: Result of execution.
+        """
+        return await evaluator.acall_component(component, state) if component else state
+
+
+    async def ainvoke(
+        self, input_data: Input, evaluator: Evaluator
+    ) -> Dict[str, Any]:
+        """
+        Task main logic in asynchronous context
+
+        Args:
+            input_data (Input): Validated input data.
+
+            evaluator (Evaluator): Evaluator in context of which executed.
+
+        Returns:
+            Dict[str, Any]: Result of execution.
+        """
+        processed_input = await self.aprocess(
+            input_data.generate_transformable(), 
+            self._preprocess,
+            evaluator
+        )
+        predicts = await evaluator.acall_component(self.predictor, processed_input)
+        return (await self.aprocess(
+            predicts,
+            self._postprocess,
+            evaluator
+        )).extract()
+
+
 class NERTask(
     Task[
         Input, NEROutputType,
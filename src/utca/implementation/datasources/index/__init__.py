@@ -4,10 +4,26 @@ from utca.implementation.datasources.index.actions import (
     IndexSearch,
     GetTextsByIndexes,
 )
+from utca.implementation.datasources.index.index import (
+    IndexConfig,
+    IndexMetric,
+    IndexType,
+    VectorIndex,
+    NumpyIndex,
+    FaissIndex,
+    create_index,
+)
 
 __all__ = [
     "IndexCreate",
     "IndexData",
     "IndexSearch",
     "GetTextsByIndexes",
-]
\ No newline at end of file
+    "IndexConfig",
+    "IndexMetric",
+    "IndexType",
+    "VectorIndex",
+    "NumpyIndex",
+    "FaissIndex",
+    "create_index",
+]
@@ -1,35 +1,41 @@
 from typing import Any, Dict, Optional
-import importlib.util
 
 from utca.core.executable_level_1.actions import Action
+from utca.implementation.datasources.index.index import (
+    IndexConfig, create_index
+)
 
 class IndexCreate(Action[Any, Dict[str, Any]]):
     """
-    Create FAISS index
+    Create vector index. FAISS is used if installed, otherwise NumPy index
+    with exact search
 
     Args:
         input_data (Any): Ignored.
 
     Returns:
         Dict[str, Any]: Expected keys:
-            'index' (faiss.IndexFlatL2): Created index.
+            'index' (VectorIndex): Created index.
     """
     def __init__(
         self, 
         dataset_dimensions: int=1024,
+        config: Optional[IndexConfig]=None,
         name: Optional[str]=None,
     ) -> None:
         """
         Args:
             dataset_dimensions (int, optional): Dataset dimension. Defaults to 1024.
 
+            config (Optional[IndexConfig], optional): Index type, metric and search parameters.
+                If equals to None, exact search with L2 distance will be used. Defaults to None.
+
             name (Optional[str], optional): name (Optional[str], optional): Name for identification.
                 If equals to None, class name will be used. Defaults to None.
         """
-        if not importlib.util.find_spec("faiss"):
-            raise ImportError("To use index FAISS required. To install faiss package use:\npip install faiss-cpu\nOR\npip install faiss-gpu")
         super().__init__(name)
         self.dataset_dimensions = dataset_dimensions
+        self.config = config
 
 
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -39,11 +45,10 @@ class IndexCreate(Action[Any, Dict[str, Any]]):
 
         Returns:
             Dict[str, Any]: Expected keys:
-                'index' (faiss.IndexFlatL2): Created index.
+                'index' (VectorIndex): Created index.
         """
-        import faiss # type: ignore
         return {
-            "index": faiss.IndexFlatL2(self.dataset_dimensions)
+            "index": create_index(self.dataset_dimensions, self.config)
         }
     
 
@@ -55,7 +60,7 @@ class IndexData(Action[Dict[str, Any], None]):
         """
         Args:
             input_data (Dict[str, Any]): Expected keys:
-                'index' (faiss.IndexFlatL2): Index to update;
+                'index' (VectorIndex): Index to update;
 
                 'dataset' (Any): Data to index;
         """
@@ -82,7 +87,7 @@ class IndexSearch(Action[Dict[str, Any], Dict[str, Any]]):
         """
         Args:
             input_data (Dict[str, Any]): Expected keys:
-                'index' (faiss.IndexFlatL2): Index to search;
+                'index' (VectorIndex): Index to search;
 
                 'query' (Any): Query to search;
 
@@ -0,0 +1,421 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+from abc import ABC, abstractmethod
+from enum import Enum
+import importlib.util
+import warnings
+
+import numpy as np
+import numpy.typing as npt
+
+from utca.core.executable_level_1.schema import Config
+
+class IndexType(Enum):
+    """
+    Type of vector index
+    """
+    FLAT = "flat"
+    """
+    Exact search over all vectors
+    """
+    IVF_FLAT = "ivf_flat"
+    """
+    Inverted file: vectors are clustered and only nprobe nearest clusters
+    are searched. Requires training
+    """
+    IVF_PQ = "ivf_pq"
+    """
+    Inverted file with product quantized vectors. Uses less memory than IVF_FLAT
+    at the cost of accuracy. Requires training
+    """
+    HNSW = "hnsw"
+    """
+    Hierarchical navigable small world graph. Doesn't require training
+    """
+
+
+class IndexMetric(Enum):
+    """
+    Distance metric of vector index
+    """
+    L2 = "l2"
+    """
+    Squared euclidean distance. Lower is closer
+    """
+    INNER_PRODUCT = "inner_product"
+    """
+    Inner product. Higher is closer. Equals to cosine similarity for normalized vectors
+    """
+
+
+class IndexConfig(Config):
+    """
+    Vector index configuration
+
+    Args:
+        index_type (IndexType, optional): Type of index. Defaults to IndexType.FLAT.
+
+        metric (IndexMetric, optional): Distance metric. Defaults to IndexMetric.L2.
+
+        normalize (bool, optional): If set to True, added and searched vectors are
+            L2 normalized. Use with IndexMetric.INNER_PRODUCT for cosine similarity.
+            Defaults to False.
+
+        nlist (int, optional): Number of clusters of IVF indexes. Defaults to 1024.
+
+        nprobe (int, optional): Number of clusters searched by IVF indexes. Higher
+            values increase recall and search time. Defaults to 16.
+
+        train_size (int, optional): Number of first added vectors used for training of IVF
+            indexes. Vectors are buffered until train_size is reached or index is searched.
+            Defaults to 100_000.
+
+        pq_m (int, optional): Number of subquantizers of IVF_PQ index. Dimension
+            should be divisible by pq_m. Defaults to 16.
+
+        pq_bits (int, optional): Bits per subquantizer code of IVF_PQ index. Defaults to 8.
+
+        hnsw_m (int, optional): Number of neighbours of HNSW graph nodes. Defaults to 32.
+
+        ef_construction (int, optional): Search depth of HNSW index during adding.
+            Defaults to 200.
+
+        ef_search (int, optional): Search depth of HNSW index. Higher values increase recall
+            and search time. Defaults to 64.
+
+        use_faiss (bool, optional): If set to False or FAISS isn't installed, NumPy index
+            with exact search is used. Defaults to True.
+    """
+    index_type: IndexType=IndexType.FLAT
+    metric: IndexMetric=IndexMetric.L2
+    normalize: bool=False
+    nlist: int=1024
+    nprobe: int=16
+    train_size: int=100_000
+    pq_m: int=16
+    pq_bits: int=8
+    hnsw_m: int=32
+    ef_construction: int=200
+    ef_search: int=64
+    use_faiss: bool=True
+
+
+def _as_matrix(vectors: Any) -> npt.NDArray[np.float32]:
+    return np.ascontiguousarray(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+
+
+def _normalize(vectors: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+class VectorIndex(ABC):
+    """
+    Base class of vector indexes. Follows FAISS interface (add, search, ntotal),
+    so that indexes can be used by IndexData and IndexSearch actions
+    """
+    def __init__(self, dimensions: int, config: Optional[IndexConfig]=None) -> None:
+        """
+        Args:
+            dimensions (int): Dimension of vectors.
+
+            config (Optional[IndexConfig], optional): Configuration. If equals to None,
+                default configuration will be used. Defaults to None.
+        """
+        self.dimensions = dimensions
+        self.config = config or IndexConfig()
+
+
+    def prepare(self, vectors: Any) -> npt.NDArray[np.float32]:
+        """
+        Convert vectors to contiguous float32 matrix and normalize them, if required
+        """
+        matrix = _as_matrix(vectors)
+        if matrix.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Expected vectors of dimension {self.dimensions}, got {matrix.shape[1]}."
+            )
+        return _normalize(matrix) if self.config.normalize else matrix
+
+
+    @abstractmethod
+    def add(self, vectors: Any) -> None:
+        """
+        Add vectors to index. Vectors are identified by order of adding
+
+        Args:
+            vectors (Any): Matrix of vectors.
+        """
+        ...
+
+
+    @abstractmethod
+    def search(
+        self, queries: Any, k: int
+    ) -> Tuple[npt.NDArray[np.float32], npt.NDArray[np.int64]]:
+        """
+        Find nearest vectors
+
+        Args:
+            queries (Any): Matrix of query vectors.
+
+            k (int): Number of results per query.
+
+        Returns:
+            Tuple[npt.NDArray[np.float32], npt.NDArray[np.int64]]: Distances (or similarities
+                for IndexMetric.INNER_PRODUCT) and indexes of found vectors. Missing results
+                have -1 index.
+        """
+        ...
+
+
+    @property
+    @abstractmethod
+    def ntotal(self) -> int:
+        """
+        Number of indexed vectors
+        """
+        ...
+
+
+    @abstractmethod
+    def reset(self) -> None:
+        """
+        Remove all vectors
+        """
+        ...
+
+
+class NumpyIndex(VectorIndex):
+    """
+    Exact search implemented with NumPy. Used if FAISS isn't installed
+    """
+    max_block_size: int = 1 << 24
+    """
+    Maximum number of distances computed at once
+    """
+
+    def __init__(self, dimensions: int, config: Optional[IndexConfig]=None) -> None:
+        super().__init__(dimensions, config)
+        self.reset()
+
+
+    def reset(self) -> None:
+        self._chunks: List[npt.NDArray[np.float32]] = []
+        self._vectors: npt.NDArray[np.float32] = np.empty((0, self.dimensions), np.float32)
+        self._norms: npt.NDArray[np.float32] = np.empty((0,), np.float32)
+
+
+    @property
+    def vectors(self) -> npt.NDArray[np.float32]:
+        """
+        Indexed vectors
+        """
+        if self._chunks:
+            self._vectors = np.concatenate([self._vectors, *self._chunks])
+            self._norms = np.einsum("ij,ij->i", self._vectors, self._vectors)
+            self._chunks = []
+        return self._vectors
+
+
+    def add(self, vectors: Any) -> None:
+        self._chunks.append(self.prepare(vectors))
+
+
+    @property
+    def ntotal(self) -> int:
+        return len(self._vectors) + sum(len(c) for c in self._chunks)
+
+
+    def search(
+        self, queries: Any, k: int
+    ) -> Tuple[npt.NDArray[np.float32], npt.NDArray[np.int64]]:
+        queries = self.prepare(queries)
+        vectors = self.vectors
+        inner_product = self.config.metric == IndexMetric.INNER_PRODUCT
+        distances = np.full(
+            (len(queries), k), -np.inf if inner_product else np.inf, np.float32
+        )
+        indexes = np.full((len(queries), k), -1, np.int64)
+        found = min(k, len(vectors))
+        if not found:
+            return distances, indexes
+
+        step = max(1, self.max_block_size // len(vectors))
+        for start in range(0, len(queries), step):
+            block = queries[start:start + step]
+            scores = block @ vectors.T
+            if not inner_product:
+                # negative squared distances without constant norm of query
+                scores = 2 * scores - self._norms
+            top = np.argpartition(-scores, found - 1, axis=1)[:, :found]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            if not inner_product:
+                top_scores = np.einsum("ij,ij->i", block, block)[:, None] - top_scores
+            distances[start:start + step, :found] = top_scores
+            indexes[start:start + step, :found] = top
+        return distances, indexes
+
+
+class FaissIndex(VectorIndex):
+    """
+    FAISS index. Indexes that require training are trained on first
+    train_size added vectors
+    """
+    def __init__(self, dimensions: int, config: Optional[IndexConfig]=None) -> None:
+        super().__init__(dimensions, config)
+        self.reset()
+
+
+    def build(self) -> Any:
+        """
+        Create FAISS index from configuration
+
+        Returns:
+            Any: FAISS index.
+        """
+        import faiss # type: ignore
+
+        config = self.config
+        metric = (
+            faiss.METRIC_INNER_PRODUCT
+            if config.metric == IndexMetric.INNER_PRODUCT else faiss.METRIC_L2
+        )
+        if config.index_type == IndexType.HNSW:
+            index = faiss.IndexHNSWFlat(self.dimensions, config.hnsw_m, metric)
+            index.hnsw.efConstruction = config.ef_construction
+            index.hnsw.efSearch = config.ef_search
+            return index
+        if config.index_type == IndexType.FLAT:
+            return (
+                faiss.IndexFlatIP(self.dimensions)
+                if metric == faiss.METRIC_INNER_PRODUCT
+                else faiss.IndexFlatL2(self.dimensions)
+            )
+        # quantizer should live as long as index
+        self.quantizer = (
+            faiss.IndexFlatIP(self.dimensions)
+            if metric == faiss.METRIC_INNER_PRODUCT
+            else faiss.IndexFlatL2(self.dimensions)
+        )
+        if config.index_type == IndexType.IVF_FLAT:
+            index = faiss.IndexIVFFlat(self.quantizer, self.dimensions, config.nlist, metric)
+        else:
+            index = faiss.IndexIVFPQ(
+                self.quantizer, self.dimensions, config.nlist,
+                config.pq_m, config.pq_bits, metric,
+            )
+        index.nprobe = config.nprobe
+        return index
+
+
+    def reset(self) -> None:
+        self.index = self.build()
+        self._pending: List[npt.NDArray[np.float32]] = []
+        self._pending_size = 0
+
+
+    @property
+    def is_trained(self) -> bool:
+        return bool(self.index.is_trained)
+
+
+    min_points_per_cluster: int = 39
+    """
+    Minimal number of training vectors per cluster recommended by FAISS
+    """
+
+    def train(self) -> None:
+        """
+        Train index on buffered vectors and add them to index. If there are
+        less than min_points_per_cluster vectors per cluster, number of clusters
+        is reduced
+        """
+        if not self._pending:
+            return
+        vectors = np.concatenate(self._pending)
+        self._pending = []
+        self._pending_size = 0
+        if not self.is_trained:
+            train_vectors = vectors[:self.config.train_size]
+            is_pq = self.config.index_type == IndexType.IVF_PQ
+            minimal = self.min_points_per_cluster * max(
+                self.config.nlist, 1 << self.config.pq_bits if is_pq else 0
+            )
+            if len(train_vectors) < minimal:
+                warnings.warn(
+                    f"{len(train_vectors)} vectors are not enough to train index with "
+                    f"nlist={self.config.nlist}. Number of clusters is reduced."
+                )
+                clusters = max(1, len(train_vectors) // self.min_points_per_cluster)
+                update: Dict[str, Any] = {"nlist": min(self.config.nlist, clusters)}
+                if is_pq:
+                    update["pq_bits"] = min(
+                        self.config.pq_bits, max(1, int(np.log2(max(2, clusters))))
+                    )
+                self.config = self.config.model_copy(update=update)
+                self.index = self.build()
+            self.index.train(train_vectors)
+        self.index.add(vectors)
+
+
+    def add(self, vectors: Any) -> None:
+        vectors = self.prepare(vectors)
+        if self.is_trained:
+            self.index.add(vectors)
+            return
+        self._pending.append(vectors)
+        self._pending_size += len(vectors)
+        if self._pending_size >= self.config.train_size:
+            self.train()
+
+
+    @property
+    def ntotal(self) -> int:
+        return int(self.index.ntotal) + self._pending_size
+
+
+    def search(
+        self, queries: Any, k: int
+    ) -> Tuple[npt.NDArray[np.float32], npt.NDArray[np.int64]]:
+        if self._pending:
+            self.train()
+        queries = self.prepare(queries)
+        if not self.is_trained:
+            # nothing was added, untrained IVF index can't be searched
+            inner_product = self.config.metric == IndexMetric.INNER_PRODUCT
+            missing = np.finfo(np.float32).max
+            return (
+                np.full((len(queries), k), -missing if inner_product else missing, np.float32),
+                np.full((len(queries), k), -1, np.int64),
+            )
+        distances, indexes = self.index.search(queries, k)
+        return distances, indexes.astype(np.int64, copy=False)
+
+
+def create_index(dimensions: int, config: Optional[IndexConfig]=None) -> VectorIndex:
+    """
+    Create vector index. If FAISS isn't installed, NumPy index with exact
+    search is used
+
+    Args:
+        dimensions (int): Dimension of vectors.
+
+        config (Optional[IndexConfig], optional): Configuration. If equals to None,
+            default configuration will be used. Defaults to None.
+
+    Returns:
+        VectorIndex: Created index.
+    """
+    config = config or IndexConfig()
+    if config.use_faiss and importlib.util.find_spec("faiss"):
+        return FaissIndex(dimensions, config)
+    if config.use_faiss and config.index_type != IndexType.FLAT:
+        warnings.warn(
+            "FAISS is not installed, exact NumPy search will be used. To install faiss "
+            "package use:\npip install faiss-cpu\nOR\npip install faiss-gpu"
+        )
+    return NumpyIndex(dimensions, config)
@@ -1,74 +1,162 @@
-from utca.implementation.predictors.transformers_predictor.transformers_model import (
-    TransformersModel, TransformersGenerativeModel
-)
-from utca.implementation.predictors.transformers_predictor.schema import (
-    TransformersModelConfig,
-    TransformersPipelineConfig,
-    TransformersImageClassificationModelInput,
-    TransformersTextToSpeechInput,
-    TransformersTextToSpeechOutput,
-    TransformersChartsAndPlotsModelInput,
-    TransformersVisualQandAInput,
-    TransformersImageModelInput,
-    TransformersEmbeddingInput,
-    TransformersEmbeddingOutput,
-    TransformersEntityLinkingInput,
-    TransformersEntityLinkingOutput,
-    TransformersTextualQandAInput,
-    TransformersTextualQandAOutput,
-    TransformersBasicInput,
-    TransformersLogitsOutput,
-    TransformersBasicOutput,
-    TransformersDETROutput,
-    TransformersIdsInput,
-)
-from utca.implementation.predictors.transformers_predictor.transformers_pipeline import (
-    TransformersPipeline,
-)
-from utca.implementation.predictors.comprehend_it.predictor import (
-    ComprehendItPredictor,
-)
-from utca.implementation.predictors.comprehend_it.schema import (
-    ComprehendItPredictorConfig,
-)
-from utca.implementation.predictors.token_searcher.predictor import (
-    TokenSearcherPredictor,
-)
-from utca.implementation.predictors.token_searcher.schema import (
-    TokenSearcherPredictorConfig,
-)
-from utca.implementation.predictors.gliner_predictor.predictor import (
-    GLiNERPredictor,
-)
-from utca.implementation.predictors.gliner_predictor.schema import (
-    GLiNERPredictorConfig,
-    GLiNERPredictorInput,
-    GLiNERPredictorOutput,
-)
-from utca.implementation.predictors.openai_chat_gpt.predictor import (
-    OpenAIChatGPTPredictor,
-)
-from utca.implementation.predictors.openai_chat_gpt.schema import (
-    ChatGPTConfig,
-    ChatGPTInput,
-    ChatCompletionOutput,
-    ChatCompletionStreamOutput,
-)
-from utca.implementation.predictors.openai_whisper.predictor import (
-    OpenAIWhisperPredictor,
-)
-from utca.implementation.predictors.openai_whisper.schema import (
-    WhisperModelConfig,
-    WhisperTranscriptionConfig,
-    WhisperInput,
-    WhisperOutput,
-)
+from typing import TYPE_CHECKING
+
+from utca.implementation.utils import lazy_import
+
+if TYPE_CHECKING:
+    from utca.implementation.predictors.transformers_predictor.transformers_model import (
+        TransformersModel, TransformersGenerativeModel
+    )
+    from utca.implementation.predictors.transformers_predictor.schema import (
+        TransformersModelConfig,
+        TransformersPipelineConfig,
+        InferenceProfile,
+        GradMode,
+        TransformersImageClassificationModelInput,
+        TransformersTextToSpeechInput,
+        TransformersTextToSpeechOutput,
+        TransformersChartsAndPlotsModelInput,
+        TransformersVisualQandAInput,
+        TransformersImageModelInput,
+        TransformersEmbeddingInput,
+        TransformersEmbeddingOutput,
+        TransformersEntityLinkingInput,
+        TransformersEntityLinkingOutput,
+        TransformersTextualQandAInput,
+        TransformersTextualQandAOutput,
+        TransformersBasicInput,
+        TransformersLogitsOutput,
+        TransformersBasicOutput,
+        TransformersDETROutput,
+        TransformersIdsInput,
+    )
+    from utca.implementation.predictors.transformers_predictor.transformers_pipeline import (
+        TransformersPipeline,
+    )
+    from utca.implementation.predictors.comprehend_it.predictor import (
+        ComprehendItPredictor,
+    )
+    from utca.implementation.predictors.comprehend_it.schema import (
+        ComprehendItPredictorConfig,
+    )
+    from utca.implementation.predictors.token_searcher.predictor import (
+        TokenSearcherPredictor,
+    )
+    from utca.implementation.predictors.token_searcher.schema import (
+        TokenSearcherPredictorConfig,
+        TokenSearcherONNXPredictorConfig,
+    )
+    from utca.implementation.predictors.token_searcher.onnx_model import (
+        ONNXModelForTokenClassification,
+    )
+    from utca.implementation.predictors.gliner_predictor.predictor import (
+        GLiNERPredictor,
+    )
+    from utca.implementation.predictors.gliner_predictor.schema import (
+        GLiNERPredictorConfig,
+        GLiNERPredictorInput,
+        GLiNERPredictorOutput,
+    )
+    from utca.implementation.predictors.openai_chat_gpt.predictor import (
+        OpenAIChatGPTPredictor,
+    )
+    from utca.implementation.predictors.openai_chat_gpt.schema import (
+        ChatGPTConfig,
+        ChatGPTInput,
+        ChatCompletionOutput,
+        ChatCompletionStreamOutput,
+    )
+    from utca.implementation.predictors.openai_whisper.predictor import (
+        OpenAIWhisperPredictor,
+    )
+    from utca.implementation.predictors.openai_whisper.schema import (
+        WhisperModelConfig,
+        WhisperTranscriptionConfig,
+        WhisperInput,
+        WhisperOutput,
+    )
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    "utca.implementation.predictors.transformers_predictor.transformers_model": [
+        "TransformersModel",
+        "TransformersGenerativeModel",
+    ],
+    "utca.implementation.predictors.transformers_predictor.schema": [
+        "TransformersModelConfig",
+        "TransformersPipelineConfig",
+        "InferenceProfile",
+        "GradMode",
+        "TransformersImageClassificationModelInput",
+        "TransformersTextToSpeechInput",
+        "TransformersTextToSpeechOutput",
+        "TransformersChartsAndPlotsModelInput",
+        "TransformersVisualQandAInput",
+        "TransformersImageModelInput",
+        "TransformersEmbeddingInput",
+        "TransformersEmbeddingOutput",
+        "TransformersEntityLinkingInput",
+        "TransformersEntityLinkingOutput",
+        "TransformersTextualQandAInput",
+        "TransformersTextualQandAOutput",
+        "TransformersBasicInput",
+        "TransformersLogitsOutput",
+        "TransformersBasicOutput",
+        "TransformersDETROutput",
+        "TransformersIdsInput",
+    ],
+    "utca.implementation.predictors.transformers_predictor.transformers_pipeline": [
+        "TransformersPipeline",
+    ],
+    "utca.implementation.predictors.comprehend_it.predictor": [
+        "ComprehendItPredictor",
+    ],
+    "utca.implementation.predictors.comprehend_it.schema": [
+        "ComprehendItPredictorConfig",
+    ],
+    "utca.implementation.predictors.token_searcher.predictor": [
+        "TokenSearcherPredictor",
+    ],
+    "utca.implementation.predictors.token_searcher.schema": [
+        "TokenSearcherPredictorConfig",
+        "TokenSearcherONNXPredictorConfig",
+    ],
+    "utca.implementation.predictors.token_searcher.onnx_model": [
+        "ONNXModelForTokenClassification",
+    ],
+    "utca.implementation.predictors.gliner_predictor.predictor": [
+        "GLiNERPredictor",
+    ],
+    "utca.implementation.predictors.gliner_predictor.schema": [
+        "GLiNERPredictorConfig",
+        "GLiNERPredictorInput",
+        "GLiNERPredictorOutput",
+    ],
+    "utca.implementation.predictors.openai_chat_gpt.predictor": [
+        "OpenAIChatGPTPredictor",
+    ],
+    "utca.implementation.predictors.openai_chat_gpt.schema": [
+        "ChatGPTConfig",
+        "ChatGPTInput",
+        "ChatCompletionOutput",
+        "ChatCompletionStreamOutput",
+    ],
+    "utca.implementation.predictors.openai_whisper.predictor": [
+        "OpenAIWhisperPredictor",
+    ],
+    "utca.implementation.predictors.openai_whisper.schema": [
+        "WhisperModelConfig",
+        "WhisperTranscriptionConfig",
+        "WhisperInput",
+        "WhisperOutput",
+    ],
+})
 
 __all__ = [
     "TransformersModel",
     "TransformersGenerativeModel",
     "TransformersModelConfig",
     "TransformersPipelineConfig",
+    "InferenceProfile",
+    "GradMode",
     "TransformersImageClassificationModelInput",
     "TransformersTextToSpeechInput",
     "TransformersTextToSpeechOutput",
@@ -89,6 +177,8 @@ __all__ = [
 
     "TokenSearcherPredictor", 
     "TokenSearcherPredictorConfig",
+    "TokenSearcherONNXPredictorConfig",
+    "ONNXModelForTokenClassification",
 
     "ComprehendItPredictor",
     "ComprehendItPredictorConfig",
@@ -112,4 +202,4 @@ __all__ = [
     "WhisperTranscriptionConfig",
     "WhisperInput",
     "WhisperOutput",
-]
\ No newline at end of file
+]
@@ -56,6 +56,13 @@ class GLiNERPredictor(
         )
 
 
+    @classmethod
+    def default_arguments(cls) -> Dict[str, Any]:
+        return {
+            "cfg": GLiNERPredictorConfig(),
+        }
+
+
     def invoke(self, input_data: GLiNERPredictorInput, evaluator: Evaluator) -> Dict[str, Any]:
         """
         Call pipeline
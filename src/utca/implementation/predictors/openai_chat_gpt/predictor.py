@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional, Type, cast
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from openai.types.chat.chat_completion import ChatCompletion
 
 from utca.core.executable_level_1.interpreter import Evaluator
@@ -23,6 +23,7 @@ class OpenAIChatGPTPredictor(
         self,
         chat_cfg: ChatGPTConfig, 
         openai_client: Optional[OpenAI]=None,
+        async_openai_client: Optional[AsyncOpenAI]=None,
         input_class: Type[Input]=ChatGPTInput,
         output_class: Type[Output]=ChatCompletionOutput,
         name: Optional[str]=None,
@@ -34,6 +35,10 @@ class OpenAIChatGPTPredictor(
             openai_client (Optional[OpenAI], optional): OpenAI client that will be used.
                 If equals to None, default OpenAI client will be used. Defaults to None.
 
+            async_openai_client (Optional[AsyncOpenAI], optional): Client that will be used 
+                in asynchronous execution. If equals to None, synchronous client will be 
+                executed in thread pool. Defaults to None.
+
             input_class (Type[Input], optional): Class for input validation.
                 Defaults to ChatGPTInput.
             
@@ -49,6 +54,7 @@ class OpenAIChatGPTPredictor(
             name=name,
         )
         self.client = openai_client or OpenAI()
+        self.async_client = async_openai_client
         self.cfg = chat_cfg
 
 
@@ -63,6 +69,21 @@ class OpenAIChatGPTPredictor(
                 "stream"
             )
         return cast(ChatCompletion, res).model_dump()
+
+
+    async def ainvoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+        if self.async_client is None:
+            return await super().ainvoke(input_data, evaluator)
+        res = await self.async_client.chat.completions.create( # type: ignore
+            **self.cfg.extract(),
+            **input_data.extract(),
+        )
+        if self.cfg.stream == True:
+            return ensure_dict(
+                res,
+                "stream"
+            )
+        return cast(ChatCompletion, res).model_dump()
     
 
     @property
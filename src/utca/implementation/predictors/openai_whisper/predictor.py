@@ -56,6 +56,14 @@ class OpenAIWhisperPredictor(
         self.transcription_cfg = transcription_cfg or WhisperTranscriptionConfig()
 
 
+    @classmethod
+    def default_arguments(cls) -> Dict[str, Any]:
+        return {
+            "model_cfg": WhisperModelConfig(),
+            "transcription_cfg": WhisperTranscriptionConfig(),
+        }
+
+
     def invoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
         return self.model.transcribe( # type: ignore
             **self.transcription_cfg.transcription_config,
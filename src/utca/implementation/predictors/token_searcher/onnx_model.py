@@ -0,0 +1,204 @@
+from typing import Any, Dict, List, Optional
+import copy
+import inspect
+import os
+
+import torch
+from transformers import ( # type: ignore
+    PretrainedConfig,
+    PreTrainedModel,
+)
+from transformers.modeling_outputs import TokenClassifierOutput # type: ignore
+
+class ONNXModelForTokenClassification(PreTrainedModel):
+    """
+    Token classification model executed by ONNX Runtime on CPU. Can be passed to
+    transformers pipelines instead of PyTorch model, so that pre- and postprocessing
+    are not changed. Requires onnxruntime package.
+    """
+    main_input_name = "input_ids"
+    _supports_sdpa = True
+    """
+    Attention is executed by ONNX Runtime, so any implementation is accepted
+    """
+
+    def __init__(
+        self,
+        config: PretrainedConfig,
+        path: str,
+        session_options: Optional[Any]=None,
+        providers: Optional[List[str]]=None,
+    ) -> None:
+        """
+        Args:
+            config (PretrainedConfig): Configuration of exported model.
+
+            path (str): Path to ONNX model.
+
+            session_options (Optional[Any], optional): onnxruntime.SessionOptions. If equals
+                to None, default options will be used. Defaults to None.
+
+            providers (Optional[List[str]], optional): ONNX Runtime execution providers.
+                If equals to None, CPUExecutionProvider will be used. Defaults to None.
+        """
+        import onnxruntime # type: ignore
+
+        super().__init__(copy.deepcopy(config))
+        self.path = path
+        self.session = onnxruntime.InferenceSession(
+            path,
+            sess_options=session_options,
+            providers=providers or ["CPUExecutionProvider"],
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+
+    @property
+    def device(self) -> torch.device:
+        return torch.device("cpu")
+
+
+    def forward(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: Optional[torch.Tensor]=None,
+        token_type_ids: Optional[torch.Tensor]=None,
+        **kwargs: Any,
+    ) -> TokenClassifierOutput:
+        inputs = {
+            "input_ids": input_ids,
+            "attention_mask": (
+                attention_mask if attention_mask is not None
+                else torch.ones_like(input_ids)
+            ),
+            "token_type_ids": (
+                token_type_ids if token_type_ids is not None
+                else torch.zeros_like(input_ids)
+            ),
+        }
+        logits = self.session.run(
+            ["logits"],
+            {
+                name: inputs[name].cpu().numpy()
+                for name in self.input_names
+            }
+        )[0]
+        return TokenClassifierOutput(logits=torch.from_numpy(logits)) # type: ignore
+
+
+    @staticmethod
+    def export(
+        model: PreTrainedModel,
+        path: str,
+        quantize: bool=False,
+        opset: int=17,
+    ) -> str:
+        """
+        Export PyTorch token classification model to ONNX
+
+        Args:
+            model (PreTrainedModel): Model to export.
+
+            path (str): Destination file.
+
+            quantize (bool, optional): If set to True, weights are quantized to int8
+                with dynamic quantization. Quantized model is saved next to exported one
+                with ".int8.onnx" suffix. Defaults to False.
+
+            opset (int, optional): ONNX opset version. Defaults to 17.
+
+        Returns:
+            str: Path to model that should be loaded.
+        """
+        input_names = ["input_ids", "attention_mask"]
+        if (
+            "token_type_ids" in inspect.signature(model.forward).parameters
+            and getattr(model.config, "type_vocab_size", 0) > 0
+        ):
+            input_names.append("token_type_ids")
+        dummy: Dict[str, torch.Tensor] = {
+            name: torch.ones((2, 8), dtype=torch.long)
+            if name != "token_type_ids" else torch.zeros((2, 8), dtype=torch.long)
+            for name in input_names
+        }
+        axes = {0: "batch", 1: "sequence"}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        model.eval()
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                (),
+                path,
+                kwargs=dummy,
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes={name: axes for name in [*input_names, "logits"]},
+                opset_version=opset,
+                dynamo=False,
+            )
+        return ONNXModelForTokenClassification.quantize(path) if quantize else path
+
+
+    @staticmethod
+    def quantized_path(path: str) -> str:
+        return f"{os.path.splitext(path)[0]}.int8.onnx"
+
+
+    @staticmethod
+    def quantize(path: str) -> str:
+        """
+        Quantize weights of ONNX model to int8 with dynamic quantization
+
+        Args:
+            path (str): Path to ONNX model.
+
+        Returns:
+            str: Path to quantized model.
+        """
+        from onnxruntime.quantization import ( # type: ignore
+            quantize_dynamic, QuantType
+        )
+        quantized_path = ONNXModelForTokenClassification.quantized_path(path)
+        quantize_dynamic(path, quantized_path, weight_type=QuantType.QInt8)
+        return quantized_path
+
+
+    @classmethod
+    def from_model(
+        cls,
+        model: PreTrainedModel,
+        path: str,
+        quantize: bool=False,
+        opset: int=17,
+        session_options: Optional[Any]=None,
+        providers: Optional[List[str]]=None,
+    ) -> "ONNXModelForTokenClassification":
+        """
+        Export model if it wasn't exported before and load it with ONNX Runtime
+
+        Args:
+            model (PreTrainedModel): Model to export.
+
+            path (str): Path to exported model. If file exists, export is skipped.
+
+            quantize (bool, optional): Use int8 dynamically quantized model. Defaults to False.
+
+            opset (int, optional): ONNX opset version. Defaults to 17.
+
+            session_options (Optional[Any], optional): onnxruntime.SessionOptions.
+                Defaults to None.
+
+            providers (Optional[List[str]], optional): ONNX Runtime execution providers.
+                Defaults to None.
+
+        Returns:
+            ONNXModelForTokenClassification: Loaded model.
+        """
+        target = cls.quantized_path(path) if quantize else path
+        if not os.path.exists(target):
+            if quantize and os.path.exists(path):
+                cls.quantize(path)
+            else:
+                cls.export(model, path, quantize, opset)
+        return cls(model.config, target, session_options, providers)
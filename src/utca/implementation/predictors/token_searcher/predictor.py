@@ -1,4 +1,4 @@
-from typing import Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from utca.core.executable_level_1.schema import Input, Output
 from utca.implementation.predictors.transformers_predictor.transformers_pipeline import (
@@ -46,4 +46,11 @@ class TokenSearcherPredictor(
             input_class=input_class,
             output_class=output_class,
             name=name,
-        )
\ No newline at end of file
+        )
+
+
+    @classmethod
+    def default_arguments(cls) -> Dict[str, Any]:
+        return {
+            "cfg": TokenSearcherPredictorConfig(),
+        }
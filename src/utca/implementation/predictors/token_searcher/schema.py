@@ -1,6 +1,9 @@
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, List, Tuple, Union, Optional
+import os
 
+from huggingface_hub.constants import HF_HOME # type: ignore
 from transformers import ( # type: ignore
+    AutoModelForTokenClassification,
     PreTrainedModel,
     TFPreTrainedModel,
 )
@@ -15,6 +18,9 @@ from utca.implementation.predictors.transformers_predictor.schema import (
 from utca.implementation.predictors.token_searcher.token_searcher_pipeline import (
     TokenClassificationPipeline
 )
+from utca.implementation.predictors.token_searcher.onnx_model import (
+    ONNXModelForTokenClassification
+)
 
 class TokenSearcherPredictorConfig(TransformersPipelineConfig):
     """
@@ -34,10 +40,84 @@ class TokenSearcherPredictorConfig(TransformersPipelineConfig):
     }
 
 
+class TokenSearcherONNXPredictorConfig(TokenSearcherPredictorConfig):
+    """
+    Configuration of knowledgator/UTC models pipeline, that executes model with 
+    ONNX Runtime on CPU. Model is exported to ONNX once and reused from onnx_path.
+    Pre- and postprocessing are the same as in PyTorch pipeline. Requires onnxruntime package.
+
+    Arguments:
+        onnx_path (Optional[str], optional): Path to exported model. If file doesn't exist,
+            model will be exported. If equals to None, model is exported to 
+            Hugging Face cache directory (see default_onnx_path), that requires model 
+            to be specified by name. Defaults to None.
+
+        quantize (bool, optional): If set to True, weights are quantized to int8 with 
+            dynamic quantization. Defaults to False.
+
+        opset (int, optional): ONNX opset version used for export. Defaults to 17.
+
+        providers (Optional[List[str]], optional): ONNX Runtime execution providers.
+            If equals to None, CPUExecutionProvider will be used. Defaults to None.
+    """
+    onnx_path: Optional[str]=None
+    quantize: bool=False
+    opset: int=17
+    providers: Optional[List[str]]=None
+
+
+    @property
+    def default_onnx_path(self) -> str:
+        """
+        Path to exported model in Hugging Face cache directory, that is the same 
+        for equal model names, revisions and opset versions. Quantized model is 
+        saved next to it.
+
+        Raises:
+            ValueError: If model isn't specified by name.
+        """
+        if not isinstance(self.model, str):
+            raise ValueError(
+                "onnx_path is required for models that aren't specified by name."
+            )
+        return os.path.join(
+            HF_HOME, 
+            "utca", 
+            "onnx", 
+            self.model.replace("/", "--"),
+            self.revision or "main",
+            f"opset{self.opset}",
+            "model.onnx",
+        )
+
+
+    @property
+    def pipeline_config(self) -> Dict[str, Any]:
+        tmp = super().pipeline_config
+        for k in ("onnx_path", "quantize", "opset", "providers"):
+            tmp.pop(k)
+        onnx_path = self.onnx_path or self.default_onnx_path
+        model = self.model
+        if isinstance(model, str):
+            tmp["tokenizer"] = tmp["tokenizer"] or model
+            model = AutoModelForTokenClassification.from_pretrained( # type: ignore
+                model, revision=self.revision, token=self.token
+            )
+        tmp["model"] = ONNXModelForTokenClassification.from_model(
+            model, # type: ignore
+            onnx_path,
+            quantize=self.quantize,
+            opset=self.opset,
+            providers=self.providers,
+        )
+        return tmp
+
+
 class TokenSearcherPredictorInput(TransformersBasicInput):
-    inputs: List[str]
+    inputs: List[Union[str, Tuple[str, str]]]
     """
-    Text inputs
+    Text inputs or (prompt, text) pairs. Parts of pairs are tokenized separately
+    and concatenated by pipeline, tokenization of repeated parts is cached
     """
 
 
@@ -1,6 +1,7 @@
 import types
 import warnings
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -18,6 +19,7 @@ if is_tf_available():
     import tensorflow as tf # type: ignore
     from transformers.models.auto.modeling_tf_auto import TF_MODEL_FOR_TOKEN_CLASSIFICATION_MAPPING_NAMES # type: ignore
 if is_torch_available():
+    import torch
     from transformers.models.auto.modeling_auto import MODEL_FOR_TOKEN_CLASSIFICATION_MAPPING_NAMES # type: ignore
 
 
@@ -130,16 +132,43 @@ class TokenClassificationPipeline(ChunkPipeline):
 
     default_input_names = "sequences"
 
-    def __init__(self, args_parser=TokenClassificationArgumentHandler(), *args: Any, **kwargs: Any):
+    def __init__(
+        self, 
+        args_parser=TokenClassificationArgumentHandler(), 
+        *args: Any, 
+        sort_by_length: bool=True, 
+        vectorized_postprocess: bool=True,
+        **kwargs: Any
+    ):
+        """
+        Args:
+            sort_by_length (bool, optional): If set to True, lists of inputs are sorted by length 
+                before batching, so that batches contain inputs of similar length and less padding 
+                is computed. Outputs are returned in original order. Can be overridden per call.
+                Defaults to True.
+
+            vectorized_postprocess (bool, optional): If set to True, entities are built with 
+                array operations (see postprocess_scores) instead of per token dicts. 
+                Results are the same. Defaults to True.
+        """
         super().__init__(*args, **kwargs)
+        self.sort_by_length = sort_by_length
+        self.vectorized_postprocess = vectorized_postprocess
+        self._label_tables: Optional[Tuple[List[str], List[str], np.ndarray, np.ndarray]] = None
         self.check_model_type(
             TF_MODEL_FOR_TOKEN_CLASSIFICATION_MAPPING_NAMES
             if self.framework == "tf"
-            else MODEL_FOR_TOKEN_CLASSIFICATION_MAPPING_NAMES
+            else {
+                **MODEL_FOR_TOKEN_CLASSIFICATION_MAPPING_NAMES,
+                "onnx": "ONNXModelForTokenClassification",
+            }
         )
 
         self._basic_tokenizer = BasicTokenizer(do_lower_case=False)
         self._args_parser = args_parser
+        self._segments_cache: OrderedDict[Tuple[str, bool], Tuple[Any, ...]] = OrderedDict()
+        self._special_tokens_template: Optional[Tuple[List[int], List[int]]] = None
+        self._segments_supported: Optional[bool] = None
 
 
     def _sanitize_parameters(
@@ -242,15 +271,51 @@ class TokenClassificationPipeline(ChunkPipeline):
               exists if the offsets are available within the tokenizer
         """
 
+        sort_by_length = kwargs.pop("sort_by_length", self.sort_by_length)
         _, offset_mapping = self._args_parser(inputs, **kwargs)
         if offset_mapping:
             kwargs["offset_mapping"] = offset_mapping
+        elif (
+            sort_by_length
+            and isinstance(inputs, list)
+            and len(inputs) > 2
+            and (kwargs.get("batch_size") or self._batch_size or 1) > 1
+        ):
+            return self.call_sorted(inputs, **kwargs)
 
         return super().__call__(inputs, **kwargs)
 
 
+    def call_sorted(self, inputs: List[Any], **kwargs: Any) -> List[Any]:
+        """
+        Process inputs sorted by length, so that batches are padded to similar lengths.
+        Character length is used as estimate of token length, to avoid additional tokenization.
+
+        Args:
+            inputs (List[Any]): Texts or (prompt, text) pairs.
+
+        Returns:
+            List[Any]: Outputs in order of inputs.
+        """
+        order = sorted(
+            range(len(inputs)), 
+            key=lambda i: len(inputs[i]) if isinstance(inputs[i], str) else sum(map(len, inputs[i]))
+        )
+        outputs = super().__call__([inputs[i] for i in order], **kwargs)
+        restored: List[Any] = [None] * len(inputs)
+        for position, i in enumerate(order):
+            restored[i] = outputs[position]
+        return restored
+
+
     def preprocess(self, sentence, offset_mapping=None, **preprocess_params):
         tokenizer_params = preprocess_params.pop("tokenizer_params", {})
+        if isinstance(sentence, (tuple, list)):
+            if tokenizer_params or not self.supports_segments(sentence):
+                sentence = "".join(sentence)
+            else:
+                yield self.encode_segments(sentence)
+                return
         truncation = True if self.tokenizer.model_max_length and self.tokenizer.model_max_length > 0 else False
         inputs = self.tokenizer(
             sentence,
@@ -279,6 +344,238 @@ class TokenClassificationPipeline(ChunkPipeline):
             yield model_inputs
 
 
+    segments_cache_size: int = 1024
+    """
+    Maximum number of cached tokenized segments
+    """
+
+    segments_context: str = "a"
+    """
+    Word placed before continuation segments during tokenization (see encode_segment)
+    """
+
+    def encode_segment(
+        self, segment: str, continuation: bool=False
+    ) -> Tuple[List[int], List[Tuple[int, int]], List[Optional[int]], int]:
+        """
+        Tokenize segment without special tokens. Continuation segments start with whitespace
+        (see shift_whitespaces) and are tokenized after segments_context word, that is removed
+        from results. So leading whitespace is normalized as in concatenated text instead of 
+        being stripped, and first word gets the same word boundary marker and offsets (e.g. "▁" 
+        of SentencePiece is aligned to preceding new line).
+
+        Args:
+            segment (str): Text segment.
+
+            continuation (bool, optional): If set to True, segment is tokenized as continuation
+                of text. Defaults to False.
+
+        Returns:
+            Tuple[List[int], List[Tuple[int, int]], List[Optional[int]], int]: Token ids,
+                offsets, word ids and number of words.
+        """
+        context = self.segments_context if continuation else ""
+        tokens = self.tokenizer(
+            context + segment,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+        )
+        input_ids: List[int] = tokens["input_ids"]
+        offsets = [tuple(o) for o in tokens["offset_mapping"]]
+        word_ids: List[Optional[int]] = tokens.word_ids()
+        if continuation:
+            skip = 0
+            while skip < len(word_ids) and word_ids[skip] == 0:
+                skip += 1
+            input_ids = input_ids[skip:]
+            offsets = [(s - len(context), e - len(context)) for s, e in offsets[skip:]]
+            word_ids = [None if w is None else w - 1 for w in word_ids[skip:]]
+        return (
+            input_ids,
+            offsets,
+            word_ids,
+            max((w for w in word_ids if w is not None), default=-1) + 1,
+        )
+
+
+    def tokenize_segment(
+        self, segment: str, continuation: bool=False
+    ) -> Tuple[List[int], List[Tuple[int, int]], List[Optional[int]], int]:
+        """
+        Tokenize segment without special tokens (see encode_segment). Results are cached.
+
+        Returns:
+            Tuple[List[int], List[Tuple[int, int]], List[Optional[int]], int]: Token ids,
+                offsets, word ids and number of words.
+        """
+        cache = self._segments_cache
+        key = (segment, continuation)
+        encoded = cache.get(key)
+        if encoded is not None:
+            cache.move_to_end(key)
+            return encoded
+        encoded = self.encode_segment(segment, continuation)
+        cache[key] = encoded
+        if len(cache) > self.segments_cache_size:
+            cache.popitem(last=False)
+        return encoded
+
+
+    segments_probes: Tuple[Tuple[str, ...], ...] = (
+        ("Identify entities in the text:\nperson\nText:\n", "Paul Hammond lives in Paris."),
+        ("Question: who is he?\n", " He is a scientist. ", "Text:\n"),
+        ("Text: ", "Paul  Hammond"),
+        ("a\n\n", "b "),
+    )
+    """
+    Segments used to check, that tokenizer encodes segments separately the same way
+    as their concatenation
+    """
+
+    def shift_whitespaces(self, segments: Sequence[str]) -> List[str]:
+        """
+        Move whitespaces at the end of segments to the start of the next segments.
+        Tokenizers attach whitespace to the following word (e.g. "▁" marker of SentencePiece
+        and "Ġ" of byte-level BPE), so that no marker is added for trailing whitespaces
+        of segments. Concatenation of segments is unchanged.
+
+        Args:
+            segments (Sequence[str]): Text segments.
+
+        Returns:
+            List[str]: Shifted segments.
+        """
+        shifted: List[str] = []
+        carry = ""
+        for segment in segments:
+            text = carry + segment
+            stripped = text.rstrip()
+            shifted.append(stripped)
+            carry = text[len(stripped):]
+        shifted[-1] += carry
+        return shifted
+
+
+    def supports_segments(self, segments: Sequence[str]) -> bool:
+        """
+        Check, that segments can be tokenized separately (see encode_segments) without
+        changing resulting tokens. Segments should be separated by whitespaces and tokenizer
+        should split words on whitespaces, so that shifted segments (see shift_whitespaces) 
+        are encoded the same way as their concatenation. It's checked once with segments_probes.
+
+        Args:
+            segments (Sequence[str]): Text segments.
+
+        Returns:
+            bool: True if segments can be tokenized separately.
+        """
+        if not self.tokenizer.is_fast or not segments:
+            return False
+        started = False
+        for segment in self.shift_whitespaces(segments):
+            if started and segment and not segment[0].isspace():
+                return False
+            started = started or bool(segment)
+        if self._segments_supported is None:
+            self._segments_supported = all(
+                self._segments_match(probe) for probe in self.segments_probes
+            )
+        return self._segments_supported
+
+
+    def _segments_match(self, segments: Sequence[str]) -> bool:
+        joined = self.tokenizer(
+            "".join(segments), add_special_tokens=False, return_offsets_mapping=True
+        )
+        input_ids, offsets, word_ids = self._concatenate_segments(segments, self.encode_segment)
+        return (
+            joined["input_ids"] == input_ids 
+            and [tuple(o) for o in joined["offset_mapping"]] == offsets
+            and joined.word_ids() == word_ids
+        )
+
+
+    def _concatenate_segments(
+        self, segments: Sequence[str], encode: Any
+    ) -> Tuple[List[int], List[Tuple[int, int]], List[Optional[int]]]:
+        input_ids: List[int] = []
+        offsets: List[Tuple[int, int]] = []
+        word_ids: List[Optional[int]] = []
+        shift = 0
+        words = 0
+        for segment in self.shift_whitespaces(segments):
+            if segment:
+                ids, segment_offsets, segment_words, num_words = encode(segment, shift > 0)
+                input_ids.extend(ids)
+                offsets.extend((s + shift, e + shift) for s, e in segment_offsets)
+                word_ids.extend(None if w is None else w + words for w in segment_words)
+                shift += len(segment)
+                words += num_words
+        return input_ids, offsets, word_ids
+
+
+    def special_tokens_template(self) -> Tuple[List[int], List[int]]:
+        """
+        Special tokens added by tokenizer before and after single sequence
+
+        Returns:
+            Tuple[List[int], List[int]]: Prefix and suffix token ids.
+        """
+        template = self._special_tokens_template
+        if template is None:
+            tokens = self.tokenizer("a", return_special_tokens_mask=True)
+            ids, mask = tokens["input_ids"], tokens["special_tokens_mask"]
+            content = [i for i, m in enumerate(mask) if not m]
+            template = (ids[:content[0]], ids[content[-1] + 1:])
+            self._special_tokens_template = template
+        return template
+
+
+    def encode_segments(self, segments: Sequence[str]) -> Dict[str, Any]:
+        """
+        Build model inputs for concatenation of segments from token ids of separately
+        tokenized segments (see shift_whitespaces), so that prompts and texts repeated 
+        across inputs are tokenized once. Offsets and word ids refer to concatenated text. 
+        Results match tokenization of concatenated text only if supports_segments returns True.
+
+        Args:
+            segments (Sequence[str]): Text segments, e.g. prompt and text.
+
+        Returns:
+            Dict[str, Any]: Model inputs.
+        """
+        input_ids, offsets, word_ids = self._concatenate_segments(
+            segments, self.tokenize_segment
+        )
+
+        prefix, suffix = self.special_tokens_template()
+        max_length = self.tokenizer.model_max_length
+        if max_length and max_length > 0:
+            limit = max(max_length - len(prefix) - len(suffix), 0)
+            input_ids = input_ids[:limit]
+            offsets = offsets[:limit]
+            word_ids = word_ids[:limit]
+
+        input_ids = prefix + input_ids + suffix
+        special_tokens_mask = [1] * len(prefix) + [0] * len(offsets) + [1] * len(suffix)
+        offsets = [(0, 0)] * len(prefix) + offsets + [(0, 0)] * len(suffix)
+        word_ids = [None] * len(prefix) + word_ids + [None] * len(suffix)
+
+        tensor = tf.constant if self.framework == "tf" else torch.tensor
+        model_inputs = {
+            "input_ids": tensor([input_ids]),
+            "attention_mask": tensor([[1] * len(input_ids)]),
+            "special_tokens_mask": tensor([special_tokens_mask]),
+            "offset_mapping": tensor([offsets]),
+        }
+        if "token_type_ids" in self.tokenizer.model_input_names:
+            model_inputs["token_type_ids"] = tensor([[0] * len(input_ids)])
+        model_inputs["word_ids"] = word_ids
+        model_inputs["sentence"] = "".join(segments)
+        model_inputs["is_last"] = True
+        return model_inputs
+
+
     def _forward(self, model_inputs):
         # Forward
         special_tokens_mask = model_inputs.pop("special_tokens_mask")
@@ -317,6 +614,11 @@ class TokenClassificationPipeline(ChunkPipeline):
             )
             special_tokens_mask = model_outputs["special_tokens_mask"][0].numpy()
 
+            if self.has_only_ignored_labels(
+                logits, special_tokens_mask, aggregation_strategy, ignore_labels
+            ):
+                continue
+
             maxes = np.max(logits, axis=-1, keepdims=True)
             shifted_exp = np.exp(logits - maxes)
             scores = shifted_exp / shifted_exp.sum(axis=-1, keepdims=True)
@@ -325,6 +627,19 @@ class TokenClassificationPipeline(ChunkPipeline):
                 input_ids = input_ids.numpy()
                 offset_mapping = offset_mapping.numpy() if offset_mapping is not None else None
 
+            if self.vectorized_postprocess:
+                all_entities.extend(self.postprocess_scores(
+                    sentence, 
+                    input_ids, 
+                    scores, 
+                    word_ids, 
+                    offset_mapping, 
+                    special_tokens_mask, 
+                    aggregation_strategy,
+                    ignore_labels,
+                ))
+                continue
+
             pre_entities = self.gather_pre_entities(
                 sentence, input_ids, scores, word_ids, offset_mapping, special_tokens_mask, aggregation_strategy
             )
@@ -343,6 +658,227 @@ class TokenClassificationPipeline(ChunkPipeline):
         return all_entities
 
 
+    def label_tables(self) -> Tuple[List[str], List[str], np.ndarray, np.ndarray]:
+        """
+        Tables of model labels by label id
+
+        Returns:
+            Tuple[List[str], List[str], np.ndarray, np.ndarray]: Label names, entity group names,
+                tag ids and flags of "B-" labels.
+        """
+        if self._label_tables is None:
+            id2label = self.model.config.id2label
+            labels = [id2label[i] for i in range(len(id2label))]
+            tags = [self.get_tag(label) for label in labels]
+            tag_ids: Dict[str, int] = {}
+            self._label_tables = (
+                labels,
+                [label.split("-", 1)[-1] for label in labels],
+                np.array([tag_ids.setdefault(tag, len(tag_ids)) for _, tag in tags]),
+                np.array([bi == "B" for bi, _ in tags]),
+            )
+        return self._label_tables
+
+
+    def has_only_ignored_labels(
+        self,
+        logits: np.ndarray,
+        special_tokens_mask: np.ndarray,
+        aggregation_strategy: AggregationStrategy,
+        ignore_labels: List[str],
+    ) -> bool:
+        """
+        Check that best label of every token is ignored, so that chunk has no entities 
+        and per token processing can be skipped. With NONE, SIMPLE, FIRST and MAX
+        strategies best labels of words and groups are chosen from best labels of their
+        tokens, so they are ignored too. AVERAGE strategy averages scores of tokens, so
+        word can get label that isn't best for any of its tokens (e.g. if several labels
+        are ignored), and chunks are never skipped.
+
+        Returns:
+            bool: True if chunk has no entities.
+        """
+        if aggregation_strategy == AggregationStrategy.AVERAGE:
+            return False
+        labels, groups, _, _ = self.label_tables()
+        names = labels if aggregation_strategy == AggregationStrategy.NONE else groups
+        ignored = np.fromiter(
+            (name in ignore_labels for name in names), dtype=bool, count=len(names)
+        )
+        return bool(ignored[logits.argmax(axis=-1)[np.asarray(special_tokens_mask) == 0]].all())
+
+
+    def is_subword(
+        self, 
+        sentence: str, 
+        tokens: List[str], 
+        starts: np.ndarray, 
+        ends: np.ndarray, 
+        aggregation_strategy: AggregationStrategy,
+    ) -> np.ndarray:
+        """
+        Flags of tokens that continue previous word (see gather_pre_entities)
+        """
+        if getattr(self.tokenizer, "_tokenizer", None) and getattr(
+            self.tokenizer._tokenizer.model, "continuing_subword_prefix", None
+        ):
+            return np.fromiter(map(len, tokens), dtype=int, count=len(tokens)) != ends - starts
+        if aggregation_strategy in {
+            AggregationStrategy.FIRST,
+            AggregationStrategy.AVERAGE,
+            AggregationStrategy.MAX,
+        }:
+            warnings.warn(
+                "Tokenizer does not support real words, using fallback heuristic",
+                UserWarning,
+            )
+        return np.array([
+            start > 0 and " " not in sentence[start - 1 : start + 1] for start in starts.tolist()
+        ], dtype=bool)
+
+
+    def postprocess_scores(
+        self,
+        sentence: str,
+        input_ids: Any,
+        scores: np.ndarray,
+        word_ids: Optional[List[Optional[int]]],
+        offset_mapping: Any,
+        special_tokens_mask: np.ndarray,
+        aggregation_strategy: AggregationStrategy,
+        ignore_labels: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Array based equivalent of gather_pre_entities, aggregate and filtering of ignored labels.
+        Labels of words and groups are computed for all tokens at once, strings of 
+        entities are built only for groups that are not ignored.
+
+        Returns:
+            List[Dict[str, Any]]: Entities.
+        """
+        keep = np.flatnonzero(np.asarray(special_tokens_mask) == 0)
+        if not len(keep):
+            return []
+        ids = np.asarray(input_ids)[keep]
+        scores = scores[keep]
+        tokens: List[str] = self.tokenizer.convert_ids_to_tokens(ids.tolist())
+        words = tokens
+        starts = ends = None
+        unknown = None
+        if offset_mapping is not None:
+            offsets = np.asarray(offset_mapping)[keep].astype(int)
+            starts, ends = offsets[:, 0], offsets[:, 1]
+            unknown = np.flatnonzero(ids == self.tokenizer.unk_token_id)
+            if len(unknown):
+                words = list(tokens)
+                for i in unknown.tolist():
+                    words[i] = sentence[starts[i]:ends[i]]
+
+        labels, groups, tag_ids, is_begin = self.label_tables()
+        count = len(keep)
+        if aggregation_strategy in {AggregationStrategy.NONE, AggregationStrategy.SIMPLE}:
+            unit_scores = scores
+            unit_first = unit_last = np.arange(count)
+        else:
+            # words: tokens continuing previous word are merged as in aggregate_words
+            if starts is not None and ends is not None:
+                is_subword = self.is_subword(sentence, tokens, starts, ends, aggregation_strategy)
+                if unknown is not None and len(unknown):
+                    is_subword[unknown] = False
+            else:
+                is_subword = np.zeros(count, dtype=bool)
+            if word_ids is not None:
+                token_words = np.array(
+                    [-1 if w is None else w for w in word_ids]
+                )[keep]
+            else:
+                token_words = np.full(count, -1)
+            continues = np.zeros(count, dtype=bool)
+            continues[1:] = np.where(
+                token_words[1:] >= 0, 
+                token_words[1:] == token_words[:-1],
+                is_subword[1:],
+            )
+            unit_first = np.flatnonzero(~continues)
+            unit_last = np.append(unit_first[1:], count) - 1
+            if aggregation_strategy == AggregationStrategy.FIRST:
+                unit_scores = scores[unit_first]
+            elif aggregation_strategy == AggregationStrategy.MAX:
+                token_max = scores.max(axis=-1)
+                unit_ids = np.cumsum(~continues) - 1
+                unit_max = np.maximum.reduceat(token_max, unit_first)
+                best = np.minimum.reduceat(
+                    np.where(token_max == unit_max[unit_ids], np.arange(count), count), 
+                    unit_first,
+                )
+                unit_scores = scores[best]
+            elif aggregation_strategy == AggregationStrategy.AVERAGE:
+                valid = ~np.isnan(scores)
+                unit_scores = (
+                    np.add.reduceat(np.where(valid, scores, 0), unit_first)
+                    / np.add.reduceat(valid, unit_first)
+                )
+            else:
+                raise ValueError("Invalid aggregation_strategy")
+
+        unit_labels = unit_scores.argmax(axis=-1)
+        unit_label_scores = unit_scores[np.arange(len(unit_labels)), unit_labels]
+
+        def word_of(unit: int) -> str:
+            if aggregation_strategy in {AggregationStrategy.NONE, AggregationStrategy.SIMPLE}:
+                return words[unit]
+            return self.tokenizer.convert_tokens_to_string(
+                words[unit_first[unit]:unit_last[unit] + 1]
+            )
+        
+        def span_of(first: int, last: int) -> Tuple[Optional[int], Optional[int]]:
+            if starts is None or ends is None:
+                return None, None
+            return int(starts[unit_first[first]]), int(ends[unit_last[last]])
+
+        if aggregation_strategy == AggregationStrategy.NONE:
+            entities = []
+            for unit in np.flatnonzero(
+                ~np.isin(unit_labels, [i for i, l in enumerate(labels) if l in ignore_labels])
+            ).tolist():
+                start, end = span_of(unit, unit)
+                entities.append({
+                    "entity": labels[unit_labels[unit]],
+                    "score": unit_label_scores[unit],
+                    "index": int(keep[unit]),
+                    "word": words[unit],
+                    "start": start,
+                    "end": end,
+                })
+            return entities
+
+        # groups of adjacent units with the same tag, as in group_entities
+        new_group = np.ones(len(unit_labels), dtype=bool)
+        new_group[1:] = (
+            (tag_ids[unit_labels[1:]] != tag_ids[unit_labels[:-1]]) 
+            | is_begin[unit_labels[1:]]
+        )
+        group_first = np.flatnonzero(new_group)
+        group_last = np.append(group_first[1:], len(unit_labels)) - 1
+        ignored = np.isin(
+            unit_labels[group_first], [i for i, g in enumerate(groups) if g in ignore_labels]
+        )
+
+        entities = []
+        for first, last in zip(group_first[~ignored].tolist(), group_last[~ignored].tolist()):
+            start, end = span_of(first, last)
+            entities.append({
+                "entity_group": groups[unit_labels[first]],
+                "score": np.mean(np.nanmean(unit_label_scores[first:last + 1])),
+                "word": self.tokenizer.convert_tokens_to_string(
+                    [word_of(unit) for unit in range(first, last + 1)]
+                ),
+                "start": start,
+                "end": end,
+            })
+        return entities
+
+
     def aggregate_overlapping_entities(self, entities):
         if len(entities) == 0:
             return entities
@@ -10,9 +10,9 @@ def clean_span(text: str, start: int, end: int, shift: int=0):
     
     start += shift
     end += shift
-    while start != end - 1 and text[start] in junk:
+    while start < end - 1 and text[start] in junk:
         start += 1
-    while end != start and text[end - 1] in string.punctuation:
+    while end > start and text[end - 1] in string.punctuation:
         end -= 1
     return text[start:end], start, end
 
@@ -1,4 +1,6 @@
 from typing import Any, Dict, List, Callable, Optional, Union
+from contextlib import ExitStack
+from enum import Enum
 
 from pydantic import ConfigDict
 from transformers import ( # type: ignore
@@ -6,6 +8,7 @@ from transformers import ( # type: ignore
     TFPreTrainedModel,
     PretrainedConfig,
     PreTrainedTokenizer,
+    PreTrainedTokenizerFast,
 )
 from transformers.image_processing_utils import ( # type: ignore
     BaseImageProcessor
@@ -15,6 +18,110 @@ import torch
 
 from utca.core.executable_level_1.schema import IOModel, Config
 
+class GradMode(Enum):
+    """
+    Autograd mode of model calls
+    """
+    ENABLED = 0
+    """
+    Gradients are recorded
+    """
+    NO_GRAD = 1
+    """
+    Model is called in torch.no_grad context
+    """
+    INFERENCE = 2
+    """
+    Model is called in torch.inference_mode context. Fastest option, but produced 
+    tensors can't be modified in-place or used in autograd outside of inference mode
+    """
+
+
+class InferenceProfile(Config):
+    """
+    Execution settings applied around every model call
+
+    Arguments:
+        grad_mode (GradMode, optional): Autograd mode. Defaults to GradMode.NO_GRAD.
+
+        num_threads (Optional[int], optional): Number of threads used for intra-op 
+            parallelism (torch.set_num_threads). Setting is global for process and is applied
+            every time a predictor with this profile is constructed, so it overrides settings
+            of previously created predictors. If equals to None, torch default is used.
+            Defaults to None.
+
+        num_interop_threads (Optional[int], optional): Number of threads used for inter-op
+            parallelism (torch.set_num_interop_threads). Can be set only once per process,
+            before any parallel work. If equals to None, torch default is used. Defaults to None.
+
+        autocast_dtype (Optional[torch.dtype], optional): Data type used by torch.autocast
+            (e.g. torch.bfloat16) on device of the model. If equals to None, autocast
+            is disabled. Defaults to None.
+
+        compile (bool, optional): If set to True, forward method of the model is compiled 
+            with torch.compile. Defaults to False.
+
+        compile_kwargs (Optional[Dict[str, Any]], optional): Extra torch.compile parameters
+            (e.g. mode). Defaults to None.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    grad_mode: GradMode=GradMode.NO_GRAD
+    num_threads: Optional[int]=None
+    num_interop_threads: Optional[int]=None
+    autocast_dtype: Optional[torch.dtype]=None
+    compile: bool=False
+    compile_kwargs: Optional[Dict[str, Any]]=None
+
+
+    def prepare(self, model: Any) -> Any:
+        """
+        Apply thread settings and compile model if requested. Called when predictor
+        is constructed. Thread settings are process-wide.
+
+        Args:
+            model (Any): Model.
+
+        Returns:
+            Any: Prepared model.
+        """
+        if self.num_threads is not None:
+            torch.set_num_threads(self.num_threads)
+        if (
+            self.num_interop_threads is not None 
+            and torch.get_num_interop_threads() != self.num_interop_threads
+        ):
+            torch.set_num_interop_threads(self.num_interop_threads)
+        if self.compile and isinstance(model, torch.nn.Module):
+            model.forward = torch.compile( # type: ignore
+                model.forward, **(self.compile_kwargs or {})
+            )
+        return model
+
+
+    def context(self, device: Optional[torch.device]=None) -> ExitStack:
+        """
+        Create context of model call
+
+        Args:
+            device (Optional[torch.device], optional): Device of model, used by autocast.
+                If equals to None, CPU is used. Defaults to None.
+
+        Returns:
+            ExitStack: Context.
+        """
+        stack = ExitStack()
+        if self.grad_mode == GradMode.INFERENCE:
+            stack.enter_context(torch.inference_mode())
+        elif self.grad_mode == GradMode.NO_GRAD:
+            stack.enter_context(torch.no_grad())
+        if self.autocast_dtype is not None:
+            stack.enter_context(torch.autocast(
+                device.type if device is not None else "cpu", 
+                dtype=self.autocast_dtype,
+            ))
+        return stack
+
+
 class TransformersModelConfig(Config):
     """
     Transformers model configuration
@@ -23,10 +130,14 @@ class TransformersModelConfig(Config):
         model (Union[PreTrainedModel, TFPreTrainedModel]): Transformers model that wil be used.
 
         kwargs (Optional[Dict[str, Any]], optional): Extra model parameters.
+
+        profile (InferenceProfile, optional): Execution settings of model calls. 
+            Defaults to InferenceProfile().
     """
     model_config = ConfigDict(arbitrary_types_allowed=True)
     model: Union[PreTrainedModel, TFPreTrainedModel]
     kwargs: Optional[Dict[str, Any]]=None
+    profile: InferenceProfile=InferenceProfile()
 
 
     def get_kwargs(self) -> Dict[str, Any]:
@@ -82,10 +193,10 @@ class TransformersPipelineConfig(Config):
             identifier or an actual pretrained model configuration inheriting from 
             PretrainedConfig. Defaults to None.
         
-        tokenizer (Optional[Union[str, PreTrainedTokenizer]], optional): The tokenizer 
-            that will be used by the pipeline to encode data for the model. This can be 
-            a model identifier or an actual pretrained tokenizer inheriting from 
-            PreTrainedTokenizer. Defaults to None.
+        tokenizer (Optional[Union[str, PreTrainedTokenizer, PreTrainedTokenizerFast]], optional): 
+            The tokenizer that will be used by the pipeline to encode data for the model. 
+            This can be a model identifier or an actual pretrained tokenizer inheriting from 
+            PreTrainedTokenizer or PreTrainedTokenizerFast. Defaults to None.
         
         feature_extractor (Optional[Any], optional): The feature extractor that will be used
             by the pipeline to encode data for the model. This can be a model identifier 
@@ -166,7 +277,8 @@ class TransformersPipelineConfig(Config):
     ]]=None
     tokenizer: Optional[Union[
         str,
-        PreTrainedTokenizer
+        PreTrainedTokenizer,
+        PreTrainedTokenizerFast,
     ]]=None
     feature_extractor: Optional[Any]=None
     image_processor: Optional[Union[
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Type, Optional
+from typing import Any, Dict, List, Type, Optional
 
 from utca.core.executable_level_1.interpreter import Evaluator
 from utca.core.executable_level_1.schema import (
@@ -6,7 +6,9 @@ from utca.core.executable_level_1.schema import (
 )
 from utca.core.predictor_level_2.predictor import Predictor
 from utca.implementation.predictors.transformers_predictor.schema import TransformersModelConfig
-from utca.implementation.predictors.utils import ensure_dict
+from utca.implementation.predictors.utils import (
+    ensure_dict, batch_size_of, collate, split
+)
 
 class TransformersModel(
     Predictor[
@@ -41,6 +43,7 @@ class TransformersModel(
             name=name,
         )
         self.cfg = cfg
+        self.cfg.profile.prepare(self.cfg.model)
 
 
     def invoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
@@ -55,12 +58,48 @@ class TransformersModel(
         Returns:
             Dict[str, Any]: Result of execution.
         """
-        inputs = input_data.extract()
-        if not "encodings" in inputs:
-            res = self.cfg.model(**inputs, **self.cfg.get_kwargs()) # type: ignore
-        else:
-            res = self.cfg.model(**inputs.pop("encodings"), **inputs, **self.cfg.get_kwargs()) # type: ignore
-        return ensure_dict(res)
+        return ensure_dict(self.predict(input_data.extract()))
+
+
+    def invoke_batch(
+        self, input_data: List[Input], evaluator: Evaluator
+    ) -> List[Dict[str, Any]]:
+        """
+        Call model once with inputs concatenated along batch dimension.
+        If inputs can not be concatenated (e.g. tensors of different shapes),
+        model is called for each input.
+
+        Args:
+            input_data (List[Input]): Validated inputs.
+
+            evaluator (Evaluator): Evaluator in context of wich executed.
+
+        Returns:
+            List[Dict[str, Any]]: Results of execution for each input.
+        """
+        inputs = [i.extract() for i in input_data]
+        try:
+            sizes = [batch_size_of(i) for i in inputs]
+            batch = collate(inputs)
+        except ValueError:
+            return [ensure_dict(self.predict(i)) for i in inputs]
+        return split(ensure_dict(self.predict(batch)), sizes)
+
+
+    def predict(self, inputs: Dict[str, Any]) -> Any:
+        """
+        Call model
+
+        Args:
+            inputs (Dict[str, Any]): Model inputs.
+
+        Returns:
+            Any: Model output.
+        """
+        with self.cfg.profile.context(getattr(self.cfg.model, "device", None)):
+            if not "encodings" in inputs:
+                return self.cfg.model(**inputs, **self.cfg.get_kwargs()) # type: ignore
+            return self.cfg.model(**inputs.pop("encodings"), **inputs, **self.cfg.get_kwargs()) # type: ignore
 
 
     @property
@@ -80,21 +119,17 @@ class TransformersGenerativeModel(
     """
     Transformers generative model
     """
-    def invoke(self, input_data: Input, evaluator: Evaluator) -> Dict[str, Any]:
+    def predict(self, inputs: Dict[str, Any]) -> Any:
         """
         Call generate method of the model
 
         Args:
-            input_data (Input): Validated input.
-
-            evaluator (Evaluator): Evaluator in context of wich executed.
+            inputs (Dict[str, Any]): Model inputs.
 
         Returns:
-            Dict[str, Any]: Result of execution.
+            Any: Model output.
         """
-        inputs = input_data.extract()
-        if not "encodings" in inputs:
-            res = self.cfg.model.generate(**inputs, **self.cfg.get_kwargs()) # type: ignore
-        else:
-            res = self.cfg.model.generate(**inputs.pop("encodings"), **inputs, **self.cfg.get_kwargs()) # type: ignore
-        return ensure_dict(res)
\ No newline at end of file
+        with self.cfg.profile.context(getattr(self.cfg.model, "device", None)):
+            if not "encodings" in inputs:
+                return self.cfg.model.generate(**inputs, **self.cfg.get_kwargs()) # type: ignore
+            return self.cfg.model.generate(**inputs.pop("encodings"), **inputs, **self.cfg.get_kwargs()) # type: ignore
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Type, Optional
+from typing import Any, Dict, List, Type, Optional
 
 from transformers import ( # type: ignore
     pipeline, # type: ignore
@@ -69,6 +69,38 @@ class TransformersPipeline(
                 inputs.pop("inputs"), **inputs
             ))
         return ensure_dict(self.pipeline(**inputs)) # type: ignore
+
+
+    def invoke_batch(
+        self, input_data: List[Input], evaluator: Evaluator
+    ) -> List[Dict[str, Any]]:
+        """
+        Call pipeline once with list of inputs. Pipeline batching is controlled
+        by "batch_size" pipeline parameter. If inputs have different parameters 
+        or inputs are already lists, pipeline is called for each input.
+
+        Args:
+            input_data (List[Input]): Validated inputs.
+
+            evaluator (Evaluator): Evaluator in context of wich executed.
+
+        Returns:
+            List[Dict[str, Any]]: Results of execution for each input.
+        """
+        inputs = [i.extract() for i in input_data]
+        kwargs = {k: v for k, v in inputs[0].items() if k != "inputs"}
+        if not all(
+            "inputs" in i 
+            and not isinstance(i["inputs"], list)
+            and {k: v for k, v in i.items() if k != "inputs"} == kwargs
+            for i in inputs
+        ):
+            return [self.invoke(i, evaluator) for i in input_data]
+        return [
+            ensure_dict(res) for res in self.pipeline( # type: ignore
+                [i["inputs"] for i in inputs], **kwargs
+            )
+        ]
     
 
     @property
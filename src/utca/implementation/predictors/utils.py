@@ -1,8 +1,153 @@
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, Tuple, cast
 
 def ensure_dict(data: Any, key: str="output") -> Dict[str, Any]:
     if not isinstance(data, Dict):
         return {
             key: data
         }
-    return cast(Dict[str, Any], data)
\ No newline at end of file
+    return cast(Dict[str, Any], data)
+
+
+def batch_size_of(data: Dict[str, Any]) -> int:
+    """
+    Get size of the first dimension of batched values
+
+    Args:
+        data (Dict[str, Any]): Model inputs.
+
+    Raises:
+        ValueError: If inputs do not contain batched values.
+
+    Returns:
+        int: Batch size.
+    """
+    for v in data.values():
+        if isinstance(v, Dict):
+            return batch_size_of(cast(Dict[str, Any], v))
+        if hasattr(v, "shape") and len(v.shape) > 0:
+            return int(v.shape[0])
+    raise ValueError("Inputs do not contain batched values.")
+
+
+def values_equal(a: Any, b: Any) -> bool:
+    """
+    Compare values, that can be or contain tensors and arrays
+
+    Args:
+        a (Any): First value.
+
+        b (Any): Second value.
+
+    Returns:
+        bool: True if values are equal; otherwise, False.
+    """
+    import torch
+    import numpy as np
+
+    if a is b:
+        return True
+    if isinstance(a, torch.Tensor) or isinstance(b, torch.Tensor):
+        return (
+            isinstance(a, torch.Tensor) 
+            and isinstance(b, torch.Tensor) 
+            and a.shape == b.shape
+            and bool(torch.equal(a, b))
+        )
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return bool(np.array_equal(a, b))
+    if isinstance(a, Dict) and isinstance(b, Dict):
+        a, b = cast(Dict[Any, Any], a), cast(Dict[Any, Any], b)
+        return a.keys() == b.keys() and all(values_equal(v, b[k]) for k, v in a.items())
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        a, b = cast(List[Any], a), cast(List[Any], b)
+        return (
+            type(a) is type(b) 
+            and len(a) == len(b) 
+            and all(values_equal(i, j) for i, j in zip(a, b))
+        )
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def collate(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Concatenate model inputs along batch dimension
+
+    Args:
+        items (List[Dict[str, Any]]): Model inputs with equal keys.
+
+    Raises:
+        ValueError: If inputs can not be concatenated.
+
+    Returns:
+        Dict[str, Any]: Concatenated inputs.
+    """
+    import torch
+    import numpy as np
+
+    if any(i.keys() != items[0].keys() for i in items):
+        raise ValueError("Inputs have different keys.")
+    collated: Dict[str, Any] = {}
+    for key, first in items[0].items():
+        values = [i[key] for i in items]
+        if isinstance(first, Dict):
+            if not all(isinstance(v, Dict) for v in values):
+                raise ValueError(f"Values of '{key}' have different types.")
+            collated[key] = collate(cast(List[Dict[str, Any]], values))
+        elif isinstance(first, (torch.Tensor, np.ndarray)):
+            if any(
+                type(v) is not type(first) or v.shape[1:] != first.shape[1:] 
+                for v in values
+            ):
+                raise ValueError(f"Values of '{key}' have different shapes.")
+            try:
+                collated[key] = (
+                    torch.cat(values) 
+                    if isinstance(first, torch.Tensor) else np.concatenate(values)
+                )
+            except (RuntimeError, TypeError, ValueError) as e:
+                raise ValueError(f"Values of '{key}' can not be concatenated: {e}")
+        elif all(values_equal(v, first) for v in values):
+            collated[key] = first
+        else:
+            raise ValueError(f"Values of '{key}' differ and can not be batched.")
+    return collated
+
+
+def split(output: Dict[str, Any], sizes: List[int]) -> List[Dict[str, Any]]:
+    """
+    Split model output along batch dimension
+
+    Args:
+        output (Dict[str, Any]): Output of batched call.
+
+        sizes (List[int]): Batch sizes of corresponding inputs.
+
+    Returns:
+        List[Dict[str, Any]]: Outputs for each input.
+    """
+    total = sum(sizes)
+    bounds: List[Tuple[int, int]] = []
+    start = 0
+    for size in sizes:
+        bounds.append((start, start + size))
+        start += size
+
+    results: List[Dict[str, Any]] = [{} for _ in sizes]
+    for key, value in output.items():
+        for result, (start, end) in zip(results, bounds):
+            result[key] = _slice(value, start, end, total)
+    return results
+
+
+def _slice(value: Any, start: int, end: int, total: int) -> Any:
+    shape = getattr(value, "shape", None)
+    if shape is not None and len(shape) > 0 and shape[0] == total:
+        return value[start:end]
+    if isinstance(value, tuple):
+        return tuple(_slice(v, start, end, total) for v in cast(Tuple[Any, ...], value))
+    if isinstance(value, list) and len(cast(List[Any], value)) == total:
+        return value[start:end]
+    return value
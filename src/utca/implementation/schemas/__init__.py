@@ -1,27 +1,59 @@
-from utca.implementation.schemas.semantic_search.semantic_search_schema import (
-    SemanticSearchSchema,
-    SemanticSearchSchemaInput,
-    SemanticSearchSchemaOutput,
-)
-from utca.implementation.schemas.web_scraping.web2meaning.w2m import (
-    Web2MeaningInput,
-    Web2MeaningOutput,
-    Web2Meaning,
-)
-from utca.implementation.schemas.web_scraping.web2meaning.schema import (
-    Web2MeaningParameters,
-    Web2MeaningRequestParameters,
-    Web2MeaningNLPParameters,
-    Web2MeaningMediaParameters,
-    Web2MeaningMetadataParameters,
-    Web2MeaningDateParameters,
-    Web2MeaningTextParameters
-)
-from utca.implementation.schemas.web_scraping.requests_html.requests_html import (
-    RequestsHTML,
-    RequestsHTMLInput,
-    RequestsHTMLOutput,
-)
+from typing import TYPE_CHECKING
+
+from utca.implementation.utils import lazy_import
+
+if TYPE_CHECKING:
+    from utca.implementation.schemas.semantic_search.semantic_search_schema import (
+        SemanticSearchSchema,
+        SemanticSearchSchemaInput,
+        SemanticSearchSchemaOutput,
+    )
+    from utca.implementation.schemas.web_scraping.web2meaning.w2m import (
+        Web2MeaningInput,
+        Web2MeaningOutput,
+        Web2Meaning,
+    )
+    from utca.implementation.schemas.web_scraping.web2meaning.schema import (
+        Web2MeaningParameters,
+        Web2MeaningRequestParameters,
+        Web2MeaningNLPParameters,
+        Web2MeaningMediaParameters,
+        Web2MeaningMetadataParameters,
+        Web2MeaningDateParameters,
+        Web2MeaningTextParameters
+    )
+    from utca.implementation.schemas.web_scraping.requests_html.requests_html import (
+        RequestsHTML,
+        RequestsHTMLInput,
+        RequestsHTMLOutput,
+    )
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    "utca.implementation.schemas.semantic_search.semantic_search_schema": [
+        "SemanticSearchSchema",
+        "SemanticSearchSchemaInput",
+        "SemanticSearchSchemaOutput",
+    ],
+    "utca.implementation.schemas.web_scraping.web2meaning.w2m": [
+        "Web2MeaningInput",
+        "Web2MeaningOutput",
+        "Web2Meaning",
+    ],
+    "utca.implementation.schemas.web_scraping.web2meaning.schema": [
+        "Web2MeaningParameters",
+        "Web2MeaningRequestParameters",
+        "Web2MeaningNLPParameters",
+        "Web2MeaningMediaParameters",
+        "Web2MeaningMetadataParameters",
+        "Web2MeaningDateParameters",
+        "Web2MeaningTextParameters",
+    ],
+    "utca.implementation.schemas.web_scraping.requests_html.requests_html": [
+        "RequestsHTML",
+        "RequestsHTMLInput",
+        "RequestsHTMLOutput",
+    ],
+})
 
 __all__ = [
     "SemanticSearchSchema",
@@ -40,4 +72,4 @@ __all__ = [
     "RequestsHTML",
     "RequestsHTMLInput",
     "RequestsHTMLOutput",
-]
\ No newline at end of file
+]
@@ -12,6 +12,7 @@ from utca.implementation.tasks.text_processing.embedding.transformers_task.trans
 from utca.implementation.datasources.index.actions import (
     IndexCreate, IndexData, IndexSearch, GetTextsByIndexes,
 )
+from utca.implementation.datasources.index.index import IndexConfig
 
 class SemanticSearchSchemaInput(IOModel):
     query: List[str]
@@ -44,6 +45,7 @@ class SemanticSearchSchema(
         self, 
         dataset: Optional[List[str]]=None, 
         encoder: Optional[TransformersTextEmbedding[Any, Any]]=None,
+        index_config: Optional[IndexConfig]=None,
         input_class: Type[SemanticSearchSchemaInput]=SemanticSearchSchemaInput,
         output_class: Type[SemanticSearchSchemaOutput]=SemanticSearchSchemaOutput,
         name: Optional[str]=None,
@@ -54,6 +56,10 @@ class SemanticSearchSchema(
             
             encoder (Optional[TransformersTextEmbedding[Any, Any]], optional): Encoder for embeddings creation.
                 If equals to None, default encoder will be used. Defaults to None.
+
+            index_config (Optional[IndexConfig], optional): Index type (e.g. IVF or HNSW for
+                large datasets), metric and search parameters. If equals to None, exact search
+                with L2 distance will be used. Defaults to None.
             
             input_class (Type[SemanticSearchSchemaInput], optional): Class for input validation.
                 Defaults to SemanticSearchSchemaInput.
@@ -72,6 +78,7 @@ class SemanticSearchSchema(
         if encoder is None:
             encoder = TransformersTextEmbedding()
         self.encoder = encoder
+        self.index_config = index_config
 
         self.index = self.build_index()
 
@@ -101,7 +108,8 @@ class SemanticSearchSchema(
 
     def build_index(self) -> Any:
         return IndexCreate(
-            self.encoder.predictor.config.hidden_size # type: ignore
+            self.encoder.predictor.config.hidden_size, # type: ignore
+            self.index_config,
         ).execute({})["index"]
 
 
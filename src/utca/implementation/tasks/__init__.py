@@ -1,215 +1,407 @@
-# Audio processing
-from utca.implementation.tasks.audio_processing.text_to_speech.transformers_task.transformers_text_to_speech import (
-    TransformersTextToSpeech,
-)
-
-from utca.implementation.tasks.audio_processing.speech_to_text.whisper.whisper import (
-    WhisperSpeechToText
-)
-
-# Image processing
-from utca.implementation.tasks.image_processing.charts_and_plots_analysis.transformers_task.transformers_charts_and_plots_analysis import (
-    TransformersChartsAndPlotsAnalysis,
-    ChartsAndPlotsAnalysisInput,
-)
-from utca.implementation.tasks.image_processing.charts_and_plots_analysis.transformers_task.actions import (
-    ChartsAndPlotsAnalysisPreprocessor,
-    ChartsAndPlotsAnalysisPostprocessor,
-)
-
-from utca.implementation.tasks.image_processing.documents_q_and_a.transformers_task.transformers_layout_lm import (
-    TransformersDocumentQandA,
-)
-
-from utca.implementation.tasks.image_processing.image_classification.transformers_task.transformers_image_classification import (
-    TransformersImageClassification,
-    TransformersImageClassificationInput,
-    TransformersImageClassificationOutput,
-    TransformersImageClassificationMultilabelOutput,
-)
-from utca.implementation.tasks.image_processing.image_classification.transformers_task.actions import (
-    ImageClassificationPreprocessor,
-    ImageClassificationSingleLabelPostprocessor,
-    ImageClassificationMultilabelPostprocessor,
-)
-
-from utca.implementation.tasks.image_processing.visual_q_and_a.transformers_task.transformers_visual_q_and_a import (
-    TransformersVisualQandA,
-    TransformersVisualQandAInput,
-    TransformersVisualQandAOutput,
-    TransformersVisualQandAMultianswerOutput,
-)
-from utca.implementation.tasks.image_processing.visual_q_and_a.transformers_task.actions import (
-    VisualQandAPreprocessor,
-    VisualQandAMultianswerPostprocessor,
-    VisualQandASingleAnswerPostprocessor,
-)
-
-from utca.implementation.tasks.image_processing.object_detection.transformers_task.transformers_object_detection import (
-    TransformersObjectDetection,
-    TransformersObjectDetectionInput,
-    TransformersObjectDetectionOutput,
-)
-from utca.implementation.tasks.image_processing.object_detection.transformers_task.actions import (
-    ObjectDetectionPreprocessor,
-    DETRPostprocessor,
-)
-
-# Text processing
-from utca.implementation.tasks.text_processing.clean_text.token_searcher.token_searcher import (
-    TokenSearcherTextCleaner,
-    TokenSearcherTextCleanerInput,
-    TokenSearcherTextCleanerOutput,
-)
-from utca.implementation.tasks.text_processing.clean_text.token_searcher.actions import (
-    TokenSearcherTextCleanerPreprocessor,
-    TokenSearcherTextCleanerPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.embedding.transformers_task.transformers_embedding import (
-    TransformersTextEmbedding,
-    TextEmbeddingInput, 
-    TextEmbeddingOutput,
-)
-from utca.implementation.tasks.text_processing.embedding.transformers_task.actions import (
-    EmbeddingPreprocessor,
-    EmbeddingPostprocessor,
-    ConvertEmbeddingsToNumpyArrays,
-)
-
-from utca.implementation.tasks.text_processing.entity_linking.transformers_task.transformers_entity_linking import (
-    TransformersEntityLinking,
-    EntityLinkingInput, 
-    EntityLinkingOutput,
-)
-from utca.implementation.tasks.text_processing.entity_linking.transformers_task.actions import (
-    EntityLinkingPreprocessor,
-    EntityLinkingPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.ner.token_searcher.token_searcher import (
-    TokenSearcherNER,
-    TokenSearcherNERInput,
-    TokenSearcherNEROutput,
-)
-from utca.implementation.tasks.text_processing.ner.token_searcher.actions import (
-    TokenSearcherNERPreprocessor,
-    TokenSearcherNERPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.ner.transformers_ner.transformers_token_classification import (
-    TransformersTokenClassifier,
-    TransformersTokenClassifierOutput,
-)
-from utca.implementation.tasks.text_processing.ner.transformers_ner.actions import (
-    TokenClassifierPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.summarization.transformers_task.transformers_summarization import (
-    TransformersTextSummarization,
-    SummarizationInput,
-    SummarizationOutput,
-)
-from utca.implementation.tasks.text_processing.summarization.transformers_task.actions import (
-    SummarizationPostprocess,
-)
-
-from utca.implementation.tasks.text_processing.text_classification.comprehend_it.comprehend_it import (
-    ComprehendIt,
-)
-
-from utca.implementation.tasks.text_processing.textual_q_and_a.token_searcher.token_searcher import (
-    TokenSearcherQandA,
-    TokenSearcherQandAInput,
-    TokenSearcherQandAOutput,
-)
-from utca.implementation.tasks.text_processing.textual_q_and_a.token_searcher.actions import (
-    TokenSearcherQandAPreprocessor,
-    TokenSearcherQandAPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.textual_q_and_a.transformers_task.transformers_q_and_a import (
-    TransformersTextualQandA
-)
-from utca.implementation.tasks.text_processing.textual_q_and_a.transformers_task.actions import (
-    QandAPostprocess
-)
-
-from utca.implementation.tasks.text_processing.ner.gliner_task.zero_shot_ner import (
-    GLiNER,
-    GLiNERInput,
-    GLiNEROutput,
-)
-from utca.implementation.tasks.text_processing.ner.gliner_task.actions import (
-    GLiNERPreprocessor,
-    GLiNERPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.chat.schema import (
-    ChatInput, ChatOutput
-)
-from utca.implementation.tasks.text_processing.chat.actions import (
-    ChatAddContext, ChatUpdateContext
-)
-
-from utca.implementation.tasks.text_processing.chat.openai.openai_chat import (
-    OpenAIChat,
-)
-from utca.implementation.tasks.text_processing.chat.openai.actions import (
-    OpenAIChatPreprocessor,
-    OpenAIChatPostprocessor,
-    OpenAIChatStreamPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.chat.transformers_task.transformers_chat import (
-    TransformersChat,
-)
-from utca.implementation.tasks.text_processing.chat.transformers_task.actions import (
-    ChatPreprocessor, 
-    ChatPostprocessor, 
-)
-
-from utca.implementation.tasks.text_processing.text_classification.transformers_task.text_classification import (
-    TransformersTextClassification,
-)
-
-from utca.implementation.tasks.text_processing.relation_extraction.schema import (
-    RelationExtractionInput,
-    RelationExtractionOutput,
-)
-
-from utca.implementation.tasks.text_processing.relation_extraction.token_searcher.relation_extraction import (
-    TokenSearcherRelationExtraction,
-)
-from utca.implementation.tasks.text_processing.relation_extraction.token_searcher.actions import (
-    TokenSearcherRelationExtractionPreprocessor,
-    TokenSearcherRelationExtractionPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.relation_extraction.gliner_task.relation_extraction import (
-    GLiNERRelationExtraction,
-)
-from utca.implementation.tasks.text_processing.relation_extraction.gliner_task.actions import (
-    GLiNERRelationExtractionPreprocessor,
-    GLiNERRelationExtractionPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.textual_q_and_a.gliner_task.q_and_a import (
-    GLiNERQandA,
-)
-from utca.implementation.tasks.text_processing.textual_q_and_a.gliner_task.actions import (
-    GLiNERQandAPreprocessor,
-    GLiNERQandAPostprocessor,
-)
-
-from utca.implementation.tasks.text_processing.function_call.transformers_task.main import (
-    TransformersFunctionCallInput,
-    TransformersFunctionCall,
-)
-from utca.implementation.tasks.text_processing.function_call.transformers_task.main import (
-    TransformersFunctionCallPreprocessor,
-    TransformersFunctionCallPostprocessor,
-)
+from typing import TYPE_CHECKING
+
+from utca.implementation.utils import lazy_import
+
+if TYPE_CHECKING:
+    # Audio processing
+    from utca.implementation.tasks.audio_processing.text_to_speech.transformers_task.transformers_text_to_speech import (
+        TransformersTextToSpeech,
+    )
+
+    from utca.implementation.tasks.audio_processing.speech_to_text.whisper.whisper import (
+        WhisperSpeechToText
+    )
+
+    # Image processing
+    from utca.implementation.tasks.image_processing.charts_and_plots_analysis.transformers_task.transformers_charts_and_plots_analysis import (
+        TransformersChartsAndPlotsAnalysis,
+        ChartsAndPlotsAnalysisInput,
+    )
+    from utca.implementation.tasks.image_processing.charts_and_plots_analysis.transformers_task.actions import (
+        ChartsAndPlotsAnalysisPreprocessor,
+        ChartsAndPlotsAnalysisPostprocessor,
+    )
+
+    from utca.implementation.tasks.image_processing.documents_q_and_a.transformers_task.transformers_layout_lm import (
+        TransformersDocumentQandA,
+    )
+
+    from utca.implementation.tasks.image_processing.image_classification.transformers_task.transformers_image_classification import (
+        TransformersImageClassification,
+        TransformersImageClassificationInput,
+        TransformersImageClassificationOutput,
+        TransformersImageClassificationMultilabelOutput,
+    )
+    from utca.implementation.tasks.image_processing.image_classification.transformers_task.actions import (
+        ImageClassificationPreprocessor,
+        ImageClassificationSingleLabelPostprocessor,
+        ImageClassificationMultilabelPostprocessor,
+    )
+
+    from utca.implementation.tasks.image_processing.visual_q_and_a.transformers_task.transformers_visual_q_and_a import (
+        TransformersVisualQandA,
+        TransformersVisualQandAInput,
+        TransformersVisualQandAOutput,
+        TransformersVisualQandAMultianswerOutput,
+    )
+    from utca.implementation.tasks.image_processing.visual_q_and_a.transformers_task.actions import (
+        VisualQandAPreprocessor,
+        VisualQandAMultianswerPostprocessor,
+        VisualQandASingleAnswerPostprocessor,
+    )
+
+    from utca.implementation.tasks.image_processing.object_detection.transformers_task.transformers_object_detection import (
+        TransformersObjectDetection,
+        TransformersObjectDetectionInput,
+        TransformersObjectDetectionOutput,
+    )
+    from utca.implementation.tasks.image_processing.object_detection.transformers_task.actions import (
+        ObjectDetectionPreprocessor,
+        DETRPostprocessor,
+    )
+
+    # Text processing
+    from utca.implementation.tasks.text_processing.clean_text.token_searcher.token_searcher import (
+        TokenSearcherTextCleaner,
+        TokenSearcherTextCleanerInput,
+        TokenSearcherTextCleanerOutput,
+    )
+    from utca.implementation.tasks.text_processing.clean_text.token_searcher.actions import (
+        TokenSearcherTextCleanerPreprocessor,
+        TokenSearcherTextCleanerPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.embedding.transformers_task.transformers_embedding import (
+        TransformersTextEmbedding,
+        TextEmbeddingInput, 
+        TextEmbeddingOutput,
+    )
+    from utca.implementation.tasks.text_processing.embedding.transformers_task.actions import (
+        EmbeddingPreprocessor,
+        EmbeddingPostprocessor,
+        ConvertEmbeddingsToNumpyArrays,
+    )
+
+    from utca.implementation.tasks.text_processing.entity_linking.transformers_task.transformers_entity_linking import (
+        TransformersEntityLinking,
+        EntityLinkingInput, 
+        EntityLinkingOutput,
+    )
+    from utca.implementation.tasks.text_processing.entity_linking.transformers_task.actions import (
+        EntityLinkingPreprocessor,
+        EntityLinkingPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.ner.token_searcher.token_searcher import (
+        TokenSearcherNER,
+        TokenSearcherNERInput,
+        TokenSearcherNEROutput,
+    )
+    from utca.implementation.tasks.text_processing.ner.token_searcher.actions import (
+        TokenSearcherNERPreprocessor,
+        TokenSearcherNERPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.ner.transformers_ner.transformers_token_classification import (
+        TransformersTokenClassifier,
+        TransformersTokenClassifierOutput,
+    )
+    from utca.implementation.tasks.text_processing.ner.transformers_ner.actions import (
+        TokenClassifierPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.summarization.transformers_task.transformers_summarization import (
+        TransformersTextSummarization,
+        SummarizationInput,
+        SummarizationOutput,
+    )
+    from utca.implementation.tasks.text_processing.summarization.transformers_task.actions import (
+        SummarizationPostprocess,
+    )
+
+    from utca.implementation.tasks.text_processing.text_classification.comprehend_it.comprehend_it import (
+        ComprehendIt,
+    )
+
+    from utca.implementation.tasks.text_processing.textual_q_and_a.token_searcher.token_searcher import (
+        TokenSearcherQandA,
+        TokenSearcherQandAInput,
+        TokenSearcherQandAOutput,
+    )
+    from utca.implementation.tasks.text_processing.textual_q_and_a.token_searcher.actions import (
+        TokenSearcherQandAPreprocessor,
+        TokenSearcherQandAPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.textual_q_and_a.transformers_task.transformers_q_and_a import (
+        TransformersTextualQandA
+    )
+    from utca.implementation.tasks.text_processing.textual_q_and_a.transformers_task.actions import (
+        QandAPostprocess
+    )
+
+    from utca.implementation.tasks.text_processing.ner.gliner_task.zero_shot_ner import (
+        GLiNER,
+        GLiNERInput,
+        GLiNEROutput,
+    )
+    from utca.implementation.tasks.text_processing.ner.gliner_task.actions import (
+        GLiNERPreprocessor,
+        GLiNERPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.chat.schema import (
+        ChatInput, ChatOutput
+    )
+    from utca.implementation.tasks.text_processing.chat.actions import (
+        ChatAddContext, ChatUpdateContext
+    )
+
+    from utca.implementation.tasks.text_processing.chat.openai.openai_chat import (
+        OpenAIChat,
+    )
+    from utca.implementation.tasks.text_processing.chat.openai.actions import (
+        OpenAIChatPreprocessor,
+        OpenAIChatPostprocessor,
+        OpenAIChatStreamPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.chat.transformers_task.transformers_chat import (
+        TransformersChat,
+    )
+    from utca.implementation.tasks.text_processing.chat.transformers_task.actions import (
+        ChatPreprocessor, 
+        ChatPostprocessor, 
+    )
+
+    from utca.implementation.tasks.text_processing.text_classification.transformers_task.text_classification import (
+        TransformersTextClassification,
+    )
+
+    from utca.implementation.tasks.text_processing.relation_extraction.schema import (
+        RelationExtractionInput,
+        RelationExtractionOutput,
+    )
+
+    from utca.implementation.tasks.text_processing.relation_extraction.token_searcher.relation_extraction import (
+        TokenSearcherRelationExtraction,
+    )
+    from utca.implementation.tasks.text_processing.relation_extraction.token_searcher.actions import (
+        TokenSearcherRelationExtractionPreprocessor,
+        TokenSearcherRelationExtractionPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.relation_extraction.gliner_task.relation_extraction import (
+        GLiNERRelationExtraction,
+    )
+    from utca.implementation.tasks.text_processing.relation_extraction.gliner_task.actions import (
+        GLiNERRelationExtractionPreprocessor,
+        GLiNERRelationExtractionPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.textual_q_and_a.gliner_task.q_and_a import (
+        GLiNERQandA,
+    )
+    from utca.implementation.tasks.text_processing.textual_q_and_a.gliner_task.actions import (
+        GLiNERQandAPreprocessor,
+        GLiNERQandAPostprocessor,
+    )
+
+    from utca.implementation.tasks.text_processing.function_call.transformers_task.main import (
+        TransformersFunctionCallInput,
+        TransformersFunctionCall,
+    )
+    from utca.implementation.tasks.text_processing.function_call.transformers_task.main import (
+        TransformersFunctionCallPreprocessor,
+        TransformersFunctionCallPostprocessor,
+    )
+
+__getattr__, __dir__ = lazy_import(__name__, {
+    "utca.implementation.tasks.audio_processing.text_to_speech.transformers_task.transformers_text_to_speech": [
+        "TransformersTextToSpeech",
+    ],
+    "utca.implementation.tasks.audio_processing.speech_to_text.whisper.whisper": [
+        "WhisperSpeechToText",
+    ],
+    "utca.implementation.tasks.image_processing.charts_and_plots_analysis.transformers_task.transformers_charts_and_plots_analysis": [
+        "TransformersChartsAndPlotsAnalysis",
+        "ChartsAndPlotsAnalysisInput",
+    ],
+    "utca.implementation.tasks.image_processing.charts_and_plots_analysis.transformers_task.actions": [
+        "ChartsAndPlotsAnalysisPreprocessor",
+        "ChartsAndPlotsAnalysisPostprocessor",
+    ],
+    "utca.implementation.tasks.image_processing.documents_q_and_a.transformers_task.transformers_layout_lm": [
+        "TransformersDocumentQandA",
+    ],
+    "utca.implementation.tasks.image_processing.image_classification.transformers_task.transformers_image_classification": [
+        "TransformersImageClassification",
+        "TransformersImageClassificationInput",
+        "TransformersImageClassificationOutput",
+        "TransformersImageClassificationMultilabelOutput",
+    ],
+    "utca.implementation.tasks.image_processing.image_classification.transformers_task.actions": [
+        "ImageClassificationPreprocessor",
+        "ImageClassificationSingleLabelPostprocessor",
+        "ImageClassificationMultilabelPostprocessor",
+    ],
+    "utca.implementation.tasks.image_processing.visual_q_and_a.transformers_task.transformers_visual_q_and_a": [
+        "TransformersVisualQandA",
+        "TransformersVisualQandAInput",
+        "TransformersVisualQandAOutput",
+        "TransformersVisualQandAMultianswerOutput",
+    ],
+    "utca.implementation.tasks.image_processing.visual_q_and_a.transformers_task.actions": [
+        "VisualQandAPreprocessor",
+        "VisualQandAMultianswerPostprocessor",
+        "VisualQandASingleAnswerPostprocessor",
+    ],
+    "utca.implementation.tasks.image_processing.object_detection.transformers_task.transformers_object_detection": [
+        "TransformersObjectDetection",
+        "TransformersObjectDetectionInput",
+        "TransformersObjectDetectionOutput",
+    ],
+    "utca.implementation.tasks.image_processing.object_detection.transformers_task.actions": [
+        "ObjectDetectionPreprocessor",
+        "DETRPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.clean_text.token_searcher.token_searcher": [
+        "TokenSearcherTextCleaner",
+        "TokenSearcherTextCleanerInput",
+        "TokenSearcherTextCleanerOutput",
+    ],
+    "utca.implementation.tasks.text_processing.clean_text.token_searcher.actions": [
+        "TokenSearcherTextCleanerPreprocessor",
+        "TokenSearcherTextCleanerPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.embedding.transformers_task.transformers_embedding": [
+        "TransformersTextEmbedding",
+        "TextEmbeddingInput",
+        "TextEmbeddingOutput",
+    ],
+    "utca.implementation.tasks.text_processing.embedding.transformers_task.actions": [
+        "EmbeddingPreprocessor",
+        "EmbeddingPostprocessor",
+        "ConvertEmbeddingsToNumpyArrays",
+    ],
+    "utca.implementation.tasks.text_processing.entity_linking.transformers_task.transformers_entity_linking": [
+        "TransformersEntityLinking",
+        "EntityLinkingInput",
+        "EntityLinkingOutput",
+    ],
+    "utca.implementation.tasks.text_processing.entity_linking.transformers_task.actions": [
+        "EntityLinkingPreprocessor",
+        "EntityLinkingPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.ner.token_searcher.token_searcher": [
+        "TokenSearcherNER",
+        "TokenSearcherNERInput",
+        "TokenSearcherNEROutput",
+    ],
+    "utca.implementation.tasks.text_processing.ner.token_searcher.actions": [
+        "TokenSearcherNERPreprocessor",
+        "TokenSearcherNERPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.ner.transformers_ner.transformers_token_classification": [
+        "TransformersTokenClassifier",
+        "TransformersTokenClassifierOutput",
+    ],
+    "utca.implementation.tasks.text_processing.ner.transformers_ner.actions": [
+        "TokenClassifierPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.summarization.transformers_task.transformers_summarization": [
+        "TransformersTextSummarization",
+        "SummarizationInput",
+        "SummarizationOutput",
+    ],
+    "utca.implementation.tasks.text_processing.summarization.transformers_task.actions": [
+        "SummarizationPostprocess",
+    ],
+    "utca.implementation.tasks.text_processing.text_classification.comprehend_it.comprehend_it": [
+        "ComprehendIt",
+    ],
+    "utca.implementation.tasks.text_processing.textual_q_and_a.token_searcher.token_searcher": [
+        "TokenSearcherQandA",
+        "TokenSearcherQandAInput",
+        "TokenSearcherQandAOutput",
+    ],
+    "utca.implementation.tasks.text_processing.textual_q_and_a.token_searcher.actions": [
+        "TokenSearcherQandAPreprocessor",
+        "TokenSearcherQandAPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.textual_q_and_a.transformers_task.transformers_q_and_a": [
+        "TransformersTextualQandA",
+    ],
+    "utca.implementation.tasks.text_processing.textual_q_and_a.transformers_task.actions": [
+        "QandAPostprocess",
+    ],
+    "utca.implementation.tasks.text_processing.ner.gliner_task.zero_shot_ner": [
+        "GLiNER",
+        "GLiNERInput",
+        "GLiNEROutput",
+    ],
+    "utca.implementation.tasks.text_processing.ner.gliner_task.actions": [
+        "GLiNERPreprocessor",
+        "GLiNERPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.chat.schema": [
+        "ChatInput",
+        "ChatOutput",
+    ],
+    "utca.implementation.tasks.text_processing.chat.actions": [
+        "ChatAddContext",
+        "ChatUpdateContext",
+    ],
+    "utca.implementation.tasks.text_processing.chat.openai.openai_chat": [
+        "OpenAIChat",
+    ],
+    "utca.implementation.tasks.text_processing.chat.openai.actions": [
+        "OpenAIChatPreprocessor",
+        "OpenAIChatPostprocessor",
+        "OpenAIChatStreamPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.chat.transformers_task.transformers_chat": [
+        "TransformersChat",
+    ],
+    "utca.implementation.tasks.text_processing.chat.transformers_task.actions": [
+        "ChatPreprocessor",
+        "ChatPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.text_classification.transformers_task.text_classification": [
+        "TransformersTextClassification",
+    ],
+    "utca.implementation.tasks.text_processing.relation_extraction.schema": [
+        "RelationExtractionInput",
+        "RelationExtractionOutput",
+    ],
+    "utca.implementation.tasks.text_processing.relation_extraction.token_searcher.relation_extraction": [
+        "TokenSearcherRelationExtraction",
+    ],
+    "utca.implementation.tasks.text_processing.relation_extraction.token_searcher.actions": [
+        "TokenSearcherRelationExtractionPreprocessor",
+        "TokenSearcherRelationExtractionPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.relation_extraction.gliner_task.relation_extraction": [
+        "GLiNERRelationExtraction",
+    ],
+    "utca.implementation.tasks.text_processing.relation_extraction.gliner_task.actions": [
+        "GLiNERRelationExtractionPreprocessor",
+        "GLiNERRelationExtractionPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.textual_q_and_a.gliner_task.q_and_a": [
+        "GLiNERQandA",
+    ],
+    "utca.implementation.tasks.text_processing.textual_q_and_a.gliner_task.actions": [
+        "GLiNERQandAPreprocessor",
+        "GLiNERQandAPostprocessor",
+    ],
+    "utca.implementation.tasks.text_processing.function_call.transformers_task.main": [
+        "TransformersFunctionCallInput",
+        "TransformersFunctionCall",
+        "TransformersFunctionCallPreprocessor",
+        "TransformersFunctionCallPostprocessor",
+    ],
+})
 
 __all__ = [
     # Audio processing
@@ -333,4 +525,4 @@ __all__ = [
     "TransformersFunctionCall",
     "TransformersFunctionCallPreprocessor",
     "TransformersFunctionCallPostprocessor",
-]
\ No newline at end of file
+]
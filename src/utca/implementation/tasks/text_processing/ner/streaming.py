@@ -0,0 +1,111 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from utca.core.executable_level_1.interpreter import Evaluator
+from utca.core.task_level_3.task import NERTask
+from utca.implementation.tasks.text_processing.utils import Chunker, stream_chunks
+
+def shift_entity(entity: Any, shift: int) -> Any:
+    """
+    Move entity positions from chunk to source text
+
+    Args:
+        entity (Any): Entity as model or dict.
+
+        shift (int): Chunk start position.
+
+    Returns:
+        Any: Entity of the same type with shifted positions.
+    """
+    if isinstance(entity, dict):
+        return {**entity, "start": entity["start"] + shift, "end": entity["end"] + shift}
+    return entity.model_copy(
+        update={"start": entity.start + shift, "end": entity.end + shift}
+    )
+
+
+def preprocess_chunker(preprocess: Any) -> Chunker:
+    """
+    Chunker of task preprocessor, so that streamed text is split into the same
+    chunks as text passed to run
+
+    Args:
+        preprocess (Any): Preprocessor of task.
+
+    Raises:
+        ValueError: If preprocessor doesn't define chunker (e.g. ExecutionSchema
+            or custom action).
+
+    Returns:
+        Chunker: Chunker of preprocessor.
+    """
+    chunker = getattr(preprocess, "chunker", None)
+    if not isinstance(chunker, Chunker):
+        raise ValueError(
+            f"Chunker of {preprocess.__class__.__name__} is unknown. "
+            "Chunker should be provided explicitly."
+        )
+    return chunker
+
+
+def stream_entities(
+    task: NERTask[Any, Any],
+    source: Union[str, Iterable[str]],
+    inputs: Dict[str, Any],
+    sents_batch: int=10,
+    chunks_batch: int=8,
+    evaluator: Optional[Evaluator]=None,
+    chunker: Optional[Chunker]=None,
+) -> Iterator[Any]:
+    """
+    Run NER task over text incrementally. Text is split into chunks of sentences,
+    chunks are passed to the task in batches and found entities are yielded
+    as soon as batch is processed.
+
+    Args:
+        task (NERTask[Any, Any]): Task with "text" input.
+
+        source (Union[str, Iterable[str]]): Text or iterable of text pieces
+            (e.g. opened file).
+
+        inputs (Dict[str, Any]): Other task inputs (e.g. labels).
+
+        sents_batch (int, optional): Chunks size in sentences. Defaults to 10.
+
+        chunks_batch (int, optional): Number of chunks passed to one task execution.
+            Defaults to 8.
+
+        evaluator (Optional[Evaluator], optional): Evaluator in context of which executed.
+            If equals to None, default evaluator will be created. Defaults to None.
+
+        chunker (Optional[Chunker], optional): Defines sentence splitter and chunks size.
+            If provided, sents_batch is ignored. Defaults to None.
+
+    Yields:
+        Any: Entities with positions in source text.
+    """
+    if not evaluator:
+        evaluator = task.set_up_default_evaluator()
+
+    batch: List[Tuple[int, str]] = []
+    for chunk in stream_chunks(source, sents_batch, chunker=chunker):
+        batch.append(chunk)
+        if len(batch) < chunks_batch:
+            continue
+        yield from _process_batch(task, batch, inputs, evaluator)
+        batch = []
+    if batch:
+        yield from _process_batch(task, batch, inputs, evaluator)
+
+
+def _process_batch(
+    task: NERTask[Any, Any],
+    batch: List[Tuple[int, str]],
+    inputs: Dict[str, Any],
+    evaluator: Evaluator,
+) -> Iterator[Any]:
+    results = task.execute_batch(
+        [{**inputs, "text": chunk} for _, chunk in batch], evaluator
+    )
+    for (start, _), result in zip(batch, results):
+        for entity in result["output"]:
+            yield shift_entity(entity, start)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from utca.core.executable_level_1.actions import Action
 from utca.core.task_level_3.objects.objects import (
@@ -7,7 +7,7 @@ from utca.core.task_level_3.objects.objects import (
 from utca.implementation.predictors.token_searcher.utils import (
     build_entity
 )
-from utca.implementation.tasks.text_processing.utils import sent_tokenizer
+from utca.implementation.tasks.text_processing.utils import Chunker
 
 class TokenSearcherNERPreprocessor(Action[Dict[str, Any], Dict[str, Any]]):
     """
@@ -21,7 +21,7 @@ class TokenSearcherNERPreprocessor(Action[Dict[str, Any], Dict[str, Any]]):
 
     Returns:
         Dict[str, Any]: Expected keys:
-            "inputs" (List[str]): Model inputs;
+            "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
 
             "chunks_starts" (List[int]): Chunks start positions. Used by postprocessor;
             
@@ -37,6 +37,9 @@ Text:
         self, 
         sents_batch: int=10,
         name: Optional[str]=None,
+        *,
+        chunker: Optional[Chunker]=None,
+        shared_prefix: bool=True,
     ) -> None:
         """
         Args:
@@ -44,43 +47,39 @@ Text:
 
             name (Optional[str], optional): Name for identification. If equals to None,
                 class name will be used. Defaults to None.
+
+            chunker (Optional[Chunker], optional): Defines sentence splitter and chunks
+                size (e.g. token budget). If equals to None, Chunker with sents_batch and
+                default sentence splitter will be used. Defaults to None.
+
+            shared_prefix (bool, optional): If set to True, inputs are created as (prompt, chunk)
+                pairs. TokenSearcher pipeline tokenizes each prompt and chunk once and concatenates
+                token ids, instead of tokenizing prompt + chunk for every label. If tokenizer can't
+                encode segments separately, pairs are joined. Defaults to True.
         """
         super().__init__(name)
         self.sents_batch = sents_batch
+        self.chunker = chunker or Chunker(sents_batch)
+        self.shared_prefix = shared_prefix
 
     
-    def get_last_sentence_id(self, i: int, sentences_len: int) -> int:
-        return min(i + self.sents_batch, sentences_len) - 1
-
-
     def chunkanize(self, text: str) -> Tuple[List[str], List[int]]:
-        chunks: List[str] = []
-        starts: List[int] = []
-
-        sentences: List[Tuple[int, int]] = list(sent_tokenizer(text))
-
-        for i in range(0, len(sentences), self.sents_batch):
-            start = sentences[i][0]
-            starts.append(start)
-
-            last_sentence = self.get_last_sentence_id(i, len(sentences))
-            end = sentences[last_sentence][-1]
-
-            chunks.append(text[start:end])
-        return chunks, starts
+        return self.chunker(text)
 
 
     def get_inputs(
         self, chunks: List[str], labels: List[str]
-    ) -> Tuple[List[str], List[int]]:
-        inputs: List[str] = []
+    ) -> Tuple[List[Union[str, Tuple[str, str]]], List[int]]:
+        inputs: List[Union[str, Tuple[str, str]]] = []
         prompts_lens: List[int] = []
 
         for label in labels:
             prompt = self.prompt.format(label=label)
             prompts_lens.append(len(prompt))
             for chunk in chunks:
-                inputs.append(prompt + chunk)
+                inputs.append(
+                    (prompt, chunk) if self.shared_prefix else prompt + chunk
+                )
 
         return inputs, prompts_lens
 
@@ -97,7 +96,7 @@ Text:
 
         Returns:
             Dict[str, Any]: Expected keys:
-                "inputs" (List[str]): Model inputs;
+                "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
 
                 "chunks_starts" (List[int]): Chunks start positions. Used by postprocessor;
                 
@@ -182,6 +181,8 @@ class TokenSearcherNERPostprocessor(Action[Dict[str, Any], Dict[str, Any]]):
         outputs: List[ClassifiedEntity] = []
 
         for id, output in enumerate(input_data["output"]):
+            if not output or max(ent["score"] for ent in output) < self.threshold:
+                continue
             label = cast(str,
                 input_data["labels"]
                 [id//len(input_data["chunks_starts"])]
@@ -1,6 +1,7 @@
-from typing import Any, List, Optional, Type
+from typing import Any, Iterable, Iterator, List, Optional, Type, Union
 
 from utca.core.executable_level_1.component import Component
+from utca.core.executable_level_1.interpreter import Evaluator
 from utca.core.executable_level_1.schema import IOModel, Input
 from utca.core.predictor_level_2.predictor import Predictor
 from utca.core.task_level_3.task import NERTask
@@ -17,6 +18,10 @@ from utca.implementation.tasks.text_processing.ner.token_searcher.actions import
     TokenSearcherNERPreprocessor,
     TokenSearcherNERPostprocessor,
 )
+from utca.implementation.tasks.text_processing.ner.streaming import (
+    preprocess_chunker, stream_entities
+)
+from utca.implementation.tasks.text_processing.utils import Chunker
 
 class TokenSearcherNERInput(IOModel):
     """
@@ -85,4 +90,48 @@ class TokenSearcherNER(
             input_class=input_class,
             output_class=output_class,
             name=name,
-        )
\ No newline at end of file
+        )
+
+
+    def stream(
+        self,
+        source: Union[str, Iterable[str]],
+        labels: List[str],
+        chunks_batch: int=8,
+        evaluator: Optional[Evaluator]=None,
+        chunker: Optional[Chunker]=None,
+    ) -> Iterator[Any]:
+        """
+        Find entities in text incrementally. Text is split into chunks of sentences
+        while it is read, so memory usage doesn't depend on text size.
+
+        Arguments:
+            source (Union[str, Iterable[str]]): Text or iterable of text pieces
+                (e.g. opened file).
+
+            labels (List[str]): Labels for classification.
+
+            chunks_batch (int, optional): Number of chunks processed at once. Defaults to 8.
+
+            evaluator (Optional[Evaluator], optional): Evaluator in context of which executed.
+                If equals to None, default evaluator will be created. Defaults to None.
+
+            chunker (Optional[Chunker], optional): Splits text into chunks. Should match
+                chunker of preprocessor, so that results are the same as results of run.
+                If equals to None, chunker of preprocessor is used. Defaults to None.
+
+        Raises:
+            ValueError: If chunker isn't provided and preprocessor doesn't define it
+                (e.g. preprocess is ExecutionSchema).
+
+        Yields:
+            Any: Classified entities with positions in source text.
+        """
+        return stream_entities(
+            self,
+            source,
+            {"labels": labels},
+            chunks_batch=chunks_batch,
+            evaluator=evaluator,
+            chunker=chunker or preprocess_chunker(self._preprocess),
+        )
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Set, Generator, Optional, Tuple
+from typing import Any, Dict, List, Set, Generator, Optional, Tuple, Union
 
 from utca.core.executable_level_1.actions import Action
 from utca.implementation.predictors.token_searcher.utils import (
@@ -23,7 +23,7 @@ class TokenSearcherRelationExtractionPreprocessor(Action[Dict[str, Any], Dict[st
 
             "relations_labels" (List[str]): Corresponding relations labels;
 
-            "inputs" (List[str]): Model inputs;
+            "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
             
             "prompt_lengths" (List[int]): Prompt lenghts. Used by postprocessor;
     """
@@ -33,6 +33,26 @@ Identify target entity given the following realtion: "{relation}" and the follow
 
 Text:
 """
+    def __init__(
+        self, 
+        name: Optional[str]=None,
+        *,
+        shared_prefix: bool=True,
+    ) -> None:
+        """
+        Args:
+            name (Optional[str], optional): Name for identification. If equals to None,
+                class name will be used. Defaults to None.
+
+            shared_prefix (bool, optional): If set to True, inputs are created as (prompt, text)
+                pairs. TokenSearcher pipeline tokenizes text once for all prompts and concatenates
+                token ids, instead of tokenizing prompt + text for every source entity. If tokenizer
+                can't encode segments separately, pairs are joined. Defaults to True.
+        """
+        super().__init__(name)
+        self.shared_prefix = shared_prefix
+
+
     def create_prompt(self, span: str, relation: str):
         return self.prompt.format(relation=relation, entity=span)
     
@@ -95,7 +115,13 @@ Text:
         ]
 
 
-    def get_inputs(self, prompts: List[str], text: str) -> List[str]:
+    def get_inputs(
+        self, prompts: List[str], text: str
+    ) -> List[Union[str, Tuple[str, str]]]:
+        if self.shared_prefix:
+            return [
+                (p, text) for p in prompts
+            ]
         return [
             p + text for p in prompts
         ]
@@ -135,7 +161,7 @@ Text:
 
                 "relations_labels" (List[str]): Corresponding relations labels;
 
-                "inputs" (List[str]): Model inputs;
+                "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
                 
                 "prompt_lengths" (List[int]): Prompt lenghts. Used by postprocessor;
         """
@@ -4,7 +4,7 @@ from utca.core.executable_level_1.actions import Action
 from utca.core.task_level_3.objects.objects import (
     Entity
 )
-from utca.implementation.tasks.text_processing.utils import sent_tokenizer
+from utca.implementation.tasks.text_processing.utils import Chunker
 
 class GLiNERQandAPreprocessor(Action[Dict[str, Any], Dict[str, Any]]):
     """
@@ -31,6 +31,8 @@ class GLiNERQandAPreprocessor(Action[Dict[str, Any], Dict[str, Any]]):
         sents_batch: int=10,
         threshold: float=0.5,
         name: Optional[str]=None,
+        *,
+        chunker: Optional[Chunker]=None,
     ) -> None:
         """
         Args:
@@ -40,31 +42,19 @@ class GLiNERQandAPreprocessor(Action[Dict[str, Any], Dict[str, Any]]):
 
             name (Optional[str], optional): Name for identification. If equals to None,
                 class name will be used. Defaults to None.
+
+            chunker (Optional[Chunker], optional): Defines sentence splitter and chunks
+                size (e.g. token budget). If equals to None, Chunker with sents_batch and
+                default sentence splitter will be used. Defaults to None.
         """
         super().__init__(name)
         self.threshold = threshold
         self.sents_batch = sents_batch
+        self.chunker = chunker or Chunker(sents_batch)
 
     
-    def get_last_sentence_id(self, i: int, sentences_len: int) -> int:
-        return min(i + self.sents_batch, sentences_len) - 1
-
-
     def chunkanize(self, text: str) -> Tuple[List[str], List[int]]:
-        chunks: List[str] = []
-        starts: List[int] = []
-
-        sentences: List[Tuple[int, int]] = list(sent_tokenizer(text))
-
-        for i in range(0, len(sentences), self.sents_batch):
-            start = sentences[i][0]
-            starts.append(start)
-
-            last_sentence = self.get_last_sentence_id(i, len(sentences))
-            end = sentences[last_sentence][-1]
-
-            chunks.append(text[start:end])
-        return chunks, starts
+        return self.chunker(text)
     
 
     def execute(
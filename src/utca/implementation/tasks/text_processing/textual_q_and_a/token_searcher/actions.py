@@ -16,11 +16,32 @@ class TokenSearcherQandAPreprocessor(Action[Dict[str, Any], Dict[str, Any]]):
             "question" (str): Question to answer.
     Returns:
         Dict[str, Any]: Expected keys:
-            "inputs" (List[str]): Model inputs;
+            "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
     """
     prompt: str = """{question}
 Text:
 {text}"""
+    def __init__(
+        self, 
+        name: Optional[str]=None,
+        *,
+        shared_prefix: bool=True,
+    ) -> None:
+        """
+        Args:
+            name (Optional[str], optional): Name for identification. If equals to None,
+                class name will be used. Defaults to None.
+
+            shared_prefix (bool, optional): If set to True, input is created as (prompt, text)
+                pair. TokenSearcher pipeline tokenizes prompt and text separately and caches
+                tokenized segments, so that text asked with different questions is tokenized
+                once. If tokenizer can't encode segments separately, pair is joined. 
+                Defaults to True.
+        """
+        super().__init__(name)
+        self.shared_prefix = shared_prefix
+
+
     def execute(
         self, input_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -32,8 +53,15 @@ Text:
                 "question" (str): Question to answer.
         Returns:
             Dict[str, Any]: Expected keys:
-                "inputs" (List[str]): Model inputs;
+                "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
         """
+        if self.shared_prefix:
+            return {
+                "inputs": [(
+                    self.prompt.format(question=input_data["question"], text=""),
+                    input_data["text"],
+                )]
+            }
         return {
             "inputs": [
                 self.prompt.format(
@@ -52,7 +80,7 @@ class TokenSearcherQandAPostprocessor(Action[Dict[str, Any], Dict[str, Any]]):
         input_data (Dict[str, Any]): Expected keys:
             "output" (List[List[Dict[str, Any]]]): Model output;
 
-            "inputs" (List[str]): Model inputs;
+            "inputs" (List[Union[str, Tuple[str, str]]]): Model inputs;
 
             "text" (str): Processed text;
 
@@ -93,7 +121,8 @@ class TokenSearcherQandAPostprocessor(Action[Dict[str, Any], Dict[str, Any]]):
                 for output in input_data["output"]
                 for ent in output 
                 if (entity := build_entity(
-                    input_data["inputs"][0],
+                    # joins (prompt, text) pair, string input is unchanged
+                    "".join(input_data["inputs"][0]),
                     ent,
                     self.threshold
                 ))
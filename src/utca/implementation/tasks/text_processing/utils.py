@@ -1,10 +1,349 @@
-from typing import Tuple, Iterator, cast
+from typing import (
+    Any, Callable, FrozenSet, Iterable, List, Optional, Tuple, Iterator, Union, cast
+)
+from abc import ABC, abstractmethod
+from functools import lru_cache
+import re
 
-import nltk
-from nltk.tokenize import PunktTokenizer
+@lru_cache(maxsize=None)
+def punkt_tokenizer(language: str="english") -> Any:
+    """
+    Punkt sentence tokenizer. NLTK data is downloaded on first use
+    """
+    import nltk
+    from nltk.tokenize import PunktTokenizer
+
+    nltk.download('punkt_tab', quiet=True)
+    return PunktTokenizer(language)
+
+
+class SentenceSplitter(ABC):
+    """
+    Base class for sentence splitters
+    """
+    @abstractmethod
+    def span_tokenize(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Find sentences in text
+
+        Args:
+            text (str): Text to split.
+
+        Yields:
+            Tuple[int, int]: Start and end positions of sentence.
+        """
+        ...
+
+
+    def __call__(self, text: str) -> Iterator[Tuple[int, int]]:
+        return self.span_tokenize(text)
+
+
+class PunktSentenceSplitter(SentenceSplitter):
+    """
+    NLTK Punkt splitter. Tokenizer is created once per language and shared
+    between splitters
+    """
+    def __init__(self, language: str="english") -> None:
+        """
+        Args:
+            language (str, optional): Punkt model language. Defaults to "english".
+        """
+        self.language = language
+
+
+    def span_tokenize(self, text: str) -> Iterator[Tuple[int, int]]:
+        return cast(
+            Iterator[Tuple[int, int]],
+            punkt_tokenizer(self.language).span_tokenize(text) # type: ignore
+        )
+
+
+class RegexSentenceSplitter(SentenceSplitter):
+    """
+    Rule-based splitter. Sentence ends with terminal punctuation followed by
+    whitespace and not lowercase character, or with empty line. Known abbreviations
+    and initials are not treated as sentence ends. Doesn't require NLTK data and
+    is significantly faster than Punkt, but less accurate on unusual texts.
+    """
+    abbreviations: FrozenSet[str] = frozenset((
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e",
+        "inc", "ltd", "co", "corp", "no", "nos", "fig", "figs", "al", "approx", "dept",
+        "est", "vol", "ed", "eds", "p", "pp", "cf", "jan", "feb", "mar", "apr", "jun",
+        "jul", "aug", "sep", "sept", "oct", "nov", "dec", "u.s", "u.k", "ph.d",
+    ))
+    """
+    Lowercase abbreviations without trailing period
+    """
+    boundary = re.compile(r"[.!?…]+[\"'”’»)\]]*(?=\s)|\n[ \t]*\n")
+    not_space = re.compile(r"\S")
+
+    def __init__(self, abbreviations: Optional[Iterable[str]]=None) -> None:
+        """
+        Args:
+            abbreviations (Optional[Iterable[str]], optional): Additional abbreviations
+                (e.g. "approx"). Case insensitive, trailing period is optional.
+                Defaults to None.
+        """
+        if abbreviations:
+            self.abbreviations = self.abbreviations | {
+                a.lower().rstrip(".") for a in abbreviations
+            }
+
+
+    def is_abbreviation(self, text: str, end: int) -> bool:
+        """
+        Check if period at position end is part of abbreviation or initial
+        """
+        word = text[max(0, end - 16):end].rsplit(maxsplit=1)[-1:]
+        if not word:
+            return False
+        token = word[0].lstrip("(\"'“‘«[")
+        return (
+            (len(token) == 1 and token.isalpha())
+            or token.lower() in self.abbreviations
+        )
+
+
+    def span_tokenize(self, text: str) -> Iterator[Tuple[int, int]]:
+        first = self.not_space.search(text)
+        if first is None:
+            return
+        start = first.start()
+        for match in self.boundary.finditer(text, start):
+            following = self.not_space.search(text, match.end())
+            if following is None:
+                break
+            if match.group()[0] != "\n":
+                if text[following.start()].islower():
+                    continue
+                if match.group()[0] == "." and self.is_abbreviation(text, match.start()):
+                    continue
+                end = match.end()
+            else:
+                end = len(text[:match.start()].rstrip())
+            if end > start:
+                yield start, end
+            start = following.start()
+        end = len(text.rstrip())
+        if end > start:
+            yield start, end
+
+
+default_sentence_splitter: SentenceSplitter = PunktSentenceSplitter()
+"""
+Splitter used if preprocessor doesn't specify one
+"""
 
-nltk.download('punkt_tab', quiet=True)
-tokenizer = PunktTokenizer()
 
 def sent_tokenizer(text: str) -> Iterator[Tuple[int, int]]:
-    return cast(Iterator[Tuple[int, int]], tokenizer.span_tokenize(text)) # type: ignore
\ No newline at end of file
+    return default_sentence_splitter.span_tokenize(text)
+
+
+def _count_words(text: str) -> int:
+    return len(text.split())
+
+
+class Chunker:
+    """
+    Groups sentences into chunks either by number of sentences or by token budget,
+    so that chunks fill model context evenly
+    """
+    def __init__(
+        self,
+        sents_batch: Optional[int]=10,
+        max_tokens: Optional[int]=None,
+        length_function: Optional[Callable[[str], int]]=None,
+        sentence_splitter: Optional[SentenceSplitter]=None,
+    ) -> None:
+        """
+        Args:
+            sents_batch (Optional[int], optional): Maximum chunk size in sentences.
+                If equals to None, number of sentences is not limited. Defaults to 10.
+
+            max_tokens (Optional[int], optional): Maximum chunk size in tokens. Chunk
+                is extended with sentences while its size fits into budget. Sentence longer
+                than budget forms separate chunk. If equals to None, chunks are created by
+                sents_batch only. Defaults to None.
+
+            length_function (Optional[Callable[[str], int]], optional): Counts tokens
+                of sentence. Chunk size is estimated as sum of its sentences sizes. If equals
+                to None, words are counted. Defaults to None.
+
+            sentence_splitter (Optional[SentenceSplitter], optional): Splitter to use.
+                If equals to None, default_sentence_splitter (Punkt) will be used.
+                Defaults to None.
+        """
+        if sents_batch is None and max_tokens is None:
+            raise ValueError("Either sents_batch or max_tokens should be provided.")
+        self.sents_batch = sents_batch
+        self.max_tokens = max_tokens
+        self.length_function = length_function or _count_words
+        self.sentence_splitter = sentence_splitter
+
+
+    @classmethod
+    def from_tokenizer(
+        cls,
+        tokenizer: Any,
+        max_tokens: int,
+        sents_batch: Optional[int]=None,
+        sentence_splitter: Optional[SentenceSplitter]=None,
+    ) -> "Chunker":
+        """
+        Create chunker that counts tokens with transformers tokenizer
+
+        Args:
+            tokenizer (Any): Tokenizer of model.
+
+            max_tokens (int): Maximum chunk size in tokens. Prompt and special tokens
+                should be subtracted from model maximum length.
+
+            sents_batch (Optional[int], optional): Maximum chunk size in sentences.
+                Defaults to None.
+
+            sentence_splitter (Optional[SentenceSplitter], optional): Splitter to use.
+                Defaults to None.
+
+        Returns:
+            Chunker: Chunker.
+        """
+        return cls(
+            sents_batch=sents_batch,
+            max_tokens=max_tokens,
+            length_function=lambda text: len(
+                tokenizer(text, add_special_tokens=False)["input_ids"]
+            ),
+            sentence_splitter=sentence_splitter,
+        )
+
+
+    def split(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find sentences in text
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            List[Tuple[int, int]]: Start and end positions of sentences.
+        """
+        splitter = self.sentence_splitter or default_sentence_splitter
+        return list(splitter.span_tokenize(text))
+
+
+    def group(
+        self, text: str, sentences: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """
+        Group sentences into chunks
+
+        Args:
+            text (str): Text.
+
+            sentences (List[Tuple[int, int]]): Sentences positions.
+
+        Returns:
+            List[Tuple[int, int]]: Indexes of first and last sentences of chunks.
+        """
+        if self.max_tokens is None:
+            size = cast(int, self.sents_batch)
+            return [
+                (i, min(i + size, len(sentences)) - 1)
+                for i in range(0, len(sentences), size)
+            ]
+
+        groups: List[Tuple[int, int]] = []
+        first = 0
+        tokens = 0
+        for i, (start, end) in enumerate(sentences):
+            length = self.length_function(text[start:end])
+            if i > first and (
+                tokens + length > self.max_tokens
+                or (self.sents_batch is not None and i - first >= self.sents_batch)
+            ):
+                groups.append((first, i - 1))
+                first = i
+                tokens = 0
+            tokens += length
+        if sentences:
+            groups.append((first, len(sentences) - 1))
+        return groups
+
+
+    def __call__(self, text: str) -> Tuple[List[str], List[int]]:
+        """
+        Split text into chunks
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            Tuple[List[str], List[int]]: Chunks and their start positions.
+        """
+        sentences = self.split(text)
+        chunks: List[str] = []
+        starts: List[int] = []
+        for first, last in self.group(text, sentences):
+            start, end = sentences[first][0], sentences[last][1]
+            chunks.append(text[start:end])
+            starts.append(start)
+        return chunks, starts
+
+
+def stream_chunks(
+    source: Union[str, Iterable[str]],
+    sents_batch: int=10,
+    max_buffer_size: int=1_000_000,
+    chunker: Optional[Chunker]=None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Split text into chunks of sentences incrementally. Only the last, possibly
+    incomplete, sentence and sentences of the current chunk are kept in memory.
+
+    Args:
+        source (Union[str, Iterable[str]]): Text or iterable of text pieces 
+            (e.g. opened file).
+
+        sents_batch (int, optional): Chunks size in sentences. Used if chunker
+            isn't provided. Defaults to 10.
+
+        max_buffer_size (int, optional): Maximum number of buffered characters. If text 
+            contains no sentence boundary within this size, buffered text is emitted as 
+            a chunk. Defaults to 1_000_000.
+
+        chunker (Optional[Chunker], optional): Chunker that defines sentence splitter
+            and chunks size. Defaults to None.
+
+    Yields:
+        Tuple[int, str]: Chunk start position in source text and chunk.
+    """
+    if isinstance(source, str):
+        source = (source,)
+    if chunker is None:
+        chunker = Chunker(sents_batch)
+
+    buffer = ""
+    offset = 0
+    for piece in source:
+        buffer += piece
+        sentences = chunker.split(buffer)
+        # last sentence can be continued by the next piece, and 
+        # last chunk can be extended with the following sentences
+        groups = chunker.group(buffer, sentences[:-1])
+        for first, last in groups[:-1]:
+            start, end = sentences[first][0], sentences[last][1]
+            yield offset + start, buffer[start:end]
+        if groups:
+            cut = sentences[groups[-1][0]][0]
+        elif len(sentences) == 1 and len(buffer) > max_buffer_size:
+            yield offset + sentences[0][0], buffer[sentences[0][0]:]
+            cut = len(buffer)
+        else:
+            cut = sentences[0][0] if sentences else len(buffer)
+        buffer = buffer[cut:]
+        offset += cut
+
+    chunks, starts = chunker(buffer)
+    for start, chunk in zip(starts, chunks):
+        yield offset + start, chunk
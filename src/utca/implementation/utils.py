@@ -0,0 +1,39 @@
+from typing import Any, Callable, Dict, List, Tuple
+import importlib
+import sys
+
+def lazy_import(
+    module_name: str, imports: Dict[str, List[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create module level __getattr__ and __dir__ (PEP 562), that import attributes
+    from submodules on first access. Dependencies of a submodule are loaded only
+    if one of its attributes is used.
+
+    Args:
+        module_name (str): Name of module that exposes attributes.
+
+        imports (Dict[str, List[str]]): Names of attributes by submodule.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: __getattr__ and __dir__.
+    """
+    sources = {
+        name: submodule
+        for submodule, names in imports.items()
+        for name in names
+    }
+
+    def __getattr__(name: str) -> Any:
+        submodule = sources.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+
+    def __dir__() -> List[str]:
+        return sorted({*vars(sys.modules[module_name]), *sources})
+
+    return __getattr__, __dir__
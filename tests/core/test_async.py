@@ -0,0 +1,131 @@
+from typing import Any, Dict, List
+import asyncio
+import copy
+import time
+
+from .utils import MyExecutable, MyIO
+from utca.core import (
+    Evaluator,
+    Executable,
+    ExecuteFunction,
+    Condition,
+    Transformable,
+    ForEach,
+    ForEachMode,
+    Filter,
+    Branch,
+    Switch,
+    While,
+    BREAK,
+)
+
+class MyAsyncExecutable(MyExecutable):
+    async def ainvoke(self, input_data: MyIO, evaluator: Evaluator) -> Dict[str, Any]:
+        await asyncio.sleep(0.05)
+        return {"f": input_data.f + 1}
+
+
+class MySleepingExecutable(MyExecutable):
+    def invoke(self, input_data: MyIO, evaluator: Evaluator) -> Dict[str, Any]:
+        time.sleep(0.05)
+        return {"f": input_data.f + 1}
+
+
+def test_async_pipeline():
+    example = MyExecutable()
+    pipeline = (
+        example
+        | MyAsyncExecutable()
+        | ExecuteFunction(lambda x: {"f": x["f"] + 1})
+        | example.use(set_key="output")
+        | example.use(
+            get_key="output",
+            set_key="result"
+        )
+    )
+    res = asyncio.run(pipeline.arun({"f": 1}))
+    assert res["f"] == 4
+    assert res["result"]["f"] == 6
+    assert res == pipeline.run({"f": 1})
+
+
+def test_async_concurrent_pipelines():
+    pipeline = MyAsyncExecutable() | MySleepingExecutable()
+
+    async def main() -> List[Dict[str, Any]]:
+        return await asyncio.gather(*(
+            Evaluator(pipeline).arun({"f": i}) for i in range(20)
+        ))
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    assert time.perf_counter() - start < 20 * 0.1
+    assert [r["f"] for r in results] == [i + 2 for i in range(20)]
+
+
+def test_async_executor_list():
+    inputs = {"a": [{"f": i} for i in range(10)]}
+    res = asyncio.run(MyAsyncExecutable().use("a", "a").arun(copy.deepcopy(inputs)))
+    assert [i["f"] for i in res["a"]] == [i + 1 for i in range(10)]
+
+
+def test_async_structural_components():
+    async def async_condition(input_data: Transformable, evaluator: Evaluator) -> bool:
+        return input_data["f"] < 5
+
+    condition = Condition(
+        validator=lambda x, e: x["f"] % 2 == 0, # type: ignore
+        schema=ExecuteFunction(lambda x: x),
+    )
+    example = MyAsyncExecutable()
+
+    res = asyncio.run(While(schema=example, condition=async_condition).arun({"f": 0}))
+    assert res["f"] == 5
+
+    res = asyncio.run(While(schema=BREAK | example, max_iterations=10).arun({"f": 0}))
+    assert res["f"] == 0
+
+    switch = Switch(
+        Branch(example | example, condition=condition),
+        Branch(example),
+    )
+    assert asyncio.run(switch.arun({"f": 0}))["f"] == 2
+    assert asyncio.run(switch.arun({"f": 1}))["f"] == 2
+
+    res = asyncio.run(ForEach(example, get_key="fs").arun({
+        "fs": [{"f": i} for i in range(10)]
+    }))
+    assert [i["f"] for i in res["fs"]] == [i + 1 for i in range(10)]
+
+    res = asyncio.run(Filter(condition, get_key="fs").arun({
+        "fs": [{"f": i} for i in range(10)]
+    }))
+    assert [i["f"] for i in res["fs"]] == [0, 2, 4, 6, 8]
+
+
+def test_async_error():
+    class Failing(Executable[MyIO, MyIO]):
+        def __init__(self) -> None:
+            super().__init__(MyIO, MyIO)
+
+        def invoke(self, input_data: MyIO, evaluator: Evaluator) -> Dict[str, Any]:
+            raise ValueError("Failed")
+
+    try:
+        asyncio.run(Evaluator(MyExecutable() | Failing()).arun({"f": 0}))
+        raise AssertionError("Should throw error!")
+    except AssertionError as e:
+        raise e
+    except Exception as e:
+        assert "Failed" in str(e)
+
+
+def test_async_for_each_in_running_loop():
+    for_each = ForEach(MyExecutable(), get_key="fs", mode=ForEachMode.ASYNCIO)
+
+    async def main() -> Dict[str, Any]:
+        # synchronous run inside event loop falls back to thread pool
+        return for_each.run({"fs": [{"f": i} for i in range(5)]})
+
+    res = asyncio.run(main())
+    assert [i["f"] for i in res["fs"]] == [1, 2, 3, 4, 5]
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List, Type, Union
+import threading
+
+from utca.core import (
+    IOModel,
+    Evaluator,
+    Predictor,
+    BatchPredictor,
+)
+
+class BatchInput(IOModel):
+    inputs: Union[int, List[int]]
+    shift: int=1
+
+
+class BatchOutput(IOModel):
+    output: Union[int, List[int]]
+
+
+class MyPredictor(Predictor[BatchInput, BatchOutput]):
+    def __init__(
+        self,
+        input_class: Type[BatchInput]=BatchInput,
+        output_class: Type[BatchOutput]=BatchOutput,
+    ):
+        super().__init__(input_class, output_class)
+        self.calls: List[int] = []
+
+
+    def invoke(self, input_data: BatchInput, evaluator: Evaluator) -> Dict[str, Any]:
+        inputs = input_data.inputs
+        if isinstance(inputs, int):
+            inputs = [inputs]
+        self.calls.append(len(inputs))
+        return {"output": [i + input_data.shift for i in inputs]}
+
+
+    @property
+    def config(self) -> Any:
+        return None
+
+
+def run_concurrently(
+    predictor: BatchPredictor[Any, Any], inputs: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = [{} for _ in inputs]
+    barrier = threading.Barrier(len(inputs))
+
+    def call(i: int) -> None:
+        barrier.wait()
+        results[i] = predictor.run(inputs[i])
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(inputs))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_batch_predictor_scatters_results():
+    predictor = MyPredictor()
+    batched = BatchPredictor(predictor, max_batch_size=64, max_wait_ms=200)
+
+    inputs: List[Dict[str, Any]] = [
+        {"inputs": i} if i % 2 else {"inputs": [i, i]}
+        for i in range(16)
+    ]
+    results = run_concurrently(batched, inputs)
+
+    for i, res in enumerate(results):
+        if i % 2:
+            assert res["output"] == i + 1
+        else:
+            assert res["output"] == [i + 1, i + 1]
+    assert len(predictor.calls) < len(inputs)
+    assert sum(predictor.calls) == 24
+
+
+def test_batch_predictor_limits():
+    predictor = MyPredictor()
+    batched = BatchPredictor(predictor, max_batch_size=4, max_wait_ms=50)
+
+    results = run_concurrently(batched, [{"inputs": i} for i in range(12)])
+
+    assert [r["output"] for r in results] == [i + 1 for i in range(12)]
+    assert max(predictor.calls) <= 4
+
+
+def test_batch_predictor_groups_parameters():
+    predictor = MyPredictor()
+    batched = BatchPredictor(predictor, max_wait_ms=100)
+
+    results = run_concurrently(batched, [
+        {"inputs": i, "shift": i % 2} for i in range(8)
+    ])
+
+    assert [r["output"] for r in results] == [i + i % 2 for i in range(8)]
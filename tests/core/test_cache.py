@@ -0,0 +1,80 @@
+from typing import Any, Dict, List
+import asyncio
+
+from .utils import MyExecutable, MyIO
+from utca.core import (
+    Evaluator,
+    Cached,
+    MemoryCacheStore,
+    SQLiteCacheStore,
+)
+from utca.core.executable_level_1.cache import MISSING
+
+class CountingExecutable(MyExecutable):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: List[int] = []
+
+    def invoke(self, input_data: MyIO, evaluator: Evaluator) -> Dict[str, Any]:
+        self.calls.append(input_data.f)
+        return super().invoke(input_data, evaluator)
+
+
+def test_cached():
+    executable = CountingExecutable()
+    cached = Cached(executable)
+
+    assert [cached.run({"f": i % 3})["f"] for i in range(9)] == [1, 2, 3] * 3
+    assert executable.calls == [0, 1, 2]
+    assert cached.stats["hits"] == 6
+    assert cached.stats["misses"] == 3
+    assert asyncio.run(cached.arun({"f": 0})) == {"f": 1}
+
+    res = cached.use("a", "a", batch_size=10).run({
+        "a": [{"f": i} for i in range(5)]
+    })
+    assert [i["f"] for i in res["a"]] == [1, 2, 3, 4, 5]
+    assert executable.calls == [0, 1, 2, 3, 4]
+
+
+def test_memory_cache_store_eviction():
+    store = MemoryCacheStore(max_size=2)
+    cached = Cached(CountingExecutable(), store=store)
+    for i in (0, 1, 0, 2, 1):
+        cached.run({"f": i})
+    assert cached.stats["evictions"] == 2
+    assert cached.stats["size"] == 2
+    assert cached.stats["hits"] == 1
+
+    store = MemoryCacheStore(ttl=0)
+    store.set("a", 1)
+    assert store.get("a") is MISSING and len(store) == 0
+    assert store.evictions == 1
+
+
+def test_sqlite_cache_store(tmp_path: Any):
+    path = str(tmp_path / "cache.db")
+    executable = CountingExecutable()
+    Cached(executable, store=SQLiteCacheStore(path)).run({"f": 1})
+
+    cached = Cached(executable, store=SQLiteCacheStore(path, max_size=2))
+    assert cached.run({"f": 1}) == {"f": 2}
+    assert executable.calls == [1]
+    for i in range(3):
+        cached.run({"f": i})
+    assert cached.stats["size"] == 2
+    assert cached.stats["evictions"] == 1
+
+
+def test_memory_cache_store_copies_containers():
+    store = MemoryCacheStore()
+    leaf = bytearray(b"a")
+    value = {"output": [{"f": 1}], "leaf": leaf}
+    store.set("a", value)
+    value["output"][0]["f"] = 2
+
+    result = store.get("a")
+    assert result == {"output": [{"f": 1}], "leaf": leaf}
+    assert result["leaf"] is leaf # other objects are not copied
+    result["output"].append({"f": 3})
+    assert store.get("a")["output"] == [{"f": 1}]
@@ -0,0 +1,73 @@
+from typing import Any, ClassVar, Dict
+import asyncio
+
+from .utils import MyExecutable, MyIO
+from utca.core import (
+    Evaluator,
+    ExecutionSchema,
+    ExecuteFunction,
+    RenameAttribute,
+    SetValue,
+    CompiledSchema,
+)
+
+class CountingIO(MyIO):
+    validations: ClassVar[int]=0
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        CountingIO.validations += 1
+
+
+class CountingExecutable(MyExecutable):
+    def __init__(self) -> None:
+        super().__init__(CountingIO, CountingIO) # type: ignore
+
+
+def test_compiled_schema():
+    nested = MyExecutable() | ExecuteFunction(lambda x: {"f": x["f"] * 2})
+    schema = (
+        ExecutionSchema(MyExecutable())
+        | nested
+        | SetValue("g", 1)
+        | RenameAttribute("g", "h")
+        | MyExecutable().use(set_key="output")
+    )
+    compiled = schema.compile()
+
+    assert isinstance(compiled, CompiledSchema)
+    assert len(compiled.plan) == 4
+    assert compiled.run({"f": 0}) == schema.run({"f": 0})
+    assert asyncio.run(compiled.arun({"f": 0})) == schema.run({"f": 0})
+
+
+def test_compiled_schema_skips_validation():
+    schema = CountingExecutable() | CountingExecutable() | CountingExecutable()
+    compiled = schema.compile()
+    assert compiled.describe()[1:] == [
+        "CountingExecutable(trusted input)", "CountingExecutable(trusted input)"
+    ]
+
+    CountingIO.validations = 0
+    assert schema.run({"f": 0}) == {"f": 3}
+    expected = CountingIO.validations
+
+    CountingIO.validations = 0
+    assert compiled.run({"f": 0}) == {"f": 3}
+    assert CountingIO.validations < expected
+
+
+def test_compiled_schema_errors():
+    def fail(input_data: Dict[str, Any]) -> Dict[str, Any]:
+        raise ValueError("Failed")
+
+    schema = MyExecutable() | ExecuteFunction(fail) | MyExecutable()
+    res = Evaluator(schema.compile(), fast_exit=False).run({"f": 0})
+    assert res == {"f": 2}
+    try:
+        schema.compile().run({"f": 0})
+        raise AssertionError("Should throw error!")
+    except AssertionError as e:
+        raise e
+    except Exception as e:
+        assert "Failed" in str(e)
@@ -1,6 +1,12 @@
-from .utils import MyExecutable
+from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import copy
 
-from utca.core import ReplacingScope
+from .utils import MyExecutable, MyIO
+
+from utca.core import (
+    ReplacingScope, Evaluator, ValidationMode, IOModel, ExecutionSchema
+)
 
 def test_executable():
     # use default overwrite behaviour
@@ -62,4 +68,77 @@ def test_executable_replacing_scopes_and_default_key():
     }
     assert e.use("a", "a", replace=ReplacingScope.GLOBAL).run({"a": [{"f": 0}], "b": 1}) == {
         "a": [{"f": 1}],
-    }
\ No newline at end of file
+    }
+
+def test_executable_executor_batch():
+    class MyBatchExecutable(MyExecutable):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: List[int] = []
+
+        def invoke_batch(self, input_data: List[MyIO], evaluator: Evaluator) -> List[Dict[str, Any]]:
+            self.batches.append(len(input_data))
+            return [{"f": i.f + 1} for i in input_data]
+
+    e = MyBatchExecutable()
+    inputs = {"a": [{"f": i, "b": i} for i in range(10)]}
+
+    res = e.use("a", "a", batch_size=4).run(copy.deepcopy(inputs))
+    assert res["a"] == [{"f": i + 1, "b": i} for i in range(10)]
+    assert e.batches == [4, 4, 2]
+
+    # batching is opt-in
+    assert e.use("a", "a").run(copy.deepcopy(inputs)) == res
+    assert e.batches == [4, 4, 2]
+
+    assert MyExecutable().use("a", batch_size=3).run(inputs)["output"] == res["a"]
+
+
+def test_executable_validation_modes():
+    class MyStrExecutable(MyExecutable):
+        def invoke(self, input_data: MyIO, evaluator: Evaluator) -> Dict[str, Any]:
+            return {"f": str(input_data.f), "extra": 1}
+
+    e = MyStrExecutable()
+    assert e.run({"f": "1"}) == {"f": 1}
+
+    e.set_validation_mode(ValidationMode.INPUT_ONLY)
+    assert e.run({"f": "1"}) == {"f": "1"}
+
+    e.set_validation_mode(ValidationMode.TRUST)
+    assert e.run({"f": 1.5}) == {"f": "1.5"}
+
+    e.set_validation_mode(ValidationMode.SAMPLED, 2)
+    assert [e.run({"f": 1})["f"] for _ in range(4)] == [1, "1", 1, "1"]
+
+    # executable mode has priority over evaluator mode
+    e.set_validation_mode(None)
+    assert Evaluator(e, validation_mode=ValidationMode.TRUST).run({"f": 1}) == {"f": "1"}
+    assert Evaluator(
+        MyStrExecutable().set_validation_mode(ValidationMode.FULL),
+        validation_mode=ValidationMode.TRUST,
+    ).run({"f": 1}) == {"f": 1}
+
+
+def test_executable_validation_modes_output():
+    class MyNestedIO(IOModel):
+        items: List[MyIO]
+        g: int=0
+
+    class MyNestedExecutable(MyExecutable):
+        def __init__(self) -> None:
+            super().__init__(output_class=MyNestedIO) # type: ignore
+
+        def invoke(self, input_data: MyIO, evaluator: Evaluator) -> Dict[str, Any]:
+            return {"items": [MyIO(f=input_data.f)], "extra": 1}
+
+    # output is converted the same way in every mode
+    for mode in ValidationMode:
+        e = MyNestedExecutable().set_validation_mode(mode)
+        assert e.run({"f": 1}) == {"f": 1, "items": [{"f": 1}], "g": 0}
+        assert ExecutionSchema(e).compile().run({"f": 1}) == {"f": 1, "items": [{"f": 1}], "g": 0}
+
+    e = MyExecutable().set_validation_mode(ValidationMode.SAMPLED, 2)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: e.run({"f": 1}), range(1000)))
+    assert next(e._executions) == 1000 # type: ignore
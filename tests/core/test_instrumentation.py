@@ -0,0 +1,66 @@
+from typing import Any, Dict, List
+import json
+
+from .utils import MyExecutable
+from utca.core import (
+    Evaluator,
+    ExecuteFunction,
+    ForEach,
+    Instrument,
+    StageEvent,
+    Profiler,
+)
+
+def test_instruments():
+    class Recorder(Instrument):
+        def __init__(self) -> None:
+            self.started: List[str] = []
+            self.finished: List[str] = []
+
+        def on_start(self, event: StageEvent) -> None:
+            self.started.append(event.qualified_name)
+
+        def on_end(self, event: StageEvent) -> None:
+            self.finished.append(event.qualified_name)
+
+    recorder = Recorder()
+    schema = MyExecutable() | ForEach(
+        MyExecutable() | MyExecutable(), get_key="items", name="Items"
+    )
+    Evaluator(schema, instruments=[recorder]).run({
+        "f": 0, "items": [{"f": 0}, {"f": 1}]
+    })
+
+    assert recorder.started[0] == "Evaluator.MyExecutable"
+    assert recorder.finished[-1] == "Evaluator.Items"
+    assert recorder.finished.count("Evaluator.Items.MyExecutable") == 4
+    assert sorted(recorder.started) == sorted(recorder.finished)
+
+
+def test_profiler(tmp_path: Any):
+    def fail(input_data: Dict[str, Any]) -> Dict[str, Any]:
+        raise ValueError("Failed")
+
+    profiler = Profiler(measure_size=True)
+    evaluator = Evaluator(
+        MyExecutable() | ExecuteFunction(fail), 
+        fast_exit=False, 
+        instruments=[profiler],
+    )
+    for i in range(10):
+        evaluator.run({"f": i})
+
+    summary = profiler.summary()
+    assert summary["Evaluator.MyExecutable"]["count"] == 10
+    assert summary["Evaluator.ExecuteFunction.fail"]["errors"] == 10
+    stats = summary["Evaluator.MyExecutable"]
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    assert "Evaluator.MyExecutable" in profiler.format_summary()
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(str(path))
+    with open(path) as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == 20
+    assert trace["traceEvents"][0]["ph"] == "X"
+    assert trace["traceEvents"][0]["args"]["output_size"] > 0
@@ -1,3 +1,9 @@
+from typing import List
+import time
+import threading
+
+import numpy as np
+
 from utca.core import (
     Evaluator,
     GetMemory,
@@ -6,6 +12,10 @@ from utca.core import (
     MemoryGetInstruction,
     MemorySetInstruction,
     MemoryManager,
+    DictBackend,
+    DirectoryBackend,
+    MemorySerializer,
+    SQLiteBackend,
 )
 
 def test_get_memory():
@@ -65,4 +75,108 @@ def test_delete_memory():
     assert res.get("other") is None
     assert res["data"] == "OK"
     assert m.memory.memory.get("test1") is None
-    assert m.memory.memory.get("test2") is None
\ No newline at end of file
+    assert m.memory.memory.get("test2") is None
+
+
+def test_memory_backends(tmp_path):
+    state = {"messages": ["Hi"], "embedding": np.arange(6, dtype=np.float32)}
+    backends = [
+        DictBackend(),
+        DirectoryBackend(str(tmp_path / "pkl"), MemorySerializer.PICKLE, mmap_mode="r"),
+        SQLiteBackend(str(tmp_path / "memory.db")),
+    ]
+    for backend in backends:
+        m = MemoryManager(backend=backend)
+        Evaluator(schema=SetMemory("state"), memory_manager=m).run(state)
+        m.flush()
+        res = Evaluator(
+            schema=GetMemory([("state", "restored")]), memory_manager=m
+        ).run()
+        assert res["restored"]["messages"] == ["Hi"]
+        assert np.array_equal(res["restored"]["embedding"], state["embedding"])
+        # state is replaced
+        m.memory.add_store("state", {"messages": []})
+        assert backend.get("state") == {"messages": []}
+        m.delete("state")
+        assert "state" not in backend and len(backend) == 0
+
+    # replaced arrays are removed after concurrent readers finish
+    backend = DirectoryBackend(str(tmp_path / "arrays"), MemorySerializer.PICKLE)
+    backend.set("state", np.zeros(100))
+
+    errors: List[BaseException] = []
+
+    def read() -> None:
+        try:
+            for _ in range(200):
+                value = backend.get("state")
+                assert (value == value[0]).all()
+        except BaseException as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for t in readers:
+        t.start()
+    for i in range(200):
+        backend.set("state", np.full(100, i))
+    for t in readers:
+        t.join()
+    assert not errors
+    assert len(backend._arrays_versions("state")) == 1 # type: ignore
+
+    directory = DirectoryBackend(str(tmp_path / "json"))
+    MemoryManager(initial_data={}, backend=directory).memory.add_store("test", [1])
+    assert MemoryManager(str(tmp_path / "json")).memory.retrieve_store("test") == [1]
+
+
+def test_bounded_memory():
+    spill = DictBackend()
+    m = MemoryManager(max_entries=2, spill=spill)
+    for i in range(4):
+        m.memory.add_store(f"k{i}", i)
+    assert list(m.memory.memory) == ["k2", "k3"]
+    assert spill.data == {"k0": 0, "k1": 1}
+    # spilled entry is moved back and least recently used one is spilled
+    assert m.memory.retrieve_store("k0") == 0
+    assert list(m.memory.memory) == ["k3", "k0"] and "k0" not in spill
+    assert m.stats["entries"] == 2 and m.stats["evictions"] == 3
+    m.flush()
+    assert len(spill) == 0
+
+    m = MemoryManager(max_bytes=10_000)
+    for i in range(100):
+        m.memory.add_store(f"k{i}", "x" * 1000)
+    assert 5 < m.stats["entries"] < 10 and m.stats["bytes"] <= 10_000
+
+    m = MemoryManager(initial_data={"old": 1}, ttl=0.05)
+    time.sleep(0.1)
+    m.memory.add_store("new", 2)
+    assert list(m.memory.memory) == ["new"] and m.stats["expirations"] == 1
+
+
+def test_write_behind_memory(tmp_path):
+    backend = DirectoryBackend(str(tmp_path))
+    m = MemoryManager(backend=backend, write_behind=True, sync_interval=60)
+    for i in range(100):
+        m.memory.add_store("counter", i)
+    m.memory.add_store("deleted", 1)
+    m.delete("deleted")
+    assert m.stats["pending"] == 2 and "counter" not in backend
+    # pending changes are visible before they are written
+    m.memory.memory.clear()
+    assert m.memory.retrieve_store("counter") == 99
+    m.sync()
+    assert m.stats["pending"] == 0
+    assert backend.get("counter") == 99 and "deleted" not in backend
+
+    # state is copied when set, later in-place changes aren't written
+    state = {"messages": ["Hi"]}
+    m.memory.add_store("state", state)
+    state["messages"].append("Bye")
+    m.sync()
+    assert backend.get("state") == {"messages": ["Hi"]}
+
+    m.memory.add_store("counter", 100)
+    m.close()
+    assert backend.get("counter") == 100
+    assert not [f for f in tmp_path.iterdir() if f.name.startswith(".tmp-")]
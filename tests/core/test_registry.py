@@ -0,0 +1,107 @@
+from typing import Any, Dict, Optional, Type
+
+from utca.core import (
+    IOModel,
+    Config,
+    Evaluator,
+    Predictor,
+    LazyPredictor,
+    PredictorRegistry,
+)
+
+class RegistryInput(IOModel):
+    value: int
+
+
+class RegistryOutput(IOModel):
+    value: int
+
+
+class RegistryConfig(Config):
+    shift: int=1
+
+
+class MyPredictor(Predictor[RegistryInput, RegistryOutput]):
+    created = 0
+
+    def __init__(
+        self,
+        cfg: RegistryConfig=RegistryConfig(),
+        input_class: Type[RegistryInput]=RegistryInput,
+        output_class: Type[RegistryOutput]=RegistryOutput,
+    ):
+        super().__init__(input_class, output_class)
+        MyPredictor.created += 1
+        self.cfg = cfg
+
+
+    def invoke(self, input_data: RegistryInput, evaluator: Evaluator) -> Dict[str, Any]:
+        return {"value": input_data.value + self.cfg.shift}
+
+
+    @property
+    def config(self) -> Any:
+        return self.cfg
+
+
+class OptionalConfigPredictor(MyPredictor):
+    def __init__(
+        self,
+        cfg: Optional[RegistryConfig]=None,
+        input_class: Type[RegistryInput]=RegistryInput,
+        output_class: Type[RegistryOutput]=RegistryOutput,
+    ):
+        super().__init__(cfg or RegistryConfig(), input_class, output_class)
+
+
+    @classmethod
+    def default_arguments(cls) -> Dict[str, Any]:
+        return {"cfg": RegistryConfig()}
+
+
+def test_registry_shares_predictors():
+    registry = PredictorRegistry()
+    first = MyPredictor.shared(RegistryConfig(shift=2), registry=registry)
+    second = MyPredictor.shared(RegistryConfig(shift=2), registry=registry)
+    other = MyPredictor.shared(RegistryConfig(shift=3), registry=registry)
+
+    assert first is second
+    assert first is not other
+    assert len(registry) == 2
+    assert first.run({"value": 1})["value"] == 3
+
+    registry.release(first)
+    assert MyPredictor.shared(RegistryConfig(shift=2), registry=registry) is not first
+
+
+def test_lazy_predictor():
+    registry = PredictorRegistry()
+    created = MyPredictor.created
+    predictor = MyPredictor.shared(lazy=True, registry=registry)
+
+    assert isinstance(predictor, LazyPredictor)
+    assert MyPredictor.created == created
+    assert registry.report() == [{
+        "name": "MyPredictor", "class": "MyPredictor", "loaded": False, "model_bytes": 0,
+    }]
+
+    assert predictor.run({"value": 1})["value"] == 2
+    assert MyPredictor.created == created + 1
+    assert registry.report()[0]["loaded"]
+
+
+def test_registry_normalizes_arguments():
+    registry = PredictorRegistry()
+    predictor = MyPredictor.shared(registry=registry)
+    assert MyPredictor.shared(RegistryConfig(), registry=registry) is predictor
+    assert MyPredictor.shared(cfg=RegistryConfig(shift=1), registry=registry) is predictor
+    assert MyPredictor.shared(
+        RegistryConfig(), RegistryInput, registry=registry
+    ) is predictor
+
+    predictor = OptionalConfigPredictor.shared(registry=registry)
+    assert OptionalConfigPredictor.shared(RegistryConfig(), registry=registry) is predictor
+    assert OptionalConfigPredictor.shared(
+        RegistryConfig(shift=2), registry=registry
+    ) is not predictor
+    assert len(registry) == 3
@@ -12,12 +12,19 @@ from utca.core import (
     Condition, 
     ExecuteFunction,
     ForEach,
+    ForEachMode,
+    ItemErrorPolicy,
     Branch,
     Switch,
     Filter,
     Log,
     BREAK,
+    ExecutionSchema,
+    GetMemory,
+    SetMemory,
+    MemoryManager,
 )
+from utca.core.executable_level_1.utils import approximate_size
 
 def test_pipeline():
     example = MyExecutable()
@@ -296,4 +303,141 @@ def test_log_inside_evaluator():
     res = stream.getvalue()
     assert "OK" in res
     assert "ERROR" not in res
-    assert "NICE" in res
\ No newline at end of file
+    assert "NICE" in res
+
+def test_for_each_modes():
+    def f(x: Dict[str, Any]) -> Dict[str, Any]:
+        if x["f"] == 3:
+            raise ValueError("Failed item")
+        return {"f": x["f"] * 2}
+
+    inputs = {
+        "fs": [
+            {"f": i} for i in range(10)
+        ]
+    }
+    example = MyExecutable()
+
+    for mode in ForEachMode:
+        res = ForEach(
+            schema=example,
+            get_key="fs",
+            set_key="results",
+            mode=mode,
+            max_workers=4,
+        ).run(copy.deepcopy(inputs))
+        assert [r["f"] for r in res["results"]] == [i + 1 for i in range(10)]
+
+    res = ForEach(
+        schema=example,
+        get_key="fs",
+        mode=ForEachMode.THREAD,
+        ordered=False,
+    ).run(copy.deepcopy(inputs))
+    assert sorted(r["f"] for r in res["fs"]) == [i + 1 for i in range(10)]
+
+    for mode in (ForEachMode.SEQUENTIAL, ForEachMode.THREAD, ForEachMode.ASYNCIO):
+        res = ForEach(
+            schema=ExecuteFunction(f),
+            get_key="fs",
+            mode=mode,
+            on_error=ItemErrorPolicy.SKIP,
+        ).run(copy.deepcopy(inputs))
+        assert [r["f"] for r in res["fs"]] == [i * 2 for i in range(10) if i != 3]
+
+        res = ForEach(
+            schema=ExecuteFunction(f),
+            get_key="fs",
+            mode=mode,
+            on_error=ItemErrorPolicy.KEEP_INPUT,
+        ).run(copy.deepcopy(inputs))
+        assert [r["f"] for r in res["fs"]] == [i if i == 3 else i * 2 for i in range(10)]
+
+        try:
+            ForEach(
+                schema=ExecuteFunction(f),
+                get_key="fs",
+                mode=mode,
+            ).run(copy.deepcopy(inputs))
+            raise AssertionError("Should throw error!")
+        except AssertionError as e:
+            raise e
+        except Exception as e:
+            logging.info(e)
+
+
+def test_transformable_fork():
+    state = Transformable({"a": 1, "b": 2, "e": 5})
+    fork = state.fork()
+    fork.a = 10
+    fork.c = 3
+    del fork.b
+    state.d = 4
+    state.e = 6
+    state.update({"a": 0})
+
+    assert state.extract() == {"a": 0, "b": 2, "d": 4, "e": 6}
+    assert fork.get("d") is None and fork.e == 5
+    assert fork.extract() == {"a": 10, "c": 3, "e": 5}
+    assert copy.copy(state).extract() == {"a": 0, "b": 2, "d": 4, "e": 6}
+
+    # executables and actions read forks without merging
+    fork = Transformable({"f": 0, "h": 1}).fork()
+    assert MyExecutable()(fork)["f"] == 1
+    assert ExecuteFunction(lambda x: {"g": x["f"] + x["h"]})(fork)["g"] == 2
+    assert approximate_size(fork) > 0
+    assert fork.__dict__ == {"f": 1, "g": 2}
+    assert dict(fork.view()) == {"f": 1, "g": 2, "h": 1}
+
+    item = {"f": 1}
+    view = Transformable.overlay(item)
+    view.f = 2
+    assert view["f"] == 2
+    assert item == {"f": 1}
+
+    def f(x: Dict[str, Any]) -> Dict[str, Any]:
+        x["f"] = 0
+        return x
+
+    branch = Branch(
+        ExecuteFunction(lambda x: {"g": x["f"]}),
+        condition=Condition(
+            validator=lambda x, e: x["f"] == 0, # type: ignore
+            schema=ExecuteFunction(f),
+        ),
+    )
+    inputs = {"fs": [{"f": 1}]}
+    res = ForEach(schema=branch, get_key="fs").run(copy.deepcopy(inputs))
+    assert res["fs"] == [{"f": 1, "g": 1}]
+
+
+def test_child_evaluator():
+    schema = ForEach(
+        ExecutionSchema(SetMemory("item", "f")) | GetMemory(["item"], {"item": None}),
+        get_key="items",
+    )
+    m = MemoryManager()
+    evaluator = Evaluator(schema, memory_manager=m, name="parent")
+    res = evaluator.run({"items": [{"f": 1}, {"f": 2}]})
+    # each child has its own memory
+    assert [i["item"] for i in res["items"]] == [1, 2]
+    assert "item" not in m.memory.memory
+
+    evaluator = Evaluator(schema, memory_manager=m, inherit_memory=True, name="parent")
+    evaluator.run({"items": [{"f": 1}, {"f": 2}]})
+    assert m.memory.memory["item"] == 2
+
+    child = evaluator.create_child(schema, "child")
+    assert child.name == "parent.child" and child.logger.name == "parent.child"
+    assert child.logger.parent is evaluator.logger and not child.logger.handlers
+    assert child.memory_manager is m and evaluator.schema is schema
+    assert len(logging.getLogger("parent").handlers) == 1
+
+    class MyEvaluator(Evaluator):
+        pass
+
+    evaluator = MyEvaluator(schema, name="parent")
+    evaluator.extra = 1
+    child = evaluator.create_child(schema, "child")
+    assert type(child) is MyEvaluator and child.extra == 1
+    assert child.memory_manager is not evaluator.memory_manager
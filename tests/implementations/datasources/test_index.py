@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+
+from utca.implementation.datasources.index import (
+    FaissIndex, IndexConfig, IndexMetric, IndexType, NumpyIndex, create_index
+)
+
+def recall(indexes, expected):
+    return np.mean([
+        len(set(i) & set(e)) / len(e) for i, e in zip(indexes, expected)
+    ])
+
+
+def test_numpy_index():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((500, 16)).astype(np.float32)
+    queries = rng.standard_normal((5, 16)).astype(np.float32)
+    for metric in IndexMetric:
+        index = NumpyIndex(16, IndexConfig(metric=metric))
+        index.add(vectors[:200])
+        index.add(vectors[200:])
+        distances, indexes = index.search(queries, 3)
+        if metric == IndexMetric.L2:
+            expected = ((queries[:, None] - vectors[None]) ** 2).sum(-1)
+        else:
+            expected = -queries @ vectors.T
+        assert np.array_equal(indexes, np.argsort(expected, axis=1)[:, :3])
+        assert np.allclose(
+            np.abs(distances), np.abs(np.sort(expected, axis=1)[:, :3]), rtol=1e-4
+        )
+
+    distances, indexes = NumpyIndex(16).search(queries, 2)
+    assert (indexes == -1).all()
+    assert isinstance(create_index(16, IndexConfig(use_faiss=False)), NumpyIndex)
+
+
+def test_approximate_indexes():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((5000, 32)).astype(np.float32)
+    queries = vectors[:20] + 0.01
+    exact = NumpyIndex(32)
+    exact.add(vectors)
+    _, expected = exact.search(queries, 10)
+    for index_type in (IndexType.IVF_FLAT, IndexType.IVF_PQ, IndexType.HNSW):
+        config = IndexConfig(
+            index_type=index_type, nlist=32, nprobe=8, pq_m=8, train_size=2000
+        )
+        index = create_index(32, config)
+        index.add(vectors[:1000])
+        index.add(vectors[1000:])
+        assert index.ntotal == 5000
+        _, indexes = index.search(queries, 10)
+        assert indexes[:, 0].tolist() == list(range(20))
+        assert recall(indexes, expected) > 0.3
+
+    index = create_index(32, IndexConfig(metric=IndexMetric.INNER_PRODUCT, normalize=True))
+    index.add(vectors * 3)
+    similarities, indexes = index.search(vectors[:5], 1)
+    assert indexes[:, 0].tolist() == list(range(5))
+    assert np.allclose(similarities, 1, atol=1e-5)
+
+
+def test_empty_and_small_indexes():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((2000, 16)).astype(np.float32)
+    for index_type in IndexType:
+        index = create_index(16, IndexConfig(index_type=index_type, pq_m=4))
+        _, indexes = index.search(vectors[:2], 3)
+        assert (indexes == -1).all()
+
+    pytest.importorskip("faiss")
+    index = FaissIndex(16, IndexConfig(index_type=IndexType.IVF_FLAT))
+    with pytest.warns(UserWarning, match="not enough"):
+        index.add(vectors)
+        index.search(vectors[:2], 3)
+    assert index.config.nlist == 2000 // 39
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+import torch
+
+from utca.implementation.predictors.utils import (
+    collate, split, values_equal
+)
+
+def test_collate():
+    items = [
+        {"input_ids": torch.ones((1, 3)), "labels": ["a", "b"], "mask": np.ones((1, 2))},
+        {"input_ids": torch.zeros((2, 3)), "labels": ["a", "b"], "mask": np.ones((2, 2))},
+    ]
+    batch = collate(items)
+    assert batch["input_ids"].shape == (3, 3) and batch["mask"].shape == (3, 2)
+    assert batch["labels"] == ["a", "b"]
+    assert [i["input_ids"].shape for i in split(batch, [1, 2])] == [(1, 3), (2, 3)]
+
+    # comparison of values that contain tensors or arrays doesn't raise other errors
+    for values in (
+        [[torch.ones(2)], [torch.zeros(2)]],
+        [np.ones((1, 2)), np.ones((1, 3))],
+        [torch.ones(2), [1, 1]],
+        [{"a": [np.ones(2)]}, {"a": [np.zeros(2)]}],
+        [torch.ones(()), torch.ones(())],
+    ):
+        with pytest.raises(ValueError):
+            collate([{"x": v} for v in values])
+    with pytest.raises(ValueError):
+        collate([{"x": 1}, {"y": 1}])
+
+    assert values_equal([torch.ones(2), {"a": np.ones(2)}], [torch.ones(2), {"a": np.ones(2)}])
+    assert not values_equal(torch.ones(2), torch.ones(3))
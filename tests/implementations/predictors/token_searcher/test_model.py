@@ -1,7 +1,94 @@
+import io
+
+import numpy as np
+import pytest
+import torch
+from tokenizers import ( # type: ignore
+    Tokenizer, decoders, models, pre_tokenizers, trainers
+)
+from transformers import ( # type: ignore
+    BertConfig, BertForTokenClassification, DebertaV2TokenizerFast, PreTrainedTokenizerFast
+)
+
 from utca.implementation.predictors import (
-    TokenSearcherPredictor
+    TokenSearcherPredictor,
+    TokenSearcherONNXPredictorConfig,
+)
+from utca.implementation.predictors.token_searcher.token_searcher_pipeline import (
+    AggregationStrategy, TokenClassificationPipeline
 )
 
+CORPUS = [
+    "Identify entities in the text having the following classes:",
+    "Paul Hammond is a neurologist at Johns Hopkins University.",
+    "The National Aeronautics and Space Administration is an agency.",
+    "Text: person organization city",
+] * 20
+
+SPECIAL_TOKENS = ["[PAD]", "[CLS]", "[SEP]", "[UNK]"]
+
+def build_deberta_tokenizer(tmp_path):
+    spm = pytest.importorskip("sentencepiece")
+    model = io.BytesIO()
+    spm.SentencePieceTrainer.train(
+        sentence_iterator=iter(CORPUS), model_writer=model, vocab_size=70,
+        pad_id=0, unk_id=1, bos_id=2, eos_id=3, pad_piece="[PAD]", unk_piece="[UNK]",
+        bos_piece="[CLS]", eos_piece="[SEP]", normalization_rule_name="nmt_nfkc",
+        minloglevel=2,
+    )
+    (tmp_path / "spm.model").write_bytes(model.getvalue())
+    return DebertaV2TokenizerFast(vocab_file=str(tmp_path / "spm.model"))
+
+
+def build_sentencepiece_tokenizer(tmp_path):
+    tokenizer = Tokenizer(models.Unigram())
+    tokenizer.pre_tokenizer = pre_tokenizers.Metaspace()
+    tokenizer.decoder = decoders.Metaspace()
+    tokenizer.train_from_iterator(CORPUS, trainers.UnigramTrainer(
+        vocab_size=200, special_tokens=SPECIAL_TOKENS, unk_token="[UNK]"
+    ))
+    return tokenizer
+
+
+def build_byte_level_tokenizer(tmp_path):
+    tokenizer = Tokenizer(models.BPE())
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = decoders.ByteLevel()
+    tokenizer.train_from_iterator(CORPUS, trainers.BpeTrainer(
+        vocab_size=300, special_tokens=SPECIAL_TOKENS, 
+        initial_alphabet=pre_tokenizers.ByteLevel.alphabet(),
+    ))
+    return tokenizer
+
+
+def build_wordpiece_tokenizer(tmp_path=None):
+    tokenizer = Tokenizer(models.WordPiece(unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.BertPreTokenizer()
+    tokenizer.train_from_iterator(CORPUS, trainers.WordPieceTrainer(
+        vocab_size=200, special_tokens=SPECIAL_TOKENS
+    ))
+    return tokenizer
+
+
+def build_pipeline(tokenizer, labels=("O", "B-ENT", "I-ENT")):
+    if isinstance(tokenizer, Tokenizer):
+        tokenizer = PreTrainedTokenizerFast(
+            tokenizer_object=tokenizer,
+            cls_token="[CLS]", sep_token="[SEP]", pad_token="[PAD]", unk_token="[UNK]",
+            model_max_length=512,
+        )
+    torch.manual_seed(0)
+    model = BertForTokenClassification(BertConfig(
+        vocab_size=len(tokenizer), hidden_size=32, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=37, num_labels=len(labels),
+        id2label=dict(enumerate(labels)),
+        label2id={label: i for i, label in enumerate(labels)},
+    )).eval()
+    return TokenClassificationPipeline(
+        model=model, tokenizer=tokenizer, framework="pt", aggregation_strategy="first"
+    )
+
+
 def test_tokensearcher():
     predictor = TokenSearcherPredictor()
     actual_ouput = predictor.run({
@@ -18,4 +105,125 @@ def test_tokensearcher():
     assert (
         expected_ouput["word"] 
         == actual_ouput["output"][0][0]["word"]
-    )
\ No newline at end of file
+    )
+
+def test_tokensearcher_shared_prefix():
+    predictor = TokenSearcherPredictor()
+    prompt = "Identify organizations mentioned in the text:"
+    text = (
+        " The National Aeronautics and Space Administration"
+        " (NASA) is an independent agency of the U.S. federal"
+        " government responsible for the civilian space program,"
+        " as well as aeronautics and space research."
+    )
+    expected_output = predictor.run({"inputs": [prompt + text]})
+    actual_output = predictor.run({"inputs": [(prompt, text)]})
+    assert (
+        [(e["start"], e["end"]) for e in expected_output["output"][0]]
+        == [(e["start"], e["end"]) for e in actual_output["output"][0]]
+    )
+
+
+@pytest.mark.parametrize(
+    "tokenizer_builder, supported", [
+        (build_deberta_tokenizer, True),
+        (build_byte_level_tokenizer, True),
+        (build_wordpiece_tokenizer, True),
+        # Metaspace without normalizer doesn't split words on new lines
+        (build_sentencepiece_tokenizer, False),
+    ]
+)
+@pytest.mark.parametrize(
+    "segments", [
+        ("\nIdentify entities in the text having the following classes:\nperson\nText:\n", 
+         "Paul Hammond is a neurologist at Johns Hopkins University."),
+        ("Identify organization: ", "The National Aeronautics and Space Administration "),
+        ("Who is Paul Hammond?\nText:\n", " Paul Hammond is a neurologist.  ", "Text: "),
+    ]
+)
+def test_tokensearcher_shared_prefix_tokenizers(tmp_path, tokenizer_builder, supported, segments):
+    pipeline = build_pipeline(tokenizer_builder(tmp_path))
+    assert pipeline.supports_segments(segments) == supported
+    text = "".join(segments)
+
+    if supported:
+        expected_inputs = next(pipeline.preprocess(text))
+        actual_inputs = pipeline.encode_segments(segments)
+        for key in ("input_ids", "offset_mapping", "special_tokens_mask"):
+            assert expected_inputs[key].tolist() == actual_inputs[key].tolist()
+        assert expected_inputs["word_ids"] == actual_inputs["word_ids"]
+
+    expected_output = pipeline([text])
+    actual_output = pipeline([segments])
+    assert [
+        (e["start"], e["end"], pytest.approx(e["score"])) for e in expected_output[0]
+    ] == [
+        (e["start"], e["end"], e["score"]) for e in actual_output[0]
+    ]
+
+
+def test_tokensearcher_only_ignored_labels():
+    pipeline = build_pipeline(build_wordpiece_tokenizer(), labels=("O", "B-PER", "B-ORG"))
+    # best labels of tokens are ignored, but average of ORG scores is the highest
+    logits = np.log(np.array([
+        [0.6, 0.0001, 0.3999],
+        [0.0001, 0.6, 0.3999],
+    ]))
+    mask = np.zeros(2, dtype=int)
+    for strategy in (AggregationStrategy.SIMPLE, AggregationStrategy.FIRST, AggregationStrategy.MAX):
+        assert pipeline.has_only_ignored_labels(logits, mask, strategy, ["O", "PER"])
+    assert not pipeline.has_only_ignored_labels(
+        logits, mask, AggregationStrategy.AVERAGE, ["O", "PER"]
+    )
+    assert not pipeline.has_only_ignored_labels(
+        logits, mask, AggregationStrategy.FIRST, ["O"]
+    )
+
+
+def test_tokensearcher_vectorized_postprocess():
+    predictor = TokenSearcherPredictor()
+    inputs = {"inputs": [(
+        "Identify organizations mentioned in the text:"
+        " The National Aeronautics and Space Administration"
+        " (NASA) is an independent agency of the U.S. federal"
+        " government responsible for the civilian space program,"
+        " as well as aeronautics and space research."
+    )]}
+    predictor.pipeline.vectorized_postprocess = False
+    expected_output = predictor.run(inputs)
+    predictor.pipeline.vectorized_postprocess = True
+    actual_output = predictor.run(inputs)
+    assert (
+        [(e["word"], e["start"], e["end"]) for e in expected_output["output"][0]]
+        == [(e["word"], e["start"], e["end"]) for e in actual_output["output"][0]]
+    )
+
+
+def test_tokensearcher_onnx(tmp_path):
+    pytest.importorskip("onnxruntime")
+    predictor = TokenSearcherPredictor(TokenSearcherONNXPredictorConfig(
+        onnx_path=str(tmp_path / "model.onnx")
+    ))
+    actual_ouput = predictor.run({
+        "inputs": [(
+            "Identify organizations mentioned in the text:"
+            " The National Aeronautics and Space Administration"
+            " (NASA) is an independent agency of the U.S. federal"
+            " government responsible for the civilian space program,"
+            " as well as aeronautics and space research."
+        )]
+    })
+    assert (
+        "NationalAeronauticsandSpaceAdministration"
+        == actual_ouput["output"][0][0]["word"]
+    )
+
+
+def test_tokensearcher_onnx_default_path():
+    config = TokenSearcherONNXPredictorConfig(opset=17)
+    path = config.default_onnx_path
+    assert path == TokenSearcherONNXPredictorConfig(opset=17).default_onnx_path
+    assert path != TokenSearcherONNXPredictorConfig(opset=18).default_onnx_path
+    assert "knowledgator--UTC-DeBERTa-small" in path
+    with pytest.raises(ValueError):
+        TokenSearcherONNXPredictorConfig(model=None).default_onnx_path
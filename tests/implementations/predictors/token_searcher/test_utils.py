@@ -0,0 +1,13 @@
+from utca.implementation.predictors.token_searcher.utils import (
+    build_entity, clean_span
+)
+
+def test_clean_span():
+    text = "Text: (NASA)."
+    assert clean_span(text, 6, 12) == ("NASA", 7, 11)
+    # one-character entity at the end of text
+    assert clean_span(text, len(text), len(text)) == ("", len(text), len(text))
+
+    entity = build_entity(text, {"start": 5, "end": 12, "score": 0.5}, 0.3, "org")
+    assert entity is not None and entity.span == "NASA"
+    assert build_entity(text, {"start": 5, "end": 12, "score": 0.1}, 0.3) is None
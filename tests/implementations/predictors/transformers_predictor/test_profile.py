@@ -0,0 +1,74 @@
+import pytest
+import torch
+from transformers import BertConfig, BertModel # type: ignore
+
+from utca.implementation.predictors.transformers_predictor.schema import (
+    GradMode,
+    InferenceProfile,
+    TransformersModelConfig,
+    TransformersEmbeddingInput,
+    TransformersEmbeddingOutput,
+)
+from utca.implementation.predictors.transformers_predictor.transformers_model import (
+    TransformersModel
+)
+
+def build_predictor(profile: InferenceProfile) -> TransformersModel:
+    torch.manual_seed(0)
+    model = BertModel(BertConfig(
+        vocab_size=100, hidden_size=32, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=37,
+    ))
+    return TransformersModel(
+        TransformersModelConfig(model=model, profile=profile),
+        input_class=TransformersEmbeddingInput,
+        output_class=TransformersEmbeddingOutput,
+    )
+
+
+def encodings():
+    return {"input_ids": torch.tensor([[1, 5, 7, 2]])}
+
+
+@pytest.mark.parametrize(
+    "grad_mode, requires_grad", [
+        (GradMode.ENABLED, True),
+        (GradMode.NO_GRAD, False),
+        (GradMode.INFERENCE, False),
+    ]
+)
+def test_grad_mode(grad_mode, requires_grad):
+    predictor = build_predictor(InferenceProfile(grad_mode=grad_mode))
+    output = predictor.run({"encodings": encodings()})["last_hidden_state"]
+    assert output.requires_grad == requires_grad
+    assert output.is_inference() == (grad_mode == GradMode.INFERENCE)
+
+
+def test_default_grad_mode():
+    predictor = build_predictor(InferenceProfile())
+    assert predictor.cfg.profile.grad_mode == GradMode.NO_GRAD
+    output = predictor.run({"encodings": encodings()})["last_hidden_state"]
+    assert not output.requires_grad
+
+
+def test_num_threads():
+    num_threads = torch.get_num_threads()
+    try:
+        build_predictor(InferenceProfile(num_threads=1))
+        assert torch.get_num_threads() == 1
+    finally:
+        torch.set_num_threads(num_threads)
+
+
+def test_autocast_on_cpu():
+    predictor = build_predictor(InferenceProfile(autocast_dtype=torch.bfloat16))
+    dtypes = []
+    layer = predictor.cfg.model.encoder.layer[0].intermediate.dense
+    layer.register_forward_hook(lambda module, inputs, output: dtypes.append(output.dtype))
+    predictor.run({"encodings": encodings()})
+    assert dtypes == [torch.bfloat16]
+
+    dtypes.clear()
+    predictor.cfg.profile = InferenceProfile()
+    predictor.run({"encodings": encodings()})
+    assert dtypes == [torch.float32]
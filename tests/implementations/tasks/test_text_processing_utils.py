@@ -0,0 +1,27 @@
+from utca.implementation.tasks.text_processing.utils import (
+    Chunker, RegexSentenceSplitter, stream_chunks
+)
+
+def test_regex_sentence_splitter():
+    text = " Dr. Smith met J. Doe, e.g. at noon! Did it work? yes.\n\nNew paragraph "
+    sentences = [text[s:e] for s, e in RegexSentenceSplitter()(text)]
+    assert sentences == [
+        "Dr. Smith met J. Doe, e.g. at noon!",
+        "Did it work? yes.",
+        "New paragraph",
+    ]
+
+
+def test_chunker_token_budget():
+    splitter = RegexSentenceSplitter()
+    text = " ".join(f"Sentence number {i} is here." for i in range(20))
+
+    chunks, starts = Chunker(None, max_tokens=12, sentence_splitter=splitter)(text)
+    assert all(len(c.split()) == 10 for c in chunks)
+    assert [text[s:s + len(c)] for s, c in zip(starts, chunks)] == chunks
+
+    chunker = Chunker(3, max_tokens=100, sentence_splitter=splitter)
+    chunks, starts = chunker(text)
+    assert len(chunks) == 7
+    pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+    assert list(stream_chunks(pieces, chunker=chunker)) == list(zip(starts, chunks))
@@ -1,6 +1,52 @@
+from typing import Any, Dict
+import re
+
+import pytest
+
+from utca.core import Evaluator, ExecutionSchema, Predictor
+from utca.implementation.predictors.token_searcher.schema import (
+    TokenSearcherPredictorInput, TokenSearcherPredictorOutput
+)
 from utca.implementation.tasks.text_processing.ner.token_searcher.token_searcher import (
     TokenSearcherNER
 )
+from utca.implementation.tasks.text_processing.ner.token_searcher.actions import (
+    TokenSearcherNERPreprocessor
+)
+from utca.implementation.tasks.text_processing.utils import (
+    Chunker, RegexSentenceSplitter
+)
+
+TEXT = "Dr. Paul Hammond, a renowned neurologist at Johns Hopkins University, has recently published a paper in the prestigious journal \"Nature Neuroscience\". \nHis research focuses on a rare genetic mutation, found in less than 0.01% of the population, that appears to prevent the development of Alzheimer's disease. Collaborating with researchers at the University of California, San Francisco, the team is now working to understand the mechanism by which this mutation confers its protective effect. \nFunded by the National Institutes of Health, their research could potentially open new avenues for Alzheimer's treatment."
+
+class CapitalizedWordsPredictor(
+    Predictor[TokenSearcherPredictorInput, TokenSearcherPredictorOutput]
+):
+    """
+    Finds capitalized words in texts after prompts
+    """
+    def __init__(self):
+        super().__init__(TokenSearcherPredictorInput, TokenSearcherPredictorOutput)
+
+
+    def invoke(
+        self, input_data: TokenSearcherPredictorInput, evaluator: Evaluator
+    ) -> Dict[str, Any]:
+        output = []
+        for text in input_data.inputs:
+            text = "".join(text)
+            start = text.index("Text:\n") + len("Text:\n")
+            output.append([
+                {"start": m.start(), "end": m.end(), "score": 1 / len(m.group())}
+                for m in re.finditer(r"[A-Z]\w+", text) if m.start() >= start
+            ])
+        return {"output": output}
+
+
+    @property
+    def config(self) -> Any:
+        return None
+
 
 def test_ner():
     task = TokenSearcherNER()
@@ -13,4 +59,45 @@ def test_ner():
         ],
     })
     assert len(res["output"]) == 4
-    assert res["output"][0]["span"] == "Paul Hammond"
\ No newline at end of file
+    assert res["output"][0]["span"] == "Paul Hammond"
+
+
+def test_ner_stream():
+    task = TokenSearcherNER()
+    text = "Dr. Paul Hammond, a renowned neurologist at Johns Hopkins University, has recently published a paper in the prestigious journal \"Nature Neuroscience\". \nHis research focuses on a rare genetic mutation, found in less than 0.01% of the population, that appears to prevent the development of Alzheimer's disease. Collaborating with researchers at the University of California, San Francisco, the team is now working to understand the mechanism by which this mutation confers its protective effect. \nFunded by the National Institutes of Health, their research could potentially open new avenues for Alzheimer's treatment."
+    labels = [
+        "scientist",
+        "university",
+        "city"
+    ]
+    expected = task.run({"text": text, "labels": labels})["output"]
+    lines = text.splitlines(keepends=True)
+    entities = list(task.stream(iter(lines), labels))
+    assert len(entities) == len(expected)
+    for entity in entities:
+        assert text[entity["start"]:entity["end"]] == entity["span"]
+
+
+def test_ner_stream_offline():
+    chunker = Chunker(sents_batch=1, sentence_splitter=RegexSentenceSplitter())
+    task = TokenSearcherNER(
+        predictor=CapitalizedWordsPredictor(),
+        preprocess=TokenSearcherNERPreprocessor(chunker=chunker),
+    )
+    labels = ["scientist", "university"]
+    expected = task.run({"text": TEXT, "labels": labels})["output"]
+    assert expected
+
+    lines = TEXT.splitlines(keepends=True)
+    entities = list(task.stream(iter(lines), labels, chunks_batch=2))
+    # run orders entities by labels, stream by chunks
+    key = lambda e: (e["start"], e["end"], e["entity"])
+    assert sorted(entities, key=key) == sorted(expected, key=key)
+
+    task = TokenSearcherNER(
+        predictor=task.predictor,
+        preprocess=ExecutionSchema(TokenSearcherNERPreprocessor(chunker=chunker)),
+    )
+    with pytest.raises(ValueError):
+        list(task.stream(TEXT, labels))
+    assert list(task.stream(TEXT, labels, chunker=chunker))